@@ -1,15 +1,97 @@
+import numpy as np
 import pandas as pd
 # import pandas_ta as ta  # 삭제 (설치 오류 방지)
-import FinanceDataReader as fdr
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import threading
+import os
 import re
+import time
+from utils.cache import RunCache
+from utils.http_client import get_client
+from utils.html_parser import parse_response
+from utils.ohlcv_store import OHLCVStore
+from utils import indicators
+from utils.pipeline import Pipeline
+from utils.profiler import get_profiler, timed
+
+# FinanceDataReader 는 import 가 무거우므로(차트용 plotly 등) 처음 다운로드할 때 불러옴 (재생 실행에서는 불러오지 않음)
+def _fdr_data_reader(symbol, start=None, end=None):
+    import FinanceDataReader as fdr
+    return fdr.DataReader(symbol, start, end)
+
+def _fdr_stock_listing(market):
+    import FinanceDataReader as fdr
+    return fdr.StockListing(market)
 
 class DataAnalyst:
-    def __init__(self):
+    def __init__(self, max_workers=8, per_host_limit=4, http=None, fixtures=None):
         print("데이터 분석기 초기화 중...")
+        # 후보 종목 병렬 분석 설정 (max_workers=1 이면 기존 순차 처리)
+        self.max_workers = max(1, int(max_workers))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+        # 공용 HTTP 클라이언트 (커넥션 풀, 타임아웃, 재시도)
+        self.http = http or get_client()
+        # 실행 단위 캐시 (종목 메인 페이지 스냅샷)
+        self._item_pages = RunCache()
+        # 네이버 모바일 통합 API 응답 캐시 (NAVER_API_CACHE_DIR 지정 시 TTL 동안 실행 간 재사용, 기록·재생 시에는 미사용)
+        self._integrations = RunCache(
+            persist_dir=None if fixtures else os.getenv("NAVER_API_CACHE_DIR"),
+            ttl=int(os.getenv("NAVER_API_CACHE_TTL", 600))
+        )
+        # FinanceDataReader 소스 (fixtures: utils.replay.FixtureBundle 지정 시 기록/재생 경유)
+        self._data_reader = fixtures.data_reader(_fdr_data_reader) if fixtures else _fdr_data_reader
+        self._stock_listing = fixtures.stock_listing(_fdr_stock_listing) if fixtures else _fdr_stock_listing
+        # 일봉 로컬 저장소 (OHLCV_CACHE_DIR, 기본 .cache/ohlcv / 기록·재생 시에는 번들 전용 임시 폴더)
+        self.prices = OHLCVStore(cache_dir=fixtures.store_dir if fixtures else None, fetcher=self._fetch_prices)
+        profiler = get_profiler()
+        profiler.register_cache('item_pages', self._item_pages)
+        profiler.register_cache('naver_integration', self._integrations)
+        profiler.register_cache('ohlcv', self.prices)
+        # analyze_technical 이 계산한 종목별 프레임 (MA 포함, 실행 단위)
+        self.frames = {}
+        self._sector_trends = {} # top_n -> 섹터 목록
+        # 유니버스 스크리닝 통과 종목 (부록용 행, 실행 단위) 및 KRX 종목명
+        self.screened = []
+        self.universe_names = {}
+        # KRX 상장 목록 (종목 코드/이름은 하루 중 거의 바뀌지 않으므로 상주 실행 시 KRX_LISTING_TTL 초 동안 재사용)
+        self._krx_listing = None
+        self.listing_ttl = int(os.getenv("KRX_LISTING_TTL", 6 * 3600))
+        # 마지막 run() 의 단계별 실행 그래프 (소요 시간 조회용)
+        self.pipeline = None
+
+    def reset_run(self):
+        """실행 단위 상태 초기화 - 시세가 담긴 캐시(종목 페이지/통합 API/분석 프레임)만 비우고
+        HTTP 커넥션 풀, 일봉 저장소(자체 갱신 주기), KRX 상장 목록은 다음 실행에 그대로 재사용"""
+        self.frames = {}
+        self._sector_trends = {}
+        self.screened = []
+        self._item_pages.clear()
+        self._integrations.clear()
+
+    def _host_slot(self, host):
+        """호스트별 동시 요청 수 제한용 세마포어"""
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _get(self, url, **kwargs):
+        """호스트별 동시 접속 한도를 지키는 GET 요청"""
+        with self._host_slot(urlparse(url).netloc):
+            return self.http.get(url, **kwargs)
+
+    def _fetch_prices(self, symbol, start=None, end=None):
+        """FinanceDataReader 가격 이력 다운로드 (동시 호출 수 제한)"""
+        with self._host_slot("FinanceDataReader"), timed("fdr.DataReader"):
+            return self._data_reader(symbol, start, end)
+
+    def _read_prices(self, symbol, start=None, end=None):
+        """로컬 OHLCV 저장소 경유 가격 이력 조회 (부족한 최근 구간만 다운로드)"""
+        return self.prices.history(symbol, start, end)
 
     def get_index_history(self, index_code="KS11", days=60):
         """코스피/코스닥 등의 지수 이력 수집 (차트용)"""
@@ -17,7 +99,7 @@ class DataAnalyst:
         try:
             end_date = datetime.now().strftime("%Y-%m-%d")
             start_date = (datetime.now() - timedelta(days=days*2)).strftime("%Y-%m-%d")
-            df = fdr.DataReader(index_code, start_date, end_date)
+            df = self._read_prices(index_code, start_date, end_date)
             return df.tail(days)
         except Exception as e:
             print(f"지수 이력 수집 오류 ({index_code}): {e}")
@@ -29,21 +111,35 @@ class DataAnalyst:
         try:
             end_date = datetime.now().strftime("%Y-%m-%d")
             start_date = (datetime.now() - timedelta(days=days*2)).strftime("%Y-%m-%d")
-            df = fdr.DataReader(ticker, start_date, end_date)
+            df = self._read_prices(ticker, start_date, end_date)
             return df.tail(days)
         except Exception as e:
             print(f"종목 이력 수집 오류 ({ticker}): {e}")
             return pd.DataFrame()
 
+    def get_chart_frame(self, ticker, days=120):
+        """차트용 일봉 - analyze_technical 에서 받아둔 프레임(MA 포함)이 있으면 재사용"""
+        df = self.frames.get(ticker)
+        if df is not None and len(df) >= days:
+            return df.tail(days)
+        return self.get_stock_history(ticker, days=days)
+
+    def get_sparkline(self, ticker, days=120):
+        """부록 스파크라인용 최근 종가 배열 - 스크리닝 때 받아둔 로컬 일봉에서 읽음 (실패 시 빈 배열)"""
+        try:
+            df = self._read_prices(ticker, (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d"))
+            return df['Close'].to_numpy(dtype='float64')[-days:]
+        except Exception:
+            return np.array([])
+
     def get_market_briefing(self):
         """코스피/코스닥 상세 시황 수집 (종가, 등락, 거래대금)"""
         print("시장 브리핑 수집 중...")
         url = "https://finance.naver.com/sise/"
-        headers = {'User-Agent': 'Mozilla/5.0'}
         briefing = {"kospi": {}, "kosdaq": {}}
         try:
-            res = requests.get(url, headers=headers)
-            soup = BeautifulSoup(res.text, 'html.parser')
+            res = self._get(url)
+            soup = parse_response(res, page='market_index')
             
             # 코스피
             kospi_area = soup.select_one("#KOSPI_now")
@@ -73,17 +169,20 @@ class DataAnalyst:
             
         return briefing
 
-    def get_sector_trends(self):
-        """주요 섹터별 등락율 수집 (당일, 5일, 20일)"""
+    def get_sector_trends(self, top_n=10):
+        """주요 섹터별 등락율 수집 (당일, 5일, 20일) - 실행 단위로 top_n 별 캐시
+        (상세 조회 대상이 top_n 에 따라 달라지므로 큰 결과를 잘라 쓰지 않는다)"""
+        if top_n in self._sector_trends:
+            return self._sector_trends[top_n]
         print("섹터별 시계열 동향 분석 중...")
         url = "https://finance.naver.com/sise/sise_group.naver?type=upjong"
-        headers = {'User-Agent': 'Mozilla/5.0'}
         sectors = []
         try:
-            res = requests.get(url, headers=headers)
-            soup = BeautifulSoup(res.text, 'html.parser')
+            res = self._get(url)
+            soup = parse_response(res, page='sector_list')
             rows = soup.select("table.type_5 tr")
             
+            entries = []
             for row in rows:
                 cols = row.select("td")
                 if len(cols) < 4: continue
@@ -91,87 +190,105 @@ class DataAnalyst:
                 name_tag = cols[0].select_one("a")
                 if not name_tag: continue
                 
-                name = name_tag.get_text().strip()
                 change_str = cols[1].get_text().strip()
-                
-                try:
-                    detail_url = "https://finance.naver.com" + name_tag['href']
-                    detail_res = requests.get(detail_url, headers=headers)
-                    detail_soup = BeautifulSoup(detail_res.text, 'html.parser')
-                    
-                    stock_names = []
-                    name_tags = detail_soup.select("td.name a")
-                    for s_tag in name_tags[:5]:
-                        stock_names.append(s_tag.get_text().strip())
-                    top_stocks_str = ", ".join(stock_names)
-                    
-                    f_net_total = 0
-                    i_net_total = 0
-                    
-                    rows_detail = detail_soup.select("table.type_5 tr")
-                    count = 0
-                    for r_detail in rows_detail:
-                        cols_s = r_detail.select("td")
-                        if len(cols_s) < 12: continue
-                        try:
-                            f_val = cols_s[10].get_text().strip().replace(",", "")
-                            i_val = cols_s[11].get_text().strip().replace(",", "")
-                            if f_val and f_val != "0": f_net_total += int(f_val)
-                            if i_val and i_val != "0": i_net_total += int(i_val)
-                            count += 1
-                        except: continue
-                        if count >= 5: break
-
-                    rep_ticker = name_tags[0]['href'].split('=')[-1] if name_tags else ""
-                    
-                    if rep_ticker:
-                        end_date = datetime.now().strftime("%Y-%m-%d")
-                        start_date = (datetime.now() - timedelta(days=40)).strftime("%Y-%m-%d")
-                        df = fdr.DataReader(rep_ticker, start_date, end_date)
-                        
-                        if len(df) < 20: continue
-                        
-                        curr_price = df['Close'].iloc[-1]
-                        price_5d = df['Close'].iloc[-6] if len(df) >= 6 else df['Close'].iloc[0]
-                        price_20d = df['Close'].iloc[-21] if len(df) >= 21 else df['Close'].iloc[0]
-                        
-                        ret_5d = ((curr_price - price_5d) / price_5d) * 100
-                        ret_20d = ((curr_price - price_20d) / price_20d) * 100
-                    else:
-                        ret_5d, ret_20d = 0, 0
-                    
-                    rate_today = float(change_str.replace("%", "").replace("+", "").replace("-", ""))
-                    if rate_today > 1.5: weather = "☀️"
-                    elif rate_today >= 0: weather = "☁️"
-                    else: weather = "🌧️"
-                    
-                    sectors.append({
-                        "name": name,
-                        "rate": change_str,
-                        "ret_5d": f"{ret_5d:+.1f}%",
-                        "ret_20d": f"{ret_20d:+.1f}%",
-                        "weather": weather,
-                        "score": rate_today,
-                        "rep_ticker": rep_ticker,
-                        "top_stocks": top_stocks_str,
-                        "f_net": f_net_total,
-                        "i_net": i_net_total,
-                        "p_net": -(f_net_total + i_net_total)
-                    })
-                except:
-                    continue
+                try: rate_today = float(change_str.replace("%", "").replace("+", "").replace("-", ""))
+                except ValueError: continue
+                entries.append((name_tag.get_text().strip(), change_str, rate_today, name_tag['href']))
+
+            # 당일 등락율 순으로 상위 섹터만 상세 조회 (상세 조회 실패분은 다음 순위로 채움)
+            entries.sort(key=lambda x: x[2], reverse=True)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for i in range(0, len(entries), top_n):
+                    batch = entries[i:i + top_n]
+                    sectors.extend(s for s in pool.map(self._sector_detail, batch) if s)
+                    if len(sectors) >= top_n: break
         except Exception as e:
             print(f"섹터 분석 오류: {e}")
             
         sectors.sort(key=lambda x: x['score'], reverse=True)
-        return sectors[:10]
+        self._sector_trends[top_n] = sectors[:top_n]
+        return self._sector_trends[top_n]
+
+    def _sector_detail(self, entry):
+        """섹터 상세 페이지(구성 종목/수급) 및 대표 종목 수익률 수집 (실패 시 None)"""
+        name, change_str, rate_today, href = entry
+        try:
+            detail_url = "https://finance.naver.com" + href
+            detail_res = self._get(detail_url)
+            detail_soup = parse_response(detail_res, page='sector_detail')
+            
+            stock_names = []
+            name_tags = detail_soup.select("td.name a")
+            for s_tag in name_tags[:5]:
+                stock_names.append(s_tag.get_text().strip())
+            top_stocks_str = ", ".join(stock_names)
+            
+            f_net_total = 0
+            i_net_total = 0
+            
+            rows_detail = detail_soup.select("table.type_5 tr")
+            count = 0
+            for r_detail in rows_detail:
+                cols_s = r_detail.select("td")
+                if len(cols_s) < 12: continue
+                try:
+                    f_val = cols_s[10].get_text().strip().replace(",", "")
+                    i_val = cols_s[11].get_text().strip().replace(",", "")
+                    if f_val and f_val != "0": f_net_total += int(f_val)
+                    if i_val and i_val != "0": i_net_total += int(i_val)
+                    count += 1
+                except: continue
+                if count >= 5: break
+
+            rep_ticker = name_tags[0]['href'].split('=')[-1] if name_tags else ""
+            
+            if rep_ticker:
+                end_date = datetime.now().strftime("%Y-%m-%d")
+                start_date = (datetime.now() - timedelta(days=40)).strftime("%Y-%m-%d")
+                df = self._read_prices(rep_ticker, start_date, end_date)
+                
+                if len(df) < 20: return None
+                
+                curr_price = df['Close'].iloc[-1]
+                price_5d = df['Close'].iloc[-6] if len(df) >= 6 else df['Close'].iloc[0]
+                price_20d = df['Close'].iloc[-21] if len(df) >= 21 else df['Close'].iloc[0]
+                
+                ret_5d = ((curr_price - price_5d) / price_5d) * 100
+                ret_20d = ((curr_price - price_20d) / price_20d) * 100
+            else:
+                ret_5d, ret_20d = 0, 0
+            
+            if rate_today > 1.5: weather = "☀️"
+            elif rate_today >= 0: weather = "☁️"
+            else: weather = "🌧️"
+            
+            return {
+                "name": name,
+                "rate": change_str,
+                "ret_5d": f"{ret_5d:+.1f}%",
+                "ret_20d": f"{ret_20d:+.1f}%",
+                "weather": weather,
+                "score": rate_today,
+                "rep_ticker": rep_ticker,
+                "top_stocks": top_stocks_str,
+                "f_net": f_net_total,
+                "i_net": i_net_total,
+                "p_net": -(f_net_total + i_net_total)
+            }
+        except:
+            return None
+
+    def get_integration(self, ticker):
+        """네이버 모바일 통합 API 응답 (dealTrendInfos, etfCuInfos 등) - 종목당 1회만 요청"""
+        def load():
+            res = self._get(f"https://m.stock.naver.com/api/stock/{ticker}/integration")
+            return res.json()
+        return self._integrations.get_or_load(ticker, load)
 
     def get_etf_holdings(self, ticker):
         """ETF 주요 구성 종목(TOP 5) 수집"""
         try:
-            api_url = f"https://m.stock.naver.com/api/stock/{ticker}/integration"
-            api_res = requests.get(api_url, headers={'User-Agent': 'Mozilla/5.0'})
-            api_data = api_res.json()
+            api_data = self.get_integration(ticker)
             
             holdings = []
             cu_infos = api_data.get('etfCuInfos', [])
@@ -189,8 +306,10 @@ class DataAnalyst:
         indices = {"NASDAQ": "IXIC", "S&P500": "US500", "SOXX": "SOXX"}
         global_status = {}
         try:
+            # 최근 2거래일 종가만 사용하므로 전체 이력 대신 최근 한 달만 조회
+            start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
             for name, symbol in indices.items():
-                df = fdr.DataReader(symbol)
+                df = self._read_prices(symbol, start_date)
                 if len(df) >= 2:
                     current = df['Close'].iloc[-1]
                     prev = df['Close'].iloc[-2]
@@ -205,7 +324,8 @@ class DataAnalyst:
         """ETF 당일 등락율 상위 10종목 수집"""
         print("ETF 시장 동향 분석 중...")
         try:
-            df_etf = fdr.StockListing('ETF/KR')
+            with timed("fdr.StockListing"):
+                df_etf = self._stock_listing('ETF/KR')
             if 'ChgRate' in df_etf.columns:
                 df_etf = df_etf.sort_values(by='ChgRate', ascending=False)
             
@@ -214,7 +334,7 @@ class DataAnalyst:
             for item in top_etfs:
                 ticker = item['Symbol']
                 try:
-                    df_hist = fdr.DataReader(ticker, (datetime.now() - timedelta(days=40)).strftime("%Y-%m-%d"))
+                    df_hist = self._read_prices(ticker, (datetime.now() - timedelta(days=40)).strftime("%Y-%m-%d"))
                     if len(df_hist) < 2: continue
                     
                     curr_price = df_hist['Close'].iloc[-1]
@@ -243,8 +363,8 @@ class DataAnalyst:
         url = "https://finance.naver.com/news/mainnews.naver"
         market_news = []
         try:
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
+            res = self._get(url)
+            soup = parse_response(res, page='main_news')
             news_titles = soup.select(".articleSubject a")
             for title in news_titles[:5]:
                 market_news.append(title.get_text().strip())
@@ -255,31 +375,95 @@ class DataAnalyst:
         """반도체 종목 수집"""
         url = "https://finance.naver.com/sise/sise_group_detail.naver?type=upjong&no=278"
         try:
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
+            res = self._get(url)
+            soup = parse_response(res, page='sector_detail')
             links = soup.select('div.name_area a')
             return [link['href'].split('=')[-1] for link in links]
         except: return []
 
-    def get_market_rankings(self):
-        """거래량 상위 종목 수집"""
-        tickers = self.get_semiconductor_tickers()
+    def get_market_rankings(self, semi_tickers=None):
+        """거래량 상위 종목 수집 (semi_tickers: 이미 받아둔 반도체 종목 목록이 있으면 재사용)"""
+        tickers = list(semi_tickers) if semi_tickers is not None else self.get_semiconductor_tickers()
         for sosok in [0, 1]:
             url = f"https://finance.naver.com/sise/sise_quant.naver?sosok={sosok}"
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
+            res = self._get(url)
+            soup = parse_response(res, page='volume_rank')
             links = soup.select('a.tltle')
             for link in links[:20]:
                 tickers.append(link['href'].split('=')[-1])
         return list(dict.fromkeys(tickers))
 
-    def get_financial_trend(self, ticker):
-        """재무 데이터 수집"""
-        url = f"https://finance.naver.com/item/main.naver?code={ticker}"
+    def get_krx_universe(self):
+        """KRX(코스피+코스닥) 전체 상장 종목 코드"""
+        if self._krx_listing is None or time.time() - self._krx_listing[0] > self.listing_ttl:
+            with timed("fdr.StockListing"):
+                self._krx_listing = (time.time(), self._stock_listing('KRX'))
+        listing = self._krx_listing[1]
+        if 'Market' in listing.columns:
+            listing = listing[listing['Market'].astype(str).str.startswith(('KOSPI', 'KOSDAQ'))] # 'KOSDAQ GLOBAL' 포함, KONEX 제외
+        if 'Name' in listing.columns:
+            self.universe_names = dict(zip(listing['Code'], listing['Name']))
+        return listing['Code'].tolist()
+
+    def screen_universe(self, tickers=None, limit=200):
+        """전 종목 기술적 조건 일괄 스크리닝 (종목 x 일자 패널 벡터 연산)
+
+        analyze_technical 과 같은 조건(정배열/돌파/눌림목/추세강도/OBV 상승)을 한 번에 계산하고,
+        조건을 하나 이상 만족하는 종목만 기술 점수 순으로 최대 limit 개 반환한다.
+        통과 종목 전체의 요약 행(종가/등락률/RSI/기술 점수)은 self.screened 에 남긴다 (보고서 부록용).
+        """
+        tickers = list(tickers) if tickers is not None else self.get_krx_universe()
+        print(f"유니버스 스크리닝 중 ({len(tickers)}종목)...")
+        start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+
+        def load(ticker):
+            try: return self._read_prices(ticker, start_date)
+            except Exception: return None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            frames = list(pool.map(load, tickers))
+
+        valid = [(t, df) for t, df in zip(tickers, frames) if df is not None and len(df) >= 120]
+        if not valid: return []
+        # 최근 일자를 오른쪽 끝에 맞춘 패널 구성 (이력이 짧은 종목은 앞쪽이 NaN)
+        width = max(len(df) for _, df in valid)
+        panel = {}
+        for col in ('High', 'Low', 'Close', 'Volume'):
+            arr = np.full((len(valid), width), np.nan)
+            for i, (_, df) in enumerate(valid):
+                arr[i, width - len(df):] = df[col].to_numpy(dtype='float64')
+            panel[col] = arr
+
+        ind = indicators.compute_indicators(panel['High'], panel['Low'], panel['Close'], panel['Volume'])
+        sig = indicators.last_bar_signals(panel['Close'], panel['Volume'], ind)
+        passed = (sig['change_rate'] > -2) & (sig['is_perfect'] | sig['is_breakout'] | sig['is_pullback'] | sig['strong_trend'] | sig['is_obv_rising'])
+        tech_score = sig['is_perfect'] * 4 + sig['strong_trend'] * 3 + sig['is_breakout'] * 3 + sig['is_pullback'] * 2 + sig['is_obv_rising'] * 2
+
+        survivors = [(tech_score[i], i) for i in np.flatnonzero(passed)]
+        survivors.sort(key=lambda x: x[0], reverse=True)
+        self.screened = [{
+            'rank': rank + 1, 'ticker': valid[i][0], 'name': self.universe_names.get(valid[i][0], valid[i][0]),
+            'close': int(sig['close'][i]), 'change_rate': float(sig['change_rate'][i]),
+            'rsi': float(sig['rsi'][i]), 'tech_score': int(score)
+        } for rank, (score, i) in enumerate(survivors)]
+        result = [valid[i][0] for _, i in survivors[:limit]]
+        print(f"스크리닝 통과: {int(passed.sum())}종목 (상세 분석 대상 {len(result)}종목)")
+        return result
+
+    def get_item_snapshot(self, ticker):
+        """종목 메인 페이지(item/main.naver) 스냅샷 - 종목당 1회만 다운로드/파싱 (실패 시 None)"""
+        return self._item_pages.get_or_load(ticker, lambda: self._load_item_snapshot(ticker))
+
+    def _load_item_snapshot(self, ticker):
+        try:
+            res = self._get(f"https://finance.naver.com/item/main.naver?code={ticker}")
+            soup = parse_response(res, page='item_main')
+        except: return None
+        return self._parse_item_page(soup)
+
+    def _parse_item_page(self, soup):
+        """종목 메인 페이지에서 재무/PBR·PER·ROE/시가총액/종목명/기업개요 추출"""
         f_data = {'is_growing': False, 'profits': [], 'pbr': 0.0, 'roe': 0.0, 'per': 0.0, 'target_price': 0}
         try:
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
             section = soup.select_one(".section.cop_analysis")
             if section:
                 for row in section.select("tr"):
@@ -301,14 +485,30 @@ class DataAnalyst:
             target_tag = soup.select_one("em#_target_money")
             if target_tag: f_data['target_price'] = int(target_tag.get_text().strip().replace(",", ""))
         except: pass
+
+        cap = soup.select_one("#_market_sum")
+        name_tag = soup.select_one('.wrap_company h2 a')
+        summary_tag = soup.select_one(".summary_info")
+        return {
+            'financials': f_data,
+            'market_cap': cap.get_text().strip().replace("\t", "").replace("\n", "") + "억원" if cap else "정보없음",
+            'name': name_tag.get_text() if name_tag else None,
+            'summary': summary_tag.get_text().strip().replace("\n", " ") if summary_tag else "핵심 기술력과 시장 지배력을 바탕으로 지속적인 성장이 기대되는 기업입니다."
+        }
+
+    def get_financial_trend(self, ticker):
+        """재무 데이터 수집"""
+        snapshot = self.get_item_snapshot(ticker)
+        if not snapshot:
+            return {'is_growing': False, 'profits': [], 'pbr': 0.0, 'roe': 0.0, 'per': 0.0, 'target_price': 0}
+        f_data = dict(snapshot['financials'])
+        f_data['profits'] = list(f_data['profits'])
         return f_data
 
     def get_investor_trend(self, ticker):
         """수급 데이터 수집"""
-        url = f"https://m.stock.naver.com/api/stock/{ticker}/integration"
         try:
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            data = res.json()
+            data = self.get_integration(ticker)
             f_net, i_net, p_net, f_cont, i_cont = 0, 0, 0, 0, 0
             trends = data.get('dealTrendInfos', [])
             for count, item in enumerate(trends):
@@ -326,8 +526,8 @@ class DataAnalyst:
         """뉴스 수집"""
         url = f"https://finance.naver.com/item/news_news.naver?code={ticker}"
         try:
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
+            res = self._get(url)
+            soup = parse_response(res, page='item_news')
             news_items = []
             titles = soup.select('.title a')
             infos = soup.select('.info')
@@ -338,126 +538,109 @@ class DataAnalyst:
 
     def get_company_summary(self, ticker):
         """기업 개요 수집"""
-        url = f"https://finance.naver.com/item/main.naver?code={ticker}"
-        try:
-            res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
-            summary_tag = soup.select_one(".summary_info")
-            if summary_tag: return summary_tag.get_text().strip().replace("\n", " ")
-            return "핵심 기술력과 시장 지배력을 바탕으로 지속적인 성장이 기대되는 기업입니다."
-        except: return ""
+        snapshot = self.get_item_snapshot(ticker)
+        return snapshot['summary'] if snapshot else ""
 
     def calculate_obv(self, df):
         """OBV(On-Balance Volume) 계산"""
         try:
-            obv = [0]
-            for i in range(1, len(df)):
-                if df['Close'].iloc[i] > df['Close'].iloc[i-1]: obv.append(obv[-1] + df['Volume'].iloc[i])
-                elif df['Close'].iloc[i] < df['Close'].iloc[i-1]: obv.append(obv[-1] - df['Volume'].iloc[i])
-                else: obv.append(obv[-1])
-            return obv
+            return indicators.obv(df['Close'].to_numpy(dtype='float64'), df['Volume'].to_numpy()).tolist()
         except: return []
 
     def analyze_technical(self, ticker):
         """기술적 분석 매뉴얼 계산 (RSI, ADX, OBV)"""
         try:
-            df = fdr.DataReader(ticker, (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d"))
+            df = self._read_prices(ticker, (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d"))
             if len(df) < 120: return None
-            
-            df['MA5'] = df['Close'].rolling(window=5).mean()
-            df['MA20'] = df['Close'].rolling(window=20).mean()
-            df['MA60'] = df['Close'].rolling(window=60).mean()
-            df['MA120'] = df['Close'].rolling(window=120).mean()
-            df['V_MA20'] = df['Volume'].rolling(window=20).mean()
-
-            delta = df['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            df['RSI'] = 100 - (100 / (1 + (gain / loss)))
-
-            tr = pd.concat([df['High']-df['Low'], (df['High']-df['Close'].shift()).abs(), (df['Low']-df['Close'].shift()).abs()], axis=1).max(axis=1)
-            atr = tr.rolling(window=14).mean()
-            up, down = df['High'].diff(), df['Low'].shift() - df['Low']
-            pdm = (up.where((up > down) & (up > 0), 0)).rolling(window=14).mean()
-            mdm = (down.where((down > up) & (down > 0), 0)).rolling(window=14).mean()
-            pdi, mdi = 100 * (pdm / atr), 100 * (mdm / atr)
-            dx = 100 * (pdi - mdi).abs() / (pdi + mdi)
-            adx_val = dx.rolling(window=14).mean().iloc[-1] if not dx.empty else 0
-            
-            obv = self.calculate_obv(df)
-            is_obv_rising = all(x < y for x, y in zip(obv[-5:], obv[-4:])) if len(obv) >= 5 else False
 
-            last, prev = df.iloc[-1], df.iloc[-2]
+            ind = indicators.compute_indicators(df['High'], df['Low'], df['Close'], df['Volume'])
+            for col in ('MA5', 'MA20', 'MA60', 'MA120', 'V_MA20', 'RSI'):
+                df[col] = ind[col]
+            # 차트 단계에서 재다운로드/재계산하지 않도록 분석 프레임 보관
+            self.frames[ticker] = df
+
+            sig = indicators.last_bar_signals(df['Close'], df['Volume'], ind)
             return {
-                'ticker': ticker, 'close': int(last['Close']), 'change_rate': ((last['Close']-prev['Close'])/prev['Close'])*100,
-                'rsi': last['RSI'] if isinstance(last['RSI'], float) else last['RSI'].iloc[-1] if hasattr(last['RSI'], 'iloc') else last['RSI'],
-                'adx': adx_val, 'is_perfect': last['MA5'] > last['MA20'] > last['MA60'] > last['MA120'],
-                'is_breakout': last['Close'] > prev['Close'] and last['Volume'] > last['V_MA20'] * 2,
-                'is_pullback': last['Close'] <= prev['Close'] and last['Volume'] < last['V_MA20'] * 0.5,
-                'strong_trend': adx_val > 25, 'volume': last['Volume'], 'v_ma20': last['V_MA20'], 'is_obv_rising': is_obv_rising
+                'ticker': ticker, 'close': int(sig['close']), 'change_rate': float(sig['change_rate']),
+                'rsi': float(sig['rsi']), 'adx': float(sig['adx']), 'is_perfect': bool(sig['is_perfect']),
+                'is_breakout': bool(sig['is_breakout']), 'is_pullback': bool(sig['is_pullback']),
+                'strong_trend': bool(sig['strong_trend']), 'volume': float(sig['volume']), 'v_ma20': float(sig['v_ma20']),
+                'is_obv_rising': bool(sig['is_obv_rising'])
             }
         except: return None
 
     def get_market_cap(self, ticker):
         """시가총액 수집"""
-        try:
-            res = requests.get(f"https://finance.naver.com/item/main.naver?code={ticker}", headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
-            cap = soup.select_one("#_market_sum")
-            return cap.get_text().strip().replace("\t", "").replace("\n", "") + "억원" if cap else "정보없음"
-        except: return "정보없음"
+        snapshot = self.get_item_snapshot(ticker)
+        return snapshot['market_cap'] if snapshot else "정보없음"
 
     def get_stock_name(self, ticker):
         """종목명 수집"""
-        try:
-            res = requests.get(f"https://finance.naver.com/item/main.naver?code={ticker}", headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(res.text, 'html.parser')
-            return soup.select_one('.wrap_company h2 a').get_text()
-        except: return ticker
+        snapshot = self.get_item_snapshot(ticker)
+        return snapshot['name'] if snapshot and snapshot['name'] else ticker
 
-    def run(self, mode='afternoon'):
-        print(f"--- {mode.capitalize()} Mode 가동 ---")
-        market_news = self.get_top_market_news()
-        global_status = self.get_global_market_status() if mode == 'morning' else {}
-        market_briefing = self.get_market_briefing()
-            
-        sector_trends = self.get_sector_trends()
-        etf_trends = self.get_etf_trends()
-        candidate_tickers = self.get_market_rankings()
+    def _enrich_candidate(self, ticker, semi_tickers):
+        """후보 종목 1개의 재무/기술/수급 데이터 수집 및 스코어링 (필터 탈락 시 None)"""
+        f_data = self.get_financial_trend(ticker)
+        if not f_data['is_growing']: return None
+        tech = self.analyze_technical(ticker)
+        if not tech: return None
+        f_net, i_net, p_net, f_cont, i_cont = self.get_investor_trend(ticker)
         
-        results = []
-        semi_tickers = self.get_semiconductor_tickers()
-
-        for ticker in candidate_tickers:
-            f_data = self.get_financial_trend(ticker)
-            if not f_data['is_growing']: continue
-            tech = self.analyze_technical(ticker)
-            if not tech: continue
-            f_net, i_net, p_net, f_cont, i_cont = self.get_investor_trend(ticker)
-            
-            tech.update({
-                'name': self.get_stock_name(ticker), 'market_cap': self.get_market_cap(ticker),
-                'profits': f_data['profits'], 'pbr': f_data['pbr'], 'roe': f_data['roe'],
-                'per': f_data['per'], 'target_price_analyst': f_data['target_price'],
-                'f_net': f_net, 'i_net': i_net, 'p_net': p_net, 'f_cont': f_cont, 'i_cont': i_cont,
-                'summary': self.get_company_summary(ticker), 'news': self.get_news(ticker),
-                'is_semi': ticker in semi_tickers
-            })
-            
-            score = (f_cont * 1.5) + (i_cont * 1.5)
-            if tech['is_perfect']: score += 4
-            if tech['strong_trend']: score += 3
-            if tech['is_breakout']: score += 3
-            if tech['is_semi']: score += 5
-            if f_net > 0 and i_net > 0: score += 3
-            tech['score'] = score
-            
-            if (f_cont >= 3 or i_cont >= 3) or tech['is_breakout']:
-                if tech['change_rate'] > -2: results.append(tech)
-            time.sleep(0.05)
-            
+        tech.update({
+            'name': self.get_stock_name(ticker), 'market_cap': self.get_market_cap(ticker),
+            'profits': f_data['profits'], 'pbr': f_data['pbr'], 'roe': f_data['roe'],
+            'per': f_data['per'], 'target_price_analyst': f_data['target_price'],
+            'f_net': f_net, 'i_net': i_net, 'p_net': p_net, 'f_cont': f_cont, 'i_cont': i_cont,
+            'summary': self.get_company_summary(ticker), 'news': self.get_news(ticker),
+            'is_semi': ticker in semi_tickers
+        })
+        
+        score = (f_cont * 1.5) + (i_cont * 1.5)
+        if tech['is_perfect']: score += 4
+        if tech['strong_trend']: score += 3
+        if tech['is_breakout']: score += 3
+        if tech['is_semi']: score += 5
+        if f_net > 0 and i_net > 0: score += 3
+        tech['score'] = score
+        
+        if (f_cont >= 3 or i_cont >= 3) or tech['is_breakout']:
+            if tech['change_rate'] > -2: return tech
+        return None
+
+    def enrich_candidates(self, tickers, semi_tickers):
+        """후보 종목 병렬 분석 (결과는 입력 순서 유지, 탈락 종목은 None)"""
+        tickers = list(tickers)
+        if self.max_workers == 1 or len(tickers) <= 1:
+            return [self._enrich_candidate(t, semi_tickers) for t in tickers]
+        print(f"후보 {len(tickers)}종목 병렬 분석 중 (workers={self.max_workers}, host limit={self.per_host_limit})...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(lambda t: self._enrich_candidate(t, semi_tickers), tickers))
+
+    def run(self, mode='afternoon', universe=False, screen_limit=200):
+        print(f"--- {mode.capitalize()} Mode 가동 ---")
+        self.reset_run()
+
+        # 서로 독립적인 수집 단계는 동시에, 후보 분석은 후보 목록/반도체 종목이 준비되는 즉시 시작
+        # (max_workers=1 이면 기존 순서대로 순차 실행)
+        pipe = Pipeline("analyst", max_workers=self.max_workers)
+        pipe.add('market_news', self.get_top_market_news)
+        pipe.add('global_status', lambda: self.get_global_market_status() if mode == 'morning' else {})
+        pipe.add('market_briefing', self.get_market_briefing)
+        pipe.add('sectors', self.get_sector_trends)
+        pipe.add('etf_trends', self.get_etf_trends)
+        pipe.add('semi_tickers', self.get_semiconductor_tickers)
+        # universe=True: 거래량 상위 대신 KRX 전 종목을 기술적 조건으로 먼저 거른 뒤 상세 분석
+        pipe.add('candidates', lambda semi_tickers: self.screen_universe(limit=screen_limit) if universe else self.get_market_rankings(semi_tickers),
+                 deps=['semi_tickers'])
+        pipe.add('results', lambda candidates, semi_tickers: [r for r in self.enrich_candidates(candidates, semi_tickers) if r],
+                 deps=['candidates', 'semi_tickers'])
+        self.pipeline = pipe
+        stages = pipe.run()
+
+        results = stages['results']
         results.sort(key=lambda x: x['score'], reverse=True)
-        return {"picks": results[:10], "market_briefing": market_briefing, "market_news": market_news, "sectors": sector_trends, "etf_trends": etf_trends, "global_status": global_status, "mode": mode}
+        return {"picks": results[:10], "market_briefing": stages['market_briefing'], "market_news": stages['market_news'], "sectors": stages['sectors'], "etf_trends": stages['etf_trends'], "global_status": stages['global_status'], "mode": mode, "screened": self.screened}
 
 if __name__ == "__main__":
     analyst = DataAnalyst()
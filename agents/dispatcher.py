@@ -1,14 +1,41 @@
 import os
-import requests
 from dotenv import load_dotenv
+from utils.http_client import get_client
+from utils.profiler import timed
 
 load_dotenv()
 
+# 텔레그램 메시지 길이 제한(4096자) 대응
+MAX_MESSAGE_LENGTH = 4000
+
+def split_message(content, limit=MAX_MESSAGE_LENGTH):
+    """메시지를 줄 단위로 limit 자 이하 파트로 분할
+
+    Markdown 강조(*...*, _..._)는 to_telegram 에서 한 줄 안에서만 열고 닫으므로 줄 경계에서 자르면 깨지지 않는다.
+    한 줄이 limit 보다 길 때만 그 줄을 공백 위치(없으면 limit 위치)에서 나눈다.
+    """
+    parts, current = [], ""
+    for line in content.split("\n"):
+        while len(line) > limit:
+            cut = line.rfind(" ", 0, limit) + 1 or limit
+            if current: parts.append(current)
+            parts.append(line[:cut].rstrip())
+            current, line = "", line[cut:]
+        if current and len(current) + 1 + len(line) > limit:
+            parts.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current.strip(): parts.append(current)
+    return parts
+
 class Dispatcher:
     def __init__(self):
         self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID")
+        self.http = get_client()
 
+    @timed("telegram.send_document")
     def send_telegram_document(self, file_path, caption=""):
         """텔레그램 문서(PDF) 발송"""
         if not self.bot_token or not self.chat_id:
@@ -25,7 +52,7 @@ class Dispatcher:
                     'caption': caption,
                     'parse_mode': 'Markdown'
                 }
-                response = requests.post(url, data=data, files=files)
+                response = self.http.post(url, data=data, files=files, timeout=(5, 60)) # 업로드는 읽기 타임아웃을 길게
                 
                 if response.status_code == 200:
                     print(f"텔레그램 문서 발송 성공: {os.path.basename(file_path)}")
@@ -37,6 +64,7 @@ class Dispatcher:
             print(f"텔레그램 문서 발송 중 에러 발생: {e}")
             return False
 
+    @timed("telegram.send_message")
     def send_telegram_message(self, content):
         """텔레그램 메시지 발송 (길이 제한 대응을 위해 분할 발송)"""
         if not self.bot_token or not self.chat_id:
@@ -45,9 +73,7 @@ class Dispatcher:
 
         url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
         
-        # 텔레그램 메시지 길이 제한(4096자) 대응
-        MAX_LENGTH = 4000
-        parts = [content[i:i+MAX_LENGTH] for i in range(0, len(content), MAX_LENGTH)]
+        parts = split_message(content)
         
         success = True
         for part in parts:
@@ -57,7 +83,7 @@ class Dispatcher:
                 'parse_mode': 'Markdown' 
             }
             try:
-                response = requests.post(url, data=payload)
+                response = self.http.post(url, data=payload)
                 if response.status_code != 200:
                     print(f"텔레그램 발송 실패: {response.text}")
                     success = False
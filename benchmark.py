@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# 픽스처 번들(main.py --record 로 기록) 기반 종단간 벤치마크
+#   python benchmark.py <번들> [--mode afternoon] [--repeat 3] [--baseline bench_baseline.json] [--save-baseline]
+# 매 회 main.py --replay 를 새 프로세스로 실행(네트워크 미사용)하고, 실행 프로파일(JSON)에서 에이전트별 소요 시간을 모아 중앙값을 낸다.
+# --baseline 과 비교해 threshold 이상 느려진 지표가 있으면 종료 코드 1 (배포 전 성능 회귀 확인용)
+# 실제 기록 번들이 없으면 python -m utils.synthetic_bundle <번들> 로 합성 번들을 만들어 사용 (CI: .github/workflows/checks.yml)
+#
+# 시작 시간 점검: python benchmark.py --startup [--budget-ms 100]
+# python -X importtime 으로 main 모듈 import 시간을 재고, 예산 초과 또는 무거운 라이브러리가 시작 시점에 불러와지면 종료 코드 1
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# 해당 단계에서만 불러와야 하는 라이브러리 (main import 시점에 있으면 실패)
+LAZY_MODULES = ('pandas', 'numpy', 'matplotlib', 'FinanceDataReader', 'fpdf', 'bs4', 'lxml', 'requests', 'markdown', 'schedule')
+
+def _node_ms(profile, pipeline, node):
+    return profile.get('stages', {}).get(pipeline, {}).get('nodes', {}).get(node, {}).get('ms', 0.0)
+
+def _calls_ms(profile, prefix):
+    return sum(s['total_ms'] for name, s in profile.get('calls', {}).items() if name.startswith(prefix))
+
+def metrics(profile, total_ms):
+    """실행 프로파일 -> 벤치마크 지표 (ms, RSS 는 MB)"""
+    result = {
+        'total': total_ms,
+        'run': profile.get('wall_ms', 0.0),
+        'agent.analyst': _node_ms(profile, 'main', 'analysis'),
+        'agent.strategist': _node_ms(profile, 'main', 'picks'),
+        'agent.editor': _node_ms(profile, 'main', 'report'),
+        'charts.index': _node_ms(profile, 'main', 'index_charts'),
+        'charts.picks': _node_ms(profile, 'main', 'charts'),
+        'agent.dispatcher': _calls_ms(profile, 'telegram.'),
+    }
+    for name, s in profile.get('calls', {}).items():
+        if name.startswith('output.'):
+            result[name] = s['total_ms']
+    for name, t in profile.get('stages', {}).get('analyst', {}).get('nodes', {}).items():
+        result[f"analyst.{name}"] = t['ms']
+    if profile.get('peak_rss_mb') is not None:
+        result['peak_rss_mb'] = profile['peak_rss_mb']
+    return result
+
+def run_once(bundle, mode, formats, warm_dir=None):
+    """main.py --replay 1회 실행 -> (지표, 성공 여부)"""
+    with tempfile.TemporaryDirectory(prefix="bench_") as out_dir:
+        profile_path = os.path.join(out_dir, "profile.json")
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        # 기본은 매 회 빈 차트 캐시 (콜드 실행), --warm 이면 반복 간 공유
+        env['CHART_CACHE_DIR'] = warm_dir or os.path.join(out_dir, "charts")
+        env.pop('NAVER_API_CACHE_DIR', None)
+        cmd = [sys.executable, os.path.join(ROOT, "main.py"), "--mode", mode, "--replay", bundle,
+               "--formats", formats, "--output-dir", out_dir, "--profile", profile_path]
+        start = time.perf_counter()
+        proc = subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, text=True, encoding="utf-8", errors="replace")
+        total_ms = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0 or not os.path.exists(profile_path):
+            print(f"실행 실패 (종료 코드 {proc.returncode}):\n{proc.stdout[-2000:]}\n{proc.stderr[-2000:]}")
+            return None
+        with open(profile_path, encoding="utf-8") as f:
+            return metrics(json.load(f), total_ms)
+
+def compare(current, baseline, threshold, min_ms):
+    """기준 대비 느려진 지표 목록 [(지표, 기준, 현재)]"""
+    regressions = []
+    for name, value in current.items():
+        base = baseline.get(name)
+        if base is None: continue
+        floor = 0 if name == 'peak_rss_mb' else min_ms # 짧은 단계의 측정 잡음은 무시
+        if value > base * (1 + threshold) and value - base > floor:
+            regressions.append((name, base, value))
+    return regressions
+
+def parse_importtime(stderr):
+    """-X importtime 출력 -> [(모듈, self us, cumulative us, 깊이)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line: continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit(): continue # 헤더 줄
+        rows.append((name.strip(), int(self_us), int(cumulative_us), (len(name) - len(name.lstrip())) // 2))
+    return rows
+
+def import_subtree(rows, module):
+    """importtime 은 하위 모듈을 부모보다 먼저 출력 -> module 줄 바로 앞의 더 깊은 줄들이 module 이 불러온 모듈"""
+    index = next(i for i, row in enumerate(rows) if row[0] == module)
+    depth, start = rows[index][3], index
+    while start > 0 and rows[start - 1][3] > depth:
+        start -= 1
+    return rows[start:index + 1]
+
+def check_startup(budget_ms, repeat=5, top=10):
+    """main 모듈 import 시간(중앙값)과 시작 시점에 불러온 무거운 라이브러리 점검 -> 통과 여부"""
+    env = dict(os.environ, MPLBACKEND="Agg")
+    samples, rows = [], []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT, env=env,
+                              capture_output=True, text=True, encoding="utf-8", errors="replace")
+        if proc.returncode != 0:
+            print(f"main import 실패:\n{proc.stderr[-2000:]}")
+            return False
+        rows = import_subtree(parse_importtime(proc.stderr), "main")
+        samples.append(rows[-1][2] / 1000)
+    median_ms = statistics.median(samples)
+
+    loaded = {name.split(".")[0] for name, _, _, _ in rows}
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    print(f"main import: {median_ms:.1f} ms (중앙값 {repeat}회, 예산 {budget_ms:.0f} ms)")
+    print(f"  import 시간 상위 {top}개 (cumulative):")
+    for name, _, cumulative, depth in sorted(rows[:-1], key=lambda r: r[2], reverse=True)[:top]:
+        print(f"    {cumulative / 1000:8.1f} ms  {'  ' * (depth - rows[-1][3] - 1)}{name}")
+    if eager:
+        print(f"  시작 시점에 불러온 무거운 라이브러리: {', '.join(eager)}")
+    ok = median_ms <= budget_ms and not eager
+    print("시작 시간 점검 통과" if ok else "시작 시간 점검 실패")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="픽스처 번들 재생 기반 종단간 벤치마크 / 시작 시간 점검")
+    parser.add_argument('bundle', nargs='?', help='main.py --record 로 기록한 픽스처 번들 폴더')
+    parser.add_argument('--startup', action='store_true', help='main import 시간 예산 점검만 실행')
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv("STARTUP_BUDGET_MS", 100)), help='main import 시간 예산 (ms)')
+    parser.add_argument('--mode', default='afternoon', choices=['morning', 'afternoon'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--formats', default="pdf,md")
+    parser.add_argument('--warm', action='store_true', help='반복 실행 간 차트 캐시 공유 (첫 회 이후 웜 캐시)')
+    parser.add_argument('--baseline', help='기준 결과(JSON) 경로')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 --baseline 경로에 저장')
+    parser.add_argument('--threshold', type=float, default=0.2, help='허용 증가율 (0.2 = 20%%)')
+    parser.add_argument('--min-ms', type=float, default=50, help='이보다 작은 증가(ms)는 회귀로 보지 않음')
+    parser.add_argument('--output', help='결과(JSON) 저장 경로')
+    args = parser.parse_args()
+
+    if args.startup:
+        sys.exit(0 if check_startup(args.budget_ms, repeat=max(1, args.repeat)) else 1)
+    if not args.bundle:
+        parser.error("픽스처 번들 경로가 필요합니다 (또는 --startup)")
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="bench_charts_") as warm_dir:
+        for i in range(args.repeat):
+            result = run_once(args.bundle, args.mode, args.formats, warm_dir if args.warm else None)
+            if result is None:
+                sys.exit(1)
+            print(f"[{i + 1}/{args.repeat}] 전체 {result['total']:.0f} ms (보고서 생성 {result['run']:.0f} ms)")
+            runs.append(result)
+
+    names = sorted(set().union(*runs))
+    median = {name: statistics.median(r.get(name, 0.0) for r in runs) for name in names}
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)['median']
+
+    print(f"\n지표 (중앙값, {args.repeat}회)" + ("              기준      변화" if baseline else ""))
+    for name in names:
+        unit = "MB" if name == 'peak_rss_mb' else "ms"
+        line = f"  {name:28s} {median[name]:10.1f} {unit}"
+        if name in baseline:
+            change = (median[name] - baseline[name]) / baseline[name] * 100 if baseline[name] else 0.0
+            line += f" {baseline[name]:10.1f} {unit} {change:+7.1f}%"
+        print(line)
+
+    report = {'bundle': os.path.abspath(args.bundle), 'mode': args.mode, 'repeat': args.repeat, 'warm': args.warm,
+              'median': median, 'runs': runs}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.save_baseline and args.baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"기준 결과 저장: {args.baseline}")
+
+    regressions = compare(median, baseline, args.threshold, args.min_ms)
+    if regressions:
+        print(f"\n성능 회귀 ({args.threshold * 100:.0f}% 초과):")
+        for name, base, value in regressions:
+            print(f"  {name}: {base:.1f} -> {value:.1f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,113 +6,188 @@ from dotenv import load_dotenv
 # 에이전트 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from agents.data_analyst import DataAnalyst
+# 차트는 화면 없이 렌더링 - matplotlib 을 불러오기 전에 비대화형 Agg 백엔드 지정 (차트 워커 프로세스에도 상속)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# 시작 시에는 가벼운 모듈만 불러온다. pandas/FinanceDataReader/bs4/requests(데이터 분석기), matplotlib(차트),
+# fpdf(PDF), markdown(HTML) 은 해당 단계가 실행될 때 불러옴 (python benchmark.py --startup 으로 확인)
 from agents.strategist import Strategist
 from agents.editor import ResearchEditor
 from agents.designer import Designer
-from agents.dispatcher import Dispatcher
-import markdown
-from utils.pdf_converter import convert_to_pdf_fpdf
+from utils.report_outputs import write_outputs, OUTPUT_FORMATS
+from utils.pipeline import Pipeline
+from utils.profiler import get_profiler, cprofile_to
+
+class NoCandidates(Exception):
+    """분석 단계에서 후보 종목이 없음 (이후 단계 중단)"""
+
+def build_parser():
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mode', type=str, default='afternoon', choices=['morning', 'afternoon'])
+    parser.add_argument('--workers', type=int, default=int(os.getenv("ANALYST_WORKERS", 8)), help='후보 종목 병렬 분석 스레드 수 (1 = 순차 처리)')
+    parser.add_argument('--host-limit', type=int, default=int(os.getenv("ANALYST_HOST_LIMIT", 4)), help='호스트별 최대 동시 요청 수')
+    parser.add_argument('--chart-workers', type=int, default=None, help='차트 렌더링 프로세스 수 (기본: CPU 코어 수, 1 = 순차 처리)')
+    parser.add_argument('--chart-format', type=str, default=os.getenv("CHART_FORMAT", "png"), choices=['png', 'svg'], help='차트 형식 (svg = 벡터, PDF 용량 감소 / 확대 시 선명)')
+    parser.add_argument('--formats', type=str, default=os.getenv("REPORT_FORMATS", "pdf,md"), help=f"생성할 보고서 형식 (쉼표 구분: {','.join(OUTPUT_FORMATS)})")
+    parser.add_argument('--universe', action='store_true', help='KRX 전 종목 일괄 스크리닝 후 통과 종목만 상세 분석')
+    parser.add_argument('--appendix', action='store_true', help='PDF 에 스크리닝 통과 종목 전체 부록(스파크라인 표) 추가 (--universe 와 함께 사용)')
+    parser.add_argument('--screen-limit', type=int, default=200, help='스크리닝 통과 종목 중 상세 분석할 최대 종목 수')
+    parser.add_argument('--profile', type=str, default=os.getenv("RUN_PROFILE"), help='실행 프로파일(JSON) 저장 경로 (기본: 보고서 옆 <보고서>.profile.json)')
+    parser.add_argument('--cprofile', type=str, default=None, help='cProfile 결과(pstats) 저장 경로 - 지정 시 전체 실행을 함수 단위로 프로파일링')
+    parser.add_argument('--output-dir', type=str, default=".", help='보고서/프로파일 저장 폴더')
+    fixture_group = parser.add_mutually_exclusive_group()
+    fixture_group.add_argument('--record', type=str, metavar='BUNDLE', help='실제 실행의 HTTP 응답/DataReader 데이터를 픽스처 번들 폴더에 기록')
+    fixture_group.add_argument('--replay', type=str, metavar='BUNDLE', help='기록된 픽스처 번들로 오프라인 실행 (네트워크 미사용, 기록 시각 기준)')
+    # 상주 실행: 한 프로세스에서 오전/오후 보고서를 스케줄 실행 (캐시/커넥션/폰트 유지)
+    parser.add_argument('--daemon', action='store_true', help='상주 모드 - 오전/오후 보고서를 스케줄에 따라 같은 프로세스에서 반복 실행')
+    parser.add_argument('--morning-at', type=str, default=os.getenv("DAEMON_MORNING_AT", "07:00"), help='상주 모드 오전 보고서 시각 (HH:MM, 서버 현지 시간)')
+    parser.add_argument('--afternoon-at', type=str, default=os.getenv("DAEMON_AFTERNOON_AT", "17:00"), help='상주 모드 오후 보고서 시각 (HH:MM, 서버 현지 시간)')
+    parser.add_argument('--trigger-port', type=int, default=int(os.getenv("DAEMON_TRIGGER_PORT", 0)) or None,
+                        help='상주 모드 수동 실행 포트 (127.0.0.1 전용, POST /run?mode=morning, GET /status)')
+    return parser
 
-def main():
+def main(argv=None):
     load_dotenv()
     
     # 0. 설정 (환경변수나 직접 입력)
     RECEIVER_EMAIL = os.getenv("RECEIVER_EMAIL", "recipient@example.com")
     
-    import argparse
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--mode', type=str, default='afternoon', choices=['morning', 'afternoon'])
-    args = parser.parse_args()
+    args = build_parser().parse_args(argv)
+    if args.daemon:
+        from utils.daemon import ReportDaemon
+        ReportDaemon(args, run_once, warm_up=resident_services).serve()
+        return
+    run_once(args)
+
+def run_once(args, warm=None):
+    """보고서 1회 생성 (warm: 상주 모드에서 실행 간 공유하는 객체 보관용 dict) -> 출력 결과 또는 None"""
+    # 기록/재생: 공용 HTTP 클라이언트의 transport 와 DataReader 소스를 번들 경유로 교체
+    fixtures = None
+    if args.record or args.replay:
+        from utils.replay import FixtureBundle
+        from utils.http_client import set_client
+        fixtures = FixtureBundle(args.record or args.replay, mode='record' if args.record else 'replay')
+        set_client(fixtures.http_client())
+        if args.replay:
+            fixtures.freeze_clock()
+
+    # 실행 프로파일: 단계/호출 지점별 소요 시간, 호스트별 HTTP 요청 수/바이트, 캐시 적중률, 최대 RSS -> 보고서 옆 JSON
+    base_path = os.path.join(args.output_dir, f"Stock_Report_{'AM' if args.mode=='morning' else 'PM'}_{datetime.now().strftime('%Y%m%d_%H%M')}")
+    profiler = get_profiler()
+    profiler.reset()
+    try:
+        if args.cprofile:
+            with cprofile_to(args.cprofile):
+                return run_report(args, base_path, fixtures, warm)
+        return run_report(args, base_path, fixtures, warm)
+    finally:
+        profiler.write(args.profile or base_path + ".profile.json")
+        if fixtures:
+            fixtures.save()
+            fixtures.close()
+
+def resident_services(args, warm=None, fixtures=None):
+    """실행마다 새로 만들 필요가 없는 객체 (데이터 분석기: 커넥션 풀/일봉 저장소/상장 목록, 차트 생성기: 렌더 캐시)
+
+    warm dict 가 주어지면 설정이 같은 동안 그 안에 보관해 다음 실행에서 재사용한다 (기록/재생 실행은 항상 새로 생성).
+    """
+    def resident(key, factory):
+        if warm is None or fixtures is not None:
+            return factory()
+        if key not in warm:
+            warm[key] = factory()
+        return warm[key]
+
+    from agents.data_analyst import DataAnalyst
+    from utils.chart_generator import ChartGenerator
+    design_config = resident('design', lambda: Designer().get_config())
+    chart_gen = resident(('charts', args.chart_format), lambda: ChartGenerator(design_config, chart_format=args.chart_format))
+    analyst = resident(('analyst', args.workers, args.host_limit),
+                       lambda: DataAnalyst(max_workers=args.workers, per_host_limit=args.host_limit, fixtures=fixtures))
+    return analyst, chart_gen
+
+def run_report(args, base_path, fixtures=None, warm=None):
     mode = args.mode
-    
     print(f"[{datetime.now()}] 주식 리서치 자동화 시스템 가동 (Mode: {mode})...")
     
-    # 1단계: Agent A (데이터 수집 및 분석)
-    analyst = DataAnalyst()
-    raw_data = analyst.run(mode=mode)
-    candidates = raw_data.get('picks', [])
-    
-    if not candidates:
-        print("분석 단계에서 후보 종목을 찾지 못했습니다. 종료합니다.")
-        return
+    # 데이터 분석기 및 차트 생성기 (지수 차트는 분석과 별개로 지수 이력이 도착하는 즉시 렌더링)
+    analyst, chart_gen = resident_services(args, warm, fixtures)
 
-    # 2단계: Agent B (전략 수립 및 선정)
     strategist = Strategist()
-    picks = strategist.run(candidates, global_status=raw_data.get('global_status'), mode=mode)
-    
-    # 3단계: Agent C (보고서 초안 작성)
     editor = ResearchEditor()
-    draft_md = editor.run(
-        mode, 
-        picks, 
-        raw_data.get('market_briefing', {}), 
-        raw_data.get('market_news', []),
-        global_status=raw_data.get('global_status')
-    )
-    
-    # 4단계: 디자인 시스템 및 차트 생성
-    designer = Designer()
-    design_config = designer.get_config()
-    from utils.chart_generator import ChartGenerator
-    chart_gen = ChartGenerator(design_config)
-    
-    chart_paths = []
-    print("시장 및 종목별 차트 생성 중...")
+
+    def select_picks(analysis):
+        candidates = analysis.get('picks', [])
+        if not candidates:
+            raise NoCandidates()
+        return strategist.run(candidates, global_status=analysis.get('global_status'), mode=mode)
+
+    def render_pick_charts(picks):
+        # 개별 종목 일봉 차트 (120일 기준) - 프로세스 풀 일괄 렌더링, 파일 없이 메모리(PNG/SVG bytes)로 반환
+        # 실패한 차트는 None 으로 자리 유지. 지수 차트 렌더링과 동시에 진행
+        print("종목별 차트 생성 중...")
+        chart_jobs = [(analyst.get_chart_frame(p['ticker'], days=120), p['ticker'], None, {'view_days': 20}) for p in picks]
+        return chart_gen.render_batch(chart_jobs, max_workers=args.chart_workers)
+
+    # 단계 의존성 그래프: 1단계 Agent A (수집/분석) -> 2단계 Agent B (선정) -> 3단계 Agent C (문서 모델) / 4단계 종목 차트
+    #                   지수 이력 -> 지수 차트 (1~4단계와 동시 진행, 결과는 종목 차트 앞에 붙임)
+    pipe = Pipeline("main", max_workers=args.workers)
+    pipe.add('analysis', lambda: analyst.run(mode=mode, universe=args.universe, screen_limit=args.screen_limit))
+    pipe.add('index_history', lambda: [analyst.get_index_history(code, days=120) for code in ("KS11", "KQ11")])
+    pipe.add('index_charts', lambda index_history: chart_gen.render_batch(
+        [(df, code, None, {'title': title}) for df, code, title in zip(index_history, ("KS11", "KQ11"), ("KOSPI", "KOSDAQ"))], max_workers=1),
+        deps=['index_history'], default=[None, None])
+    pipe.add('picks', select_picks, deps=['analysis'])
+    # 보고서 문서 모델 (PDF/마크다운/텔레그램 공통)
+    pipe.add('report', lambda analysis, picks: editor.build(
+        mode, picks, analysis.get('market_briefing', {}), analysis.get('market_news', []), global_status=analysis.get('global_status')),
+        deps=['analysis', 'picks'])
+    pipe.add('charts', render_pick_charts, deps=['picks'], default=[])
     try:
-        # 1. 지수 차트 (이제 일봉 형식으로 생성)
-        ks_df = analyst.get_index_history("KS11", days=120)
-        kq_df = analyst.get_index_history("KQ11", days=120)
-        chart1 = "chart_kospi.png"
-        chart2 = "chart_kosdaq.png"
-        if chart_gen.create_candle_chart(ks_df, "KS11", chart1, title="KOSPI"): chart_paths.append(chart1)
-        if chart_gen.create_candle_chart(kq_df, "KQ11", chart2, title="KOSDAQ"): chart_paths.append(chart2)
-        
-        # 2. 섹터 분석 데이터 수집 (차트는 미생성)
-        sectors = analyst.get_sector_trends()
-            
-        # 3. 개별 종목 일봉 차트 (10개, 120일 기준)
-        for i, p in enumerate(picks):
-            ticker = p['ticker']
-            stock_df = analyst.get_stock_history(ticker, days=120)
-            chart_filename = f"chart_stock_{i}.png"
-            if chart_gen.create_candle_chart(stock_df, ticker, chart_filename, view_days=20):
-                chart_paths.append(chart_filename)
-            else:
-                chart_paths.append("FAILED")
-                
-    except Exception as e:
-        print(f"차트 생성 과정 대규모 오류: {e}")
+        stages = pipe.run()
+    except NoCandidates:
+        print("분석 단계에서 후보 종목을 찾지 못했습니다. 종료합니다.")
+        return
+    finally:
+        pipe.print_summary()
+        if analyst.pipeline: analyst.pipeline.print_summary()
+    raw_data, picks, report = stages['analysis'], stages['picks'], stages['report']
+    charts = stages['index_charts'] + stages['charts'] # PDF 차트 순서: 지수(KOSPI, KOSDAQ) -> 종목
 
     # 5단계: 보고서 생성 및 변환 (fpdf2 기반)
     pdf_data = {
         "picks": picks,
         "market_briefing": raw_data.get('market_briefing', {}),
         "market_news": raw_data.get('market_news', []),
-        "sectors": sectors, # Keep for legacy or internal use if needed
+        "sectors": raw_data.get('sectors', []), # Keep for legacy or internal use if needed
         "etf_trends": raw_data.get('etf_trends', []),
-        "draft_md": draft_md,
-        "chart_paths": chart_paths
+        "report": report,
+        "charts": charts,
+        # 부록: 스크리닝 통과 종목 전체 (스파크라인 종가는 PDF 에 행을 그릴 때 로컬 일봉에서 읽음)
+        "screened": raw_data.get('screened', []) if args.appendix else [],
+        "sparkline_source": analyst.get_sparkline
     }
     
-    pdf_path = f"Stock_Report_{'AM' if mode=='morning' else 'PM'}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-    if convert_to_pdf_fpdf(pdf_data, pdf_path):
-        # 6단계: Agent E (발송 - PDF 전송)
-        dispatcher = Dispatcher()
-        caption = f"📑 [{'오전' if mode=='morning' else '오후'}] {datetime.now().strftime('%Y-%m-%d')} 리포트가 발간되었습니다."
-        dispatcher.send_telegram_document(pdf_path, caption=caption)
-    else:
-        print("PDF 생성 실패로 인해 텔레그램 발송을 건너뜜.")
-
-    # 차트 파일 일괄 정리
-    for cp in chart_paths:
-        if os.path.exists(cp): os.remove(cp)
-
-    # 텍스트 백업 저장 (여전히 유지)
-    with open("sample_report.md", "w", encoding="utf-8") as f:
-        f.write(draft_md)
+    # 같은 분석 결과로 활성화된 형식(PDF/마크다운/HTML/텔레그램/JSON)을 병렬 생성 (마크다운은 기존대로 sample_report.md)
+    formats = [fmt.strip() for fmt in args.formats.split(",") if fmt.strip()]
+    outputs = write_outputs(pdf_data, base_path, formats, paths={'md': os.path.join(args.output_dir, "sample_report.md")})
+
+    # 6단계: Agent E (발송 - PDF 문서 / 텔레그램 요약 메시지)
+    from agents.dispatcher import Dispatcher
+    dispatcher = Dispatcher()
+    if 'pdf' in outputs:
+        if outputs['pdf']['ok']:
+            caption = f"📑 [{'오전' if mode=='morning' else '오후'}] {datetime.now().strftime('%Y-%m-%d')} 리포트가 발간되었습니다."
+            dispatcher.send_telegram_document(outputs['pdf']['path'], caption=caption)
+        else:
+            print("PDF 생성 실패로 인해 텔레그램 발송을 건너뜜.")
+    if outputs.get('telegram', {}).get('ok'):
+        with open(outputs['telegram']['path'], encoding="utf-8") as f:
+            dispatcher.send_telegram_message(f.read())
     
     print("전체 공정이 완료되었습니다.")
+    return outputs
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from utils.cache import ByteLRUCache, RunCache, atomic_write, safe_filename
+
+# 실행 단위 캐시(RunCache), 크기 제한 LRU 바이트 캐시(ByteLRUCache), 공용 파일 헬퍼
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(0.01)
+        return self.value
+
+def test_run_cache_loads_once_across_threads():
+    cache, loader = RunCache(), Loader({'a': 1})
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("005930", loader))) for _ in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert loader.calls == 1
+    assert results == [{'a': 1}] * 8
+    assert (cache.hits, cache.misses) == (7, 1)
+
+def test_run_cache_keeps_none_in_memory_only(tmp_path):
+    cache, loader = RunCache(persist_dir=str(tmp_path)), Loader(None)
+    assert cache.get_or_load("k", loader) is None
+    assert cache.get_or_load("k", loader) is None
+    assert loader.calls == 1 # 실패(None)도 같은 실행 안에서는 다시 요청하지 않음
+    assert os.listdir(tmp_path) == [] # 다음 실행에는 남기지 않음
+
+def test_run_cache_persists_json_between_runs(tmp_path):
+    value = {'dealTrendInfos': [{'foreignerPureBuyQuant': '1,000'}], 'name': '삼성전자'}
+    RunCache(persist_dir=str(tmp_path), ttl=600).get_or_load("005930", Loader(value))
+    loader = Loader("unused")
+    cache = RunCache(persist_dir=str(tmp_path), ttl=600)
+    assert cache.get_or_load("005930", loader) == value
+    assert loader.calls == 0 and cache.hits == 1
+
+def test_run_cache_ttl_expiry(tmp_path):
+    RunCache(persist_dir=str(tmp_path), ttl=600).get_or_load("k", Loader("old"))
+    path = tmp_path / "k.json"
+    os.utime(path, (time.time() - 601, time.time() - 601))
+    assert RunCache(persist_dir=str(tmp_path), ttl=600).get_or_load("k", Loader("new")) == "new"
+    assert RunCache(persist_dir=str(tmp_path), ttl=600).get_or_load("k", Loader("unused")) == "new"
+
+def test_run_cache_ignores_corrupt_file(tmp_path):
+    (tmp_path / "k.json").write_text("{not json", encoding="utf-8")
+    assert RunCache(persist_dir=str(tmp_path)).get_or_load("k", Loader([1, 2])) == [1, 2]
+
+def test_run_cache_clear():
+    cache, loader = RunCache(), Loader(1)
+    cache.get_or_load("k", loader)
+    cache.clear()
+    cache.get_or_load("k", loader)
+    assert loader.calls == 2
+
+def test_safe_filename():
+    assert safe_filename("ETF/KR") == "ETF_KR"
+    assert safe_filename(("charts", "svg")) == "__charts____svg__"
+
+def test_atomic_write_replaces_and_cleans_up(tmp_path):
+    path = str(tmp_path / "f.bin")
+    atomic_write(path, b"one")
+    atomic_write(path, "둘")
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "둘"
+    assert os.listdir(tmp_path) == ["f.bin"]
+
+def test_byte_cache_evicts_least_recently_used():
+    cache = ByteLRUCache(max_bytes=30)
+    for key in "abc":
+        cache.put(key, key.encode() * 10)
+    assert cache.get("a") == b"a" * 10 # a 를 최근 사용으로
+    cache.put("d", b"d" * 10)
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == [b"a" * 10, b"c" * 10, b"d" * 10]
+    cache.put("big", b"x" * 31) # 한도보다 큰 값은 메모리에 두지 않음
+    assert cache.get("big") is None and cache._size == 30
+
+def test_byte_cache_falls_back_to_disk(tmp_path):
+    ByteLRUCache(persist_dir=str(tmp_path)).put("chart/005930", b"png")
+    cache = ByteLRUCache(persist_dir=str(tmp_path))
+    assert cache.get("chart/005930") == b"png"
+    assert os.listdir(tmp_path) == ["chart_005930.bin"]
+    os.remove(tmp_path / "chart_005930.bin")
+    assert cache.get("chart/005930") == b"png" # 디스크에서 읽은 뒤로는 메모리에서
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert ByteLRUCache(persist_dir=str(tmp_path)).get("chart/005930") is None
+
+def test_byte_cache_evicts_oldest_files_on_disk(tmp_path):
+    cache = ByteLRUCache(persist_dir=str(tmp_path), max_disk_bytes=25)
+    for i, key in enumerate("abc"):
+        cache.put(key, b"0" * 10)
+        os.utime(tmp_path / f"{key}.bin", (1000 + i, 1000 + i))
+    cache.put("d", b"0" * 10) # 수정 시각이 오래된 파일부터 지워 25 바이트 이하 유지
+    assert sorted(os.listdir(tmp_path)) == ["c.bin", "d.bin"]
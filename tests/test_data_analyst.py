@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+from agents.data_analyst import DataAnalyst
+from utils.http_client import HttpClient, LocalStubTransport
+from utils.synthetic_bundle import SyntheticSource
+
+# 후보 종목 병렬 분석(enrich_candidates)이 순차 분석과 같은 결과를 같은 순서로 내는지,
+# 호스트별 동시 요청 수 제한(per_host_limit)을 지키는지 로컬 스텁 서버(합성 네이버 응답)로 확인
+
+TICKERS = [f"{code:06d}" for code in (5930, 660, 42700, 58470, 39030, 240810, 403870, 357780, 5290, 36930, 95340, 222800)]
+PER_HOST_LIMIT = 2
+DELAY = 0.01 # 요청마다 지연을 넣어 동시 요청이 실제로 겹치게 함
+
+class Concurrency:
+    """호스트별 동시 요청 수 (현재/최대) 기록"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = defaultdict(int)
+        self.peak = defaultdict(int)
+
+    def enter(self, host):
+        with self._lock:
+            self.current[host] += 1
+            self.peak[host] = max(self.peak[host], self.current[host])
+
+    def leave(self, host):
+        with self._lock:
+            self.current[host] -= 1
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        host = self.headers.get('X-Original-Host')
+        self.server.concurrency.enter(host)
+        try:
+            time.sleep(DELAY)
+            request = requests.Request("GET", f"https://{host}{self.path}").prepare()
+            response = self.server.source.respond(request)
+        finally:
+            self.server.concurrency.leave(host)
+        self.send_response(response.status_code)
+        self.send_header("Content-Type", response.headers['Content-Type'])
+        self.send_header("Content-Length", str(len(response.content)))
+        self.end_headers()
+        self.wfile.write(response.content)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.source = SyntheticSource()
+    server.concurrency = Concurrency()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(autouse=True)
+def no_persisted_cache(monkeypatch):
+    monkeypatch.delenv("NAVER_API_CACHE_DIR", raising=False)
+
+def make_analyst(stub, tmp_path, workers):
+    client = HttpClient(timeout=(2, 10), retries=0)
+    client.mount(LocalStubTransport(f"http://127.0.0.1:{stub.server_address[1]}", pool_maxsize=16))
+    analyst = DataAnalyst(max_workers=workers, per_host_limit=PER_HOST_LIMIT, http=client)
+    analyst.prices.cache_dir = str(tmp_path / f"ohlcv_{workers}")
+    concurrency = stub.concurrency
+
+    def data_reader(symbol, start=None, end=None):
+        concurrency.enter("FinanceDataReader")
+        try:
+            time.sleep(DELAY)
+            return stub.source.data_reader(symbol, start, end)
+        finally:
+            concurrency.leave("FinanceDataReader")
+    analyst._data_reader = data_reader
+    return analyst
+
+def test_concurrent_matches_sequential(stub, tmp_path):
+    semi = TICKERS[:3]
+    sequential = make_analyst(stub, tmp_path, workers=1).enrich_candidates(TICKERS, semi)
+    stub.concurrency.peak.clear()
+    concurrent = make_analyst(stub, tmp_path, workers=8).enrich_candidates(TICKERS, semi)
+    assert [r and r['ticker'] for r in concurrent] == [r and r['ticker'] for r in sequential]
+    assert concurrent == sequential
+    assert any(sequential), "합성 응답에서 필터를 통과한 후보가 하나도 없음"
+
+def test_per_host_limit(stub, tmp_path):
+    make_analyst(stub, tmp_path, workers=8).enrich_candidates(TICKERS, [])
+    peak = dict(stub.concurrency.peak)
+    assert peak["finance.naver.com"] == PER_HOST_LIMIT # 한도까지는 동시에 요청
+    assert all(count <= PER_HOST_LIMIT for count in peak.values()), peak
+
+def test_sector_trends_cached_per_top_n(stub, tmp_path):
+    analyst = make_analyst(stub, tmp_path, workers=4)
+    urls = []
+    get = analyst._get
+    analyst._get = lambda url, **kwargs: urls.append(url) or get(url, **kwargs)
+    top3 = analyst.get_sector_trends(top_n=3)
+    top5 = analyst.get_sector_trends(top_n=5)
+    assert (len(top3), len(top5)) == (3, 5) # 먼저 계산한 top_n 결과를 다른 top_n 에 돌려주지 않음
+    count = len(urls)
+    assert analyst.get_sector_trends(top_n=3) is top3 and analyst.get_sector_trends(top_n=5) is top5
+    assert len(urls) == count
@@ -0,0 +1,25 @@
+from agents.dispatcher import split_message
+
+# 텔레그램 메시지 분할: Markdown 강조가 파트 경계에서 잘리지 않는지 확인
+
+def test_split_on_line_boundaries():
+    lines = [f"{i}) *종목{i}* (00{i:04d}) 12,340원 (+3.1%)" if i % 3 else f"_면책 조항 {i}_" for i in range(400)]
+    content = "\n".join(lines)
+    parts = split_message(content, limit=500)
+    assert len(parts) > 1
+    assert all(len(part) <= 500 for part in parts)
+    assert "\n".join(parts) == content # 줄 경계에서만 나눔
+    for part in parts:
+        for line in part.split("\n"):
+            assert line.count("*") % 2 == 0 and line.count("_") % 2 == 0
+
+def test_long_line_split_at_space():
+    words = ["가나다라마"] * 300
+    parts = split_message("*제목*\n" + " ".join(words), limit=100)
+    assert parts[0] == "*제목*"
+    assert all(len(part) <= 100 for part in parts)
+    assert " ".join(parts[1:]).split() == words
+
+def test_short_message_is_single_part():
+    assert split_message("*제목*\n\n본문") == ["*제목*\n\n본문"]
+    assert split_message("x" * 250, limit=100) == ["x" * 100, "x" * 100, "x" * 50]
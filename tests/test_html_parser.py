@@ -0,0 +1,39 @@
+import random
+import pytest
+from bs4 import BeautifulSoup
+from utils import html_parser
+from utils.naver_samples import PAGES
+
+# 페이지별 부분 파싱(SoupStrainer)이 스크래퍼 선택자 결과를 바꾸지 않는지 합성 네이버 페이지로 확인
+
+SELECTORS = {
+    'sector_list': ["table.type_5 tr", "table.type_5 tr td a"],
+    'sector_detail': ["td.name a", "div.name_area a", "table.type_5 tr"],
+    'volume_rank': ["a.tltle"],
+    'main_news': [".articleSubject a"],
+    'item_news': [".title a", ".info"],
+}
+
+def sample(page, seed=0):
+    return PAGES[page](random.Random(seed)).encode("cp949")
+
+@pytest.mark.parametrize("page", sorted(SELECTORS))
+def test_strained_parse_matches_full_parse(page):
+    raw = sample(page)
+    full = BeautifulSoup(raw.decode("cp949"), 'html.parser')
+    strained = html_parser.make_soup(raw, page=page)
+    for selector in SELECTORS[page]:
+        expected = [(tag.get_text().strip(), tag.get('href')) for tag in full.select(selector)]
+        assert expected, selector
+        assert [(tag.get_text().strip(), tag.get('href')) for tag in strained.select(selector)] == expected, selector
+
+def test_item_main_fields():
+    soup = html_parser.make_soup(sample('item_main'), page='item_main')
+    assert soup.select_one("#_pbr") and soup.select_one("#_per") and soup.select_one("em#_target_money")
+    assert "영업이익" in soup.select_one(".section.cop_analysis").get_text()
+
+@pytest.mark.parametrize("content_type", ["text/html; charset=EUC-KR", "text/html;charset=euc-kr", "text/html"])
+def test_response_encoding(content_type):
+    class Response:
+        headers = {'Content-Type': content_type}
+    assert html_parser.response_encoding(Response()) == "cp949"
@@ -0,0 +1,94 @@
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils.html_parser import parse_response
+from utils.http_client import HttpClient, LocalStubTransport
+from utils.profiler import get_profiler
+
+# LocalStubTransport 로 HttpClient 요청을 로컬 스텁 서버에 돌려 재시도/429/인코딩 처리를 확인
+
+PAGE = "<html><body><table class='type_5'><tr><td class='name'><a>삼성전자</a></td></tr></table></body></html>"
+
+class StubHandler(BaseHTTPRequestHandler):
+    """경로별 응답: /flaky (503 두 번 후 200), /throttled (Retry-After: 3600 인 429 후 200), /page (cp949 본문), /gzip (gzip 압축 본문)"""
+    def do_GET(self):
+        server = self.server
+        server.seen.append((self.path, self.headers.get('X-Original-Host')))
+        count = sum(1 for path, _ in server.seen if path == self.path)
+        if self.path == "/flaky" and count <= 2:
+            return self._reply(503, b"busy")
+        if self.path == "/throttled" and count == 1:
+            return self._reply(429, b"slow down", {'Retry-After': '3600'})
+        if self.path == "/gzip":
+            return self._reply(200, gzip.compress(PAGE.encode("cp949") * 50), {'Content-Type': 'text/html; charset=EUC-KR', 'Content-Encoding': 'gzip'})
+        if self.path == "/page":
+            return self._reply(200, PAGE.encode("cp949"), {'Content-Type': 'text/html; charset=EUC-KR'})
+        self._reply(200, b"ok")
+
+    def do_POST(self):
+        self.server.seen.append((self.path, self.headers.get('X-Original-Host')))
+        self._reply(503, b"busy")
+
+    def _reply(self, code, body, headers=None):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.seen = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def client(stub):
+    client = HttpClient(timeout=(2, 5), retries=3, backoff=0.01, max_retry_after=0.2)
+    client.mount(LocalStubTransport(f"http://127.0.0.1:{stub.server_address[1]}", max_retries=client.retry))
+    yield client
+    client.close()
+
+def test_redirects_to_stub_with_original_host(client, stub):
+    res = client.get("https://finance.naver.com/ok?x=1")
+    assert res.status_code == 200
+    assert stub.seen == [("/ok?x=1", "finance.naver.com")]
+
+def test_retries_server_errors(client, stub):
+    res = client.get("https://finance.naver.com/flaky")
+    assert res.status_code == 200
+    assert len(stub.seen) == 3
+
+def test_retry_after_is_capped(client, stub):
+    start = time.perf_counter()
+    res = client.get("https://finance.naver.com/throttled")
+    assert res.status_code == 200
+    assert len(stub.seen) == 2
+    assert time.perf_counter() - start < 5 # Retry-After: 3600 이 아니라 max_retry_after(0.2초) 만큼만 대기
+
+def test_post_is_not_retried(client, stub):
+    res = client.post("https://api.telegram.org/bot<token>/sendMessage", data={'text': 'x'})
+    assert res.status_code == 503
+    assert len(stub.seen) == 1
+
+def test_euc_kr_page_decodes(client):
+    res = client.get("https://finance.naver.com/page")
+    soup = parse_response(res, page='sector_list')
+    assert soup.select_one("td.name a").get_text() == "삼성전자"
+
+def test_profile_records_wire_bytes(client):
+    # 압축 해제 전 전송 크기를 기록 (len(response.content) 는 압축 해제 후 크기)
+    host = "gzip.test.local"
+    res = client.get(f"https://{host}/gzip")
+    wire = len(gzip.compress(PAGE.encode("cp949") * 50))
+    assert len(res.content) == len(PAGE.encode("cp949")) * 50
+    assert get_profiler().http[host]['wire_bytes'] == wire
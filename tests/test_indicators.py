@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+from utils import indicators
+
+# 벡터 연산 지표(utils.indicators)가 기존 DataAnalyst.analyze_technical / calculate_obv 의
+# 종목별 pandas 구현과 같은 값을 내는지 고정된 합성 데이터로 확인
+
+def legacy_analyze(df):
+    """기존 DataAnalyst.analyze_technical / calculate_obv 구현 -> (지표 DataFrame, OBV 리스트, 시그널)"""
+    df = df.copy()
+    df['MA5'] = df['Close'].rolling(window=5).mean()
+    df['MA20'] = df['Close'].rolling(window=20).mean()
+    df['MA60'] = df['Close'].rolling(window=60).mean()
+    df['MA120'] = df['Close'].rolling(window=120).mean()
+    df['V_MA20'] = df['Volume'].rolling(window=20).mean()
+    delta = df['Close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    df['RSI'] = 100 - (100 / (1 + (gain / loss)))
+    tr = pd.concat([df['High']-df['Low'], (df['High']-df['Close'].shift()).abs(), (df['Low']-df['Close'].shift()).abs()], axis=1).max(axis=1)
+    atr = tr.rolling(window=14).mean()
+    up, down = df['High'].diff(), df['Low'].shift() - df['Low']
+    pdm = (up.where((up > down) & (up > 0), 0)).rolling(window=14).mean()
+    mdm = (down.where((down > up) & (down > 0), 0)).rolling(window=14).mean()
+    pdi, mdi = 100 * (pdm / atr), 100 * (mdm / atr)
+    dx = 100 * (pdi - mdi).abs() / (pdi + mdi)
+    adx_val = dx.rolling(window=14).mean().iloc[-1] if not dx.empty else 0
+    obv_list = [0]
+    for i in range(1, len(df)):
+        if df['Close'].iloc[i] > df['Close'].iloc[i-1]: obv_list.append(obv_list[-1] + df['Volume'].iloc[i])
+        elif df['Close'].iloc[i] < df['Close'].iloc[i-1]: obv_list.append(obv_list[-1] - df['Volume'].iloc[i])
+        else: obv_list.append(obv_list[-1])
+    is_obv_rising = all(x < y for x, y in zip(obv_list[-5:], obv_list[-4:])) if len(obv_list) >= 5 else False
+    last, prev = df.iloc[-1], df.iloc[-2]
+    return df, obv_list, {
+        'close': int(last['Close']), 'change_rate': ((last['Close']-prev['Close'])/prev['Close'])*100, 'rsi': last['RSI'],
+        'adx': adx_val, 'is_perfect': last['MA5'] > last['MA20'] > last['MA60'] > last['MA120'],
+        'is_breakout': last['Close'] > prev['Close'] and last['Volume'] > last['V_MA20'] * 2,
+        'is_pullback': last['Close'] <= prev['Close'] and last['Volume'] < last['V_MA20'] * 0.5,
+        'strong_trend': adx_val > 25, 'volume': last['Volume'], 'v_ma20': last['V_MA20'], 'is_obv_rising': is_obv_rising
+    }
+
+def random_frame(rng, n=245):
+    """합성 일봉 (보합 구간, 거래량 급증 마지막 봉 포함)"""
+    close = np.round(10000 * np.exp(np.cumsum(rng.normal(0, 0.02, n))), -1)
+    close[rng.integers(1, n, 10)] = close[rng.integers(1, n, 10) - 1]
+    high = close * (1 + rng.uniform(0, 0.03, n))
+    low = close * (1 - rng.uniform(0, 0.03, n))
+    volume = rng.integers(1_000, 5_000_000, n)
+    volume[-1] = volume[-1] * rng.choice([1, 3])
+    return pd.DataFrame({'Open': close, 'High': high, 'Low': low, 'Close': close, 'Volume': volume})
+
+def random_frames(seed=42, count=50, lengths=(245,)):
+    rng = np.random.default_rng(seed)
+    return [random_frame(rng, n=lengths[i % len(lengths)]) for i in range(count)]
+
+def ragged_panel(frames):
+    """DataAnalyst.screen_universe 와 같은 패널 (최근 일자를 오른쪽 끝에 맞추고 짧은 종목은 앞쪽 NaN)"""
+    width = max(len(df) for df in frames)
+    panel = {}
+    for col in ('High', 'Low', 'Close', 'Volume'):
+        arr = np.full((len(frames), width), np.nan)
+        for i, df in enumerate(frames):
+            arr[i, width - len(df):] = df[col].to_numpy(dtype='float64')
+        panel[col] = arr
+    return panel
+
+def assert_signals_equal(actual, expected):
+    for key, value in expected.items():
+        got = int(actual[key]) if key == 'close' else actual[key]
+        if isinstance(value, (bool, np.bool_)):
+            assert bool(got) == bool(value), key
+        else:
+            assert np.isclose(got, value, rtol=1e-9, atol=1e-9, equal_nan=True), key
+
+@pytest.mark.parametrize("df", random_frames(), ids=lambda df: f"{len(df)}d")
+def test_indicators_match_legacy(df):
+    legacy_df, legacy_obv, expected = legacy_analyze(df)
+    ind = indicators.compute_indicators(df['High'], df['Low'], df['Close'], df['Volume'])
+    for col in ('MA5', 'MA20', 'MA60', 'MA120', 'V_MA20', 'RSI'):
+        np.testing.assert_allclose(ind[col], legacy_df[col].to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=col)
+    np.testing.assert_array_equal(ind['OBV'], np.asarray(legacy_obv, dtype='float64'))
+    assert_signals_equal(indicators.last_bar_signals(df['Close'], df['Volume'], ind), expected)
+
+def test_panel_matches_per_ticker():
+    frames = random_frames(seed=7, count=30)
+    panel = ragged_panel(frames)
+    sig = indicators.last_bar_signals(panel['Close'], panel['Volume'], indicators.compute_indicators(panel['High'], panel['Low'], panel['Close'], panel['Volume']))
+    for i, df in enumerate(frames):
+        assert_signals_equal({k: v[i] for k, v in sig.items()}, legacy_analyze(df)[2])
+
+def test_ragged_panel_matches_legacy():
+    # 상장 기간이 다른 종목 (120일 ~ 245일) 을 한 패널에서 계산해도 종목별 기존 구현과 같아야 함
+    frames = random_frames(seed=11, count=40, lengths=(245, 180, 121, 150, 200))
+    panel = ragged_panel(frames)
+    ind = indicators.compute_indicators(panel['High'], panel['Low'], panel['Close'], panel['Volume'])
+    sig = indicators.last_bar_signals(panel['Close'], panel['Volume'], ind)
+    width = panel['Close'].shape[1]
+    for i, df in enumerate(frames):
+        legacy_df, legacy_obv, expected = legacy_analyze(df)
+        real = slice(width - len(df), None)
+        for col in ('MA5', 'MA20', 'MA60', 'MA120', 'V_MA20', 'RSI'):
+            np.testing.assert_allclose(ind[col][i, real], legacy_df[col].to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=col)
+        np.testing.assert_array_equal(ind['OBV'][i, real], np.asarray(legacy_obv, dtype='float64'))
+        assert_signals_equal({k: v[i] for k, v in sig.items()}, expected)
+
+if __name__ == "__main__":
+    # 마이크로 벤치마크 (기존 pandas 구현 대비): python -m tests.test_indicators
+    import time
+
+    frames = random_frames(count=200)
+    panel = ragged_panel(frames)
+    t0 = time.perf_counter()
+    for df in frames: legacy_analyze(df)
+    t_legacy = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for df in frames:
+        ind = indicators.compute_indicators(df['High'], df['Low'], df['Close'], df['Volume'])
+        indicators.last_bar_signals(df['Close'], df['Volume'], ind)
+    t_vec = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    indicators.last_bar_signals(panel['Close'], panel['Volume'], indicators.compute_indicators(panel['High'], panel['Low'], panel['Close'], panel['Volume']))
+    t_panel = time.perf_counter() - t0
+    print(f"기존 pandas 구현 : {t_legacy * 1000 / len(frames):.3f} ms/종목")
+    print(f"벡터 연산 (종목별): {t_vec * 1000 / len(frames):.3f} ms/종목")
+    print(f"벡터 연산 (패널)  : {t_panel * 1000 / len(frames):.3f} ms/종목 ({len(frames)}종목 일괄)")
@@ -0,0 +1,112 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from utils.ohlcv_store import OHLCVStore
+
+# OHLCVStore 증분 갱신: 가짜 fetcher(원격 일봉) 로 전체 다운로드 결과와 비교
+
+class FakeFetcher:
+    """fdr.DataReader 대신 쓰는 원격 일봉 (upstream 을 바꿔 가며 새 거래일/장중 값 변경을 흉내)"""
+    def __init__(self, days=300, seed=0):
+        rng = np.random.default_rng(seed)
+        index = pd.bdate_range("2025-01-02", periods=days, name='Date')
+        close = np.round(10000 * np.exp(np.cumsum(rng.normal(0, 0.02, days))), -1)
+        self.upstream = pd.DataFrame({'Open': close * 0.99, 'High': close * 1.01, 'Low': close * 0.98, 'Close': close,
+                                      'Volume': rng.integers(1000, 10**6, days)}, index=index)
+        self.upstream['Change'] = self.upstream['Close'].pct_change()
+        self.visible = days - 5 # 아직 "오늘"이 오지 않은 마지막 5일은 숨김
+        self.calls = []
+        self.fail = False
+
+    def advance(self, days):
+        self.visible += days
+
+    def __call__(self, symbol, start=None, end=None):
+        self.calls.append(start)
+        if self.fail: raise ConnectionError("offline")
+        df = self.upstream.iloc[:self.visible]
+        if start is not None: df = df[df.index >= pd.Timestamp(start)]
+        return df.copy()
+
+    def full(self, start):
+        df = self.upstream.iloc[:self.visible]
+        return df[df.index >= pd.Timestamp(start)]
+
+def assert_same(actual, expected):
+    pd.testing.assert_frame_equal(actual, expected, check_freq=False)
+
+def test_tail_append_matches_full_fetch(tmp_path):
+    fetcher = FakeFetcher()
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=0)
+    assert_same(store.history("005930", "2025-03-03"), fetcher.full("2025-03-03"))
+    last_day = fetcher.full("2025-03-03").index[-1]
+    # 장중 값이던 마지막 날 종가가 바뀌고 새 거래일 3일 추가
+    fetcher.upstream.loc[last_day, 'Close'] += 50
+    fetcher.advance(3)
+    assert_same(store.history("005930", "2025-03-03"), fetcher.full("2025-03-03"))
+    assert fetcher.calls == ["2025-03-03", last_day.strftime("%Y-%m-%d")] # 두 번째는 마지막 저장일부터만
+    # 새 인스턴스(다음 실행) 도 디스크에서 같은 결과
+    fetcher.advance(2)
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=0)
+    assert_same(store.history("005930", "2025-03-03"), fetcher.full("2025-03-03"))
+    assert store.misses == 1 and len(fetcher.calls) == 3
+
+def test_earlier_start_refetches_head(tmp_path):
+    fetcher = FakeFetcher()
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=3600)
+    store.history("005930", "2025-06-02")
+    assert_same(store.history("005930", "2025-02-03"), fetcher.full("2025-02-03"))
+    assert fetcher.calls == ["2025-06-02", "2025-02-03"]
+    # 보유 구간 안쪽 요청은 다시 받지 않음
+    assert_same(store.history("005930", "2025-04-01", "2025-05-30"), fetcher.full("2025-04-01").loc[:"2025-05-30"])
+    assert len(fetcher.calls) == 2
+
+def test_fresh_data_is_served_locally(tmp_path):
+    fetcher = FakeFetcher()
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=3600)
+    store.history("005930", "2025-03-03")
+    store.history("005930", "2025-03-03")
+    OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=3600).history("005930", "2025-03-03")
+    assert len(fetcher.calls) == 1
+    assert (store.hits, store.misses) == (1, 1)
+
+def test_fetch_failure_falls_back_to_local(tmp_path):
+    fetcher = FakeFetcher()
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=0)
+    expected = store.history("005930", "2025-03-03")
+    fetcher.fail = True
+    assert_same(store.history("005930", "2025-03-03"), expected)
+    with pytest.raises(ConnectionError):
+        store.history("000660", "2025-03-03") # 로컬 데이터가 없으면 오류 그대로
+
+@pytest.mark.parametrize("damage", ["garbage_data", "truncated_data", "stale_meta", "garbage_meta", "missing_data"])
+def test_damaged_files_are_refetched(tmp_path, damage):
+    fetcher = FakeFetcher()
+    OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=3600).history("005930", "2025-03-03")
+    data_path, meta_path = OHLCVStore(cache_dir=str(tmp_path))._paths("005930")
+    if damage == "garbage_data":
+        open(data_path, "wb").write(b"not a numpy file")
+    elif damage == "truncated_data":
+        raw = open(data_path, "rb").read()
+        open(data_path, "wb").write(raw[:len(raw) // 2])
+    elif damage == "stale_meta":
+        # 데이터만 새로 교체되고 메타 교체 전에 중단된 경우: 같은 shape, 다른 마지막 날짜
+        arr = np.load(data_path)
+        arr[0] += 1
+        np.save(data_path, arr)
+    elif damage == "garbage_meta":
+        open(meta_path, "w").write("{")
+    else:
+        os.remove(data_path)
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=3600)
+    assert_same(store.history("005930", "2025-03-03"), fetcher.full("2025-03-03"))
+    assert len(fetcher.calls) == 2
+
+def test_memory_frames_are_bounded(tmp_path):
+    fetcher = FakeFetcher()
+    store = OHLCVStore(cache_dir=str(tmp_path), fetcher=fetcher, refresh_after=3600, max_frames=2)
+    for symbol in ("005930", "000660", "035420", "005930"):
+        store.history(symbol, "2025-03-03")
+    assert list(store._frames) == ["035420", "005930"]
+    assert len(fetcher.calls) == 3 # 메모리에서 밀려난 티커도 디스크에서 다시 읽음
@@ -0,0 +1,90 @@
+import threading
+import time
+import pytest
+from utils.pipeline import Pipeline
+
+# DAG 실행기: 선행 노드 순서, 실패 시 기본값 대체/전파, 임계 경로
+
+class Log:
+    """노드별 시작/종료 순서 기록"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.events = []
+
+    def stage(self, name, value=None, seconds=0.0, error=None):
+        def fn(**inputs):
+            with self._lock: self.events.append(('start', name, inputs))
+            time.sleep(seconds)
+            with self._lock: self.events.append(('end', name, inputs))
+            if error: raise error
+            return value
+        return fn
+
+    def index(self, kind, name):
+        return next(i for i, (k, n, _) in enumerate(self.events) if (k, n) == (kind, name))
+
+    def ran(self):
+        return [n for k, n, _ in self.events if k == 'start']
+
+@pytest.mark.parametrize("workers", [1, 8])
+def test_deps_finish_before_dependents(workers):
+    log = Log()
+    pipe = Pipeline("test", max_workers=workers)
+    pipe.add('semi', log.stage('semi', ['005930'], 0.02)).add('news', log.stage('news', "뉴스", 0.01))
+    pipe.add('candidates', log.stage('candidates', ['000660']), deps=['semi'])
+    pipe.add('enriched', lambda candidates, semi: semi + candidates, deps=['candidates', 'semi'])
+    results = pipe.run()
+    assert results == {'semi': ['005930'], 'news': "뉴스", 'candidates': ['000660'], 'enriched': ['005930', '000660']}
+    assert log.index('end', 'semi') < log.index('start', 'candidates')
+    assert log.events[log.index('start', 'candidates')][2] == {'semi': ['005930']} # 선행 노드 결과를 키워드 인자로
+    if workers == 1:
+        assert log.ran() == ['semi', 'news', 'candidates'] # 등록 순서대로 순차 실행
+
+def test_independent_nodes_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5) # 동시에 실행되지 않으면 BrokenBarrierError
+    pipe = Pipeline("test", max_workers=4)
+    pipe.add('a', lambda: barrier.wait()).add('b', lambda: barrier.wait())
+    assert set(pipe.run()) == {'a', 'b'}
+
+def test_default_replaces_failed_stage_and_propagates():
+    log = Log()
+    pipe = Pipeline("test")
+    pipe.add('sectors', log.stage('sectors', error=RuntimeError("timeout")), default=[])
+    pipe.add('report', log.stage('report', "보고서"), deps=['sectors'])
+    results = pipe.run()
+    assert results == {'sectors': [], 'report': "보고서"}
+    assert log.events[log.index('start', 'report')][2] == {'sectors': []} # 의존 단계는 기본값을 입력으로 받음
+    assert pipe.timings['sectors']['ok'] is False and pipe.timings['report']['ok'] is True
+
+@pytest.mark.parametrize("workers", [1, 8])
+def test_required_failure_stops_dependents(workers):
+    log = Log()
+    pipe = Pipeline("test", max_workers=workers)
+    pipe.add('analysis', log.stage('analysis', error=ValueError("no data")))
+    pipe.add('slow', log.stage('slow', "ok", 0.05))
+    pipe.add('picks', log.stage('picks'), deps=['analysis'])
+    with pytest.raises(ValueError, match="no data"):
+        pipe.run()
+    assert 'picks' not in log.ran()
+    if workers > 1:
+        # 이미 실행 중이던 노드는 끝까지 기다린 뒤 예외 전달
+        assert ('end', 'slow') in [(k, n) for k, n, _ in log.events]
+
+def test_critical_path_follows_latest_dependency():
+    log = Log()
+    pipe = Pipeline("test")
+    pipe.add('index_history', log.stage('index_history', seconds=0.08)).add('semi', log.stage('semi', seconds=0.01))
+    pipe.add('news', log.stage('news', seconds=0.05))
+    pipe.add('charts', log.stage('charts', seconds=0.01), deps=['semi', 'index_history'])
+    pipe.run()
+    assert pipe.critical_path() == ['index_history', 'charts']
+    summary = pipe.summary()
+    assert summary['critical_path'] == ['index_history', 'charts']
+    assert summary['wall_ms'] < summary['serial_ms'] # 독립 단계가 겹쳐 실행됨
+
+def test_add_rejects_unknown_and_duplicate_nodes():
+    pipe = Pipeline("test").add('a', lambda: 1)
+    with pytest.raises(ValueError):
+        pipe.add('a', lambda: 2)
+    with pytest.raises(ValueError):
+        pipe.add('b', lambda c: c, deps=['c'])
@@ -0,0 +1,34 @@
+from datetime import datetime
+import requests
+from agents import data_analyst
+from utils.replay import FixtureBundle
+from utils.synthetic_bundle import SyntheticSource
+
+# 기록/재생 번들: 기록한 응답을 그대로 재생하고, 재생 중 고정한 시계는 close() 후 원래대로
+
+def record(path):
+    bundle = FixtureBundle(str(path), mode='record')
+    bundle.manifest['recorded_at'] = "2026-03-06T08:30:00"
+    request = requests.Request("GET", "https://finance.naver.com/sise/").prepare()
+    bundle.record_response(request, SyntheticSource().respond(request))
+    bundle.save()
+    bundle.close()
+
+def test_replay_returns_recorded_response(tmp_path):
+    record(tmp_path)
+    bundle = FixtureBundle(str(tmp_path))
+    try:
+        res = bundle.http_client().get("https://finance.naver.com/sise/")
+        assert res.status_code == 200 and 'KOSPI_now' in res.text
+    finally:
+        bundle.close()
+
+def test_frozen_clock_is_restored_on_close(tmp_path):
+    record(tmp_path)
+    bundle = FixtureBundle(str(tmp_path))
+    bundle.freeze_clock()
+    try:
+        assert data_analyst.datetime.now() == datetime(2026, 3, 6, 8, 30)
+    finally:
+        bundle.close()
+    assert data_analyst.datetime is datetime
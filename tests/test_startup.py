@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+import benchmark
+
+# main 모듈 import 시점에 무거운 라이브러리(LAZY_MODULES)를 불러오지 않는지, import 시간이 예산 안인지 확인
+# 테스트 환경(CI 러너/느린 디스크) 잡음을 감안해 benchmark.py --startup 기본 예산의 3배를 쓴다
+
+STARTUP_TEST_BUDGET_MS = 300
+
+def test_main_import_is_lazy():
+    env = dict(os.environ, MPLBACKEND="Agg")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=benchmark.ROOT, env=env,
+                          capture_output=True, text=True, encoding="utf-8", errors="replace")
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    rows = benchmark.import_subtree(benchmark.parse_importtime(proc.stderr), "main")
+    loaded = {name.split(".")[0] for name, _, _, _ in rows}
+    assert [name for name in benchmark.LAZY_MODULES if name in loaded] == []
+
+def test_main_import_within_budget():
+    assert benchmark.check_startup(budget_ms=STARTUP_TEST_BUDGET_MS, repeat=3)
+
+def test_import_subtree_excludes_interpreter_startup():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 | site",
+        "import time:        50 |         50 |     pandas.core",
+        "import time:       200 |        250 |   pandas",
+        "import time:        10 |        260 | main",
+    ])
+    rows = benchmark.import_subtree(benchmark.parse_importtime(stderr), "main")
+    assert [name for name, _, _, _ in rows] == ["pandas.core", "pandas", "main"]
@@ -0,0 +1,179 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+def safe_filename(key):
+    """캐시 키 -> 파일 이름으로 쓸 수 있는 문자열 (영숫자/_.- 외 문자는 _)"""
+    return re.sub(r'[^0-9A-Za-z_.-]', '_', str(key))
+
+def atomic_write(path, data):
+    """임시 파일에 쓴 뒤 os.replace 로 교체 (읽는 쪽은 이전 파일 또는 완성된 새 파일만 봄). data: bytes 또는 str"""
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        if isinstance(data, bytes):
+            with open(tmp_path, "wb") as f: f.write(data)
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f: f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try: os.remove(tmp_path)
+        except OSError: pass
+        raise
+
+class KeyedLocks:
+    """키별 Lock (같은 키의 로드/갱신은 한 스레드만, 다른 키는 동시에)"""
+    def __init__(self):
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, key):
+        with self._lock:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def clear(self):
+        with self._lock:
+            self._locks.clear()
+
+class RunCache:
+    """실행(run) 단위 메모리 캐시 - 같은 키는 스레드가 여러 개여도 한 번만 로드
+
+    persist_dir 를 지정하면 값을 JSON 파일로도 저장하여, ttl(초) 이내의 다음 실행에서 재사용한다.
+    """
+    def __init__(self, persist_dir=None, ttl=None):
+        self.persist_dir = persist_dir
+        self.ttl = ttl
+        self._data = {}
+        self._key_lock = KeyedLocks()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, hit):
+        with self._lock:
+            if hit: self.hits += 1
+            else: self.misses += 1
+
+    def get_or_load(self, key, loader):
+        """캐시에 있으면 반환, 없으면 loader()를 호출해 저장 후 반환"""
+        with self._key_lock(key):
+            if key in self._data:
+                self._count(hit=True)
+                return self._data[key]
+            value = self._load_persisted(key)
+            if value is not None:
+                self._count(hit=True)
+            else:
+                self._count(hit=False)
+                value = loader()
+                self._persist(key, value)
+            self._data[key] = value
+            return value
+
+    def _path(self, key):
+        return os.path.join(self.persist_dir, safe_filename(key) + ".json")
+
+    def _load_persisted(self, key):
+        if not self.persist_dir: return None
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - os.path.getmtime(path) > self.ttl: return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _persist(self, key, value):
+        if not self.persist_dir or value is None: return
+        try:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            atomic_write(self._path(key), json.dumps(value, ensure_ascii=False))
+        except (OSError, TypeError, ValueError) as e:
+            print(f"캐시 저장 실패 ({key}): {e}")
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+        self._key_lock.clear()
+
+class ByteLRUCache:
+    """크기 제한 LRU 바이트 캐시 (렌더링 결과 등)
+
+    메모리는 max_bytes, persist_dir 지정 시 디스크는 max_disk_bytes 를 넘으면 오래 안 쓴 항목부터 삭제한다.
+    """
+    def __init__(self, max_bytes=32 * 1024 * 1024, persist_dir=None, max_disk_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.persist_dir = persist_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.persist_dir, safe_filename(key) + ".bin")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+        value = None
+        if self.persist_dir:
+            try:
+                with open(self._path(key), "rb") as f:
+                    value = f.read()
+                os.utime(self._path(key)) # 디스크 LRU 순서 갱신
+            except OSError:
+                value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._put_memory(key, value)
+        return value
+
+    def put(self, key, value):
+        if value is None: return
+        self._put_memory(key, value)
+        if self.persist_dir:
+            try:
+                os.makedirs(self.persist_dir, exist_ok=True)
+                atomic_write(self._path(key), value)
+                self._evict_disk()
+            except OSError as e:
+                print(f"캐시 저장 실패 ({key}): {e}")
+
+    def _put_memory(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._size -= len(self._data.pop(key))
+            if len(value) > self.max_bytes: return
+            self._data[key] = value
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, old = self._data.popitem(last=False)
+                self._size -= len(old)
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.persist_dir):
+            if not name.endswith(".bin"): continue
+            path = os.path.join(self.persist_dir, name)
+            try: entries.append((os.path.getmtime(path), os.path.getsize(path), path))
+            except OSError: continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes: break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
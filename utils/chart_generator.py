@@ -1,81 +1,204 @@
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+import io
+import matplotlib
+matplotlib.use("Agg") # pyplot 을 쓰는 코드가 있어도 GUI 백엔드를 띄우지 않도록 비대화형 백엔드 고정
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
+import re
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
+from utils.cache import ByteLRUCache
+from utils.fonts import get_font_service
+from utils.profiler import get_profiler, timed
+
+# Bump when the rendering code changes so stale cached charts are not reused
+RENDER_VERSION = 1
+
+# Chart output formats: raster PNG (120 dpi) or vector SVG (embedded as PDF paths by fpdf2, sharp at any zoom)
+CHART_FORMATS = ('png', 'svg')
+
+# matplotlib's font/text caches are not thread-safe: in-process renders from different pipeline threads take turns
+# (pool workers are single-threaded, so the lock is uncontended there)
+_render_lock = threading.Lock()
 
 class ChartGenerator:
-    def __init__(self, design_config):
+    def __init__(self, design_config, cache=None, chart_format=None):
+        self.design_config = design_config
+        self.chart_format = (chart_format or os.getenv("CHART_FORMAT", "png")).lower()
+        if self.chart_format not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format: {self.chart_format} (choose from {', '.join(CHART_FORMATS)})")
+        # Content-addressed render cache (CHART_CACHE_DIR, default .cache/charts; cache=False disables it)
+        if cache is None:
+            cache = ByteLRUCache(persist_dir=os.getenv("CHART_CACHE_DIR", os.path.join(".cache", "charts")))
+        self.cache = cache or None
+        if self.cache: get_profiler().register_cache('chart', self.cache)
         self.colors = design_config['colors']
         self.fonts = design_config['fonts']
         
         # 0-255 RGB를 matplotlib을 위한 0-1 스케일로 변환
         self.m_colors = {k: tuple(c/255 for c in v) for k, v in self.colors.items() if isinstance(v, tuple) and len(v) == 3}
         
-        # 폰트 설정 (한글 깨짐 방지)
-        font_path = os.path.join(os.getcwd(), "malgun.ttf")
-        if not os.path.exists(font_path):
-            font_path = r"C:\Windows\Fonts\malgun.ttf"
-            
-        if os.path.exists(font_path):
-            font_prop = fm.FontProperties(fname=font_path)
-            plt.rcParams['font.family'] = font_prop.get_name()
-        
-        plt.rcParams['axes.unicode_minus'] = False
+        # 폰트 설정 (한글 깨짐 방지) - 프로세스 당 1회 등록
+        get_font_service().setup_matplotlib()
+
+    def _new_figure(self, figsize):
+        """pyplot 전역 상태를 쓰지 않는 Agg Figure 생성 (스레드/프로세스 병렬 렌더링 가능)"""
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
 
-    def create_candle_chart(self, df, ticker, output_path, title=None, view_days=None):
-        """Standardized daily candle chart (Calculates MAs on full data, plots view_days)"""
+    def _draw_candles(self, ax, plot_df, box_width):
+        """Draw all wicks and bodies as two pre-colored LineCollections (one pass over NumPy arrays)"""
+        opens, closes = plot_df['Open'].to_numpy(dtype=float), plot_df['Close'].to_numpy(dtype=float)
+        highs, lows = plot_df['High'].to_numpy(dtype=float), plot_df['Low'].to_numpy(dtype=float)
+        x = np.arange(len(plot_df))
+        colors = np.where((closes >= opens)[:, None], self.m_colors['up'], self.m_colors['down'])
+        ax.vlines(x, lows, highs, colors=colors, linewidth=1)
+        ax.vlines(x, np.minimum(opens, closes), np.maximum(opens, closes), colors=colors, linewidth=box_width)
+
+    def create_candle_chart(self, df, ticker, output_path=None, title=None, view_days=None):
+        """Standardized daily candle chart.
+
+        With output_path the PNG is written to disk and True/False is returned;
+        without it the rendered PNG bytes (or None on failure) are returned for in-memory embedding.
+        """
+        image = self.render_candle_chart(df, ticker, title=title, view_days=view_days)
+        return self._deliver(image, output_path, ticker)
+
+    def _deliver(self, image, output_path, ticker):
+        """Return the PNG bytes, or write them to output_path and return True/False"""
+        if output_path is None:
+            return image
+        if image is None:
+            return False
+        try:
+            with open(output_path, "wb") as f:
+                f.write(image)
+            return True
+        except Exception as e:
+            print(f"Chart save failed ({ticker}): {e}")
+            return False
+
+    @timed("chart.render")
+    def render_candle_chart(self, df, ticker, title=None, view_days=None):
+        """Render the candle chart to PNG/SVG bytes per chart_format (served from the render cache when the data is unchanged)"""
+        plot_df = self._prepare_plot(df, ticker, view_days)
+        if plot_df is None:
+            return None
+        key = self.chart_key(plot_df, title, view_days)
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        with _render_lock:
+            image = self._render_candles(plot_df, ticker, title)
+        if self.cache:
+            self.cache.put(key, image)
+        return image
+
+    def _prepare_plot(self, df, ticker, view_days):
+        """Calculates MAs on full data and slices the view_days window (None if data is insufficient)"""
         if len(df) < 5:
             print(f"Chart data insufficient ({ticker})")
-            return False
+            return None
 
-        # Moving Averages (Calculated on full data)
+        # Moving Averages (Calculated on full data, reused if the analysis frame already has them)
         df = df.copy()
-        df['MA5'] = df['Close'].rolling(window=5).mean()
-        df['MA20'] = df['Close'].rolling(window=20).mean()
-        df['MA60'] = df['Close'].rolling(window=60).mean()
+        for window in (5, 20, 60):
+            if f'MA{window}' not in df.columns:
+                df[f'MA{window}'] = df['Close'].rolling(window=window).mean()
 
         # Slice for viewing
         if view_days:
-            plot_df = df.tail(view_days).reset_index(drop=True)
-        else:
-            plot_df = df.reset_index(drop=True)
+            return df.tail(view_days).reset_index(drop=True)
+        return df.reset_index(drop=True)
 
+    def chart_key(self, plot_df, title, view_days):
+        """Cache key from the plotted window, chart options and the Designer palette/fonts"""
+        h = hashlib.sha256()
+        h.update(np.ascontiguousarray(plot_df[['Open', 'High', 'Low', 'Close', 'MA5', 'MA20', 'MA60']].to_numpy(dtype='float64')).tobytes())
+        h.update(repr((RENDER_VERSION, self.chart_format, title, view_days, sorted(self.colors.items()), sorted(self.fonts.items()))).encode())
+        return h.hexdigest()
+
+    def _render_candles(self, plot_df, ticker, title):
         # Dynamic figure size based on context (Main vs Table)
-        plt.figure(figsize=(8, 4) if title else (6, 3))
+        fig = self._new_figure((8, 4) if title else (6, 3))
+        ax = fig.add_subplot()
         
-        # Candles
-        for i in range(len(plot_df)):
-            open_p, close_p = plot_df['Open'].iloc[i], plot_df['Close'].iloc[i]
-            high_p, low_p = plot_df['High'].iloc[i], plot_df['Low'].iloc[i]
-            
-            color = self.m_colors['up'] if close_p >= open_p else self.m_colors['down']
-            plt.vlines(i, low_p, high_p, color=color, linewidth=1)
-            # Body width: thicker for main chart
-            box_width = 5 if title else (8 if len(plot_df) <= 20 else 4)
-            plt.vlines(i, min(open_p, close_p), max(open_p, close_p), color=color, linewidth=box_width)
+        # Candles (Body width: thicker for main chart)
+        box_width = 5 if title else (8 if len(plot_df) <= 20 else 4)
+        self._draw_candles(ax, plot_df, box_width)
 
         # MA Lines
-        plt.plot(plot_df['MA5'].values, color='gold', linewidth=1.5, label='MA5', alpha=0.9)
-        plt.plot(plot_df['MA20'].values, color='magenta', linewidth=1.5, label='MA20', alpha=0.9)
-        plt.plot(plot_df['MA60'].values, color='cyan', linewidth=1.5, label='MA60', alpha=0.9)
+        ax.plot(plot_df['MA5'].values, color='gold', linewidth=1.5, label='MA5', alpha=0.9)
+        ax.plot(plot_df['MA20'].values, color='magenta', linewidth=1.5, label='MA20', alpha=0.9)
+        ax.plot(plot_df['MA60'].values, color='cyan', linewidth=1.5, label='MA60', alpha=0.9)
 
         if title:
-            plt.title(f"{title} (Dynamic Trend)", fontsize=14, fontweight='bold', color=self.m_colors['primary'])
-            plt.legend(loc='upper left', fontsize=9)
-            plt.grid(True, linestyle='--', alpha=0.3)
-            plt.tick_params(labelsize=9)
+            ax.set_title(f"{title} (Dynamic Trend)", fontsize=14, fontweight='bold', color=self.m_colors['primary'])
+            ax.legend(loc='upper left', fontsize=9)
+            ax.grid(True, linestyle='--', alpha=0.3)
+            ax.tick_params(labelsize=9)
         else:
-            plt.axis('off') # Clean look for table embedding
+            ax.axis('off') # Clean look for table embedding
             
-        plt.tight_layout(pad=0.5 if title else 0)
+        fig.tight_layout(pad=0.5 if title else 0)
         
         try:
-            plt.savefig(output_path, dpi=120, bbox_inches='tight', transparent=not title)
-            plt.close()
-            return True
+            return self._save_figure(fig, transparent=not title)
         except Exception as e:
-            print(f"Chart save failed ({ticker}): {e}")
-            return False
+            print(f"Chart render failed ({ticker}): {e}")
+            return None
+
+    @timed("chart.savefig")
+    def _save_figure(self, fig, **kwargs):
+        """Figure -> image bytes in the configured chart_format"""
+        buf = io.BytesIO()
+        if self.chart_format == 'svg':
+            # Date/Creator metadata dropped and a fixed id salt so identical charts produce identical bytes
+            with matplotlib.rc_context({'svg.hashsalt': 'chart', 'svg.fonttype': 'path'}):
+                fig.savefig(buf, format='svg', bbox_inches='tight', metadata={'Date': None, 'Creator': None}, **kwargs)
+            # fpdf2 does not read <metadata> (and logs a warning per chart), so drop it
+            return re.sub(rb'<metadata>.*?</metadata>\s*', b'', buf.getvalue(), count=1, flags=re.S)
+        fig.savefig(buf, format='png', dpi=120, bbox_inches='tight', **kwargs)
+        return buf.getvalue()
+
+    @timed("chart.render_batch")
+    def render_batch(self, jobs, max_workers=None):
+        """Render many candle charts in a process pool.
+
+        jobs: list of (df, ticker, output_path, options) where options are create_candle_chart kwargs
+        (title, view_days). output_path None keeps the chart in memory.
+        Returns per-job results in input order: PNG bytes (in-memory) or True (written) on success, None/False on failure.
+        """
+        jobs = [tuple(job) + (None, {})[len(job) - 2:] for job in jobs]
+        if max_workers == 1 or len(jobs) <= 1:
+            return [_run_chart_job(job, self) for job in jobs]
+
+        # Cache lookups happen here; only misses are sent to the pool (rendered in memory, stored on return)
+        results, pending = [None] * len(jobs), []
+        for i, (df, ticker, output_path, options) in enumerate(jobs):
+            plot_df = self._prepare_plot(df, ticker, (options or {}).get('view_days'))
+            if plot_df is None:
+                results[i] = self._deliver(None, output_path, ticker)
+                continue
+            key = self.chart_key(plot_df, (options or {}).get('title'), (options or {}).get('view_days'))
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                results[i] = self._deliver(cached, output_path, ticker)
+            else:
+                pending.append((i, key, (df, ticker, None, options)))
+        if pending:
+            workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(), initializer=_init_chart_worker, initargs=(self.design_config, self.chart_format)) as pool:
+                for (i, key, job), image in zip(pending, pool.map(_run_chart_job, [job for _, _, job in pending])):
+                    if self.cache: self.cache.put(key, image)
+                    results[i] = self._deliver(image, jobs[i][2], jobs[i][1])
+        return results
 
     def create_sector_chart(self, sectors, output_path):
         """Sector performance bar chart (Top 10)"""
@@ -92,21 +215,105 @@ class ChartGenerator:
         
         colors = [self.m_colors['up'] if v > 0 else self.m_colors['down'] for v in values]
         
-        plt.figure(figsize=(8, 5))
-        bars = plt.barh(names, values, color=colors, alpha=0.8)
+        fig = self._new_figure((8, 5))
+        ax = fig.add_subplot()
+        bars = ax.barh(names, values, color=colors, alpha=0.8)
         
-        plt.title("Top Sectors Performance (Today)", fontsize=13, fontweight='bold', color=self.m_colors['primary'])
-        plt.axvline(0, color='black', linewidth=0.8)
-        plt.grid(axis='x', linestyle='--', alpha=0.3)
-        plt.tick_params(labelsize=10)
-        plt.tight_layout()
+        ax.set_title("Top Sectors Performance (Today)", fontsize=13, fontweight='bold', color=self.m_colors['primary'])
+        ax.axvline(0, color='black', linewidth=0.8)
+        ax.grid(axis='x', linestyle='--', alpha=0.3)
+        ax.tick_params(labelsize=10)
+        fig.tight_layout()
         
         try:
-            plt.savefig(output_path, dpi=120)
-            plt.close()
+            fig.savefig(output_path, dpi=120)
             return True
         except Exception as e:
             print(f"Sector chart save failed: {e}")
             return False
 
+# Process-pool worker state (one ChartGenerator per worker process)
+_worker_generator = None
+_context = None
+
+def _pool_context():
+    """Start method for the chart pool. render_batch is called from pipeline/daemon threads, and forking a
+    multithreaded process can copy held locks (logging, matplotlib, urllib3) into the child, so use forkserver
+    (workers fork from a clean server that already imported this module) or spawn where forkserver is unavailable."""
+    global _context
+    if _context is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            _context = multiprocessing.get_context("forkserver")
+            _context.set_forkserver_preload([__name__])
+        else:
+            _context = multiprocessing.get_context("spawn")
+    return _context
+
+def _init_chart_worker(design_config, chart_format='png'):
+    global _worker_generator
+    _worker_generator = ChartGenerator(design_config, cache=False, chart_format=chart_format) # the parent process owns the cache
+
+def _run_chart_job(job, generator=None):
+    df, ticker, output_path, options = job
+    try:
+        return (generator or _worker_generator).create_candle_chart(df, ticker, output_path, **(options or {}))
+    except Exception as e:
+        print(f"Chart render failed ({ticker}): {e}")
+        return None if output_path is None else False
+
+if __name__ == "__main__":
+    # Candle renderer benchmark: per-bar vlines loop (before) vs two pre-colored collections (after)
+    # Run from the repo root: python -m utils.chart_generator
+    import time
+    from agents.designer import Designer
+
+    def draw_candles_per_bar(gen, ax, plot_df, box_width):
+        for i in range(len(plot_df)):
+            open_p, close_p = plot_df['Open'].iloc[i], plot_df['Close'].iloc[i]
+            high_p, low_p = plot_df['High'].iloc[i], plot_df['Low'].iloc[i]
+            color = gen.m_colors['up'] if close_p >= open_p else gen.m_colors['down']
+            ax.vlines(i, low_p, high_p, color=color, linewidth=1)
+            ax.vlines(i, min(open_p, close_p), max(open_p, close_p), color=color, linewidth=box_width)
+
+    rng = np.random.default_rng(0)
+    close = 2500 + np.cumsum(rng.normal(0, 20, 120))
+    open_ = close + rng.normal(0, 15, 120)
+    df = pd.DataFrame({'Open': open_, 'High': np.maximum(open_, close) + rng.uniform(0, 10, 120),
+                       'Low': np.minimum(open_, close) - rng.uniform(0, 10, 120), 'Close': close})
+    gen = ChartGenerator(Designer().get_config(), cache=False)
+    repeat = 10
+
+    for label, kwargs in [("Index chart (120 bars)", {'title': "KOSPI"}), ("Table chart (20 bars)", {'view_days': 20})]:
+        timings = {}
+        for mode in ("before", "after"):
+            if mode == "before":
+                gen._draw_candles = lambda ax, plot_df, w: draw_candles_per_bar(gen, ax, plot_df, w)
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                gen.create_candle_chart(df, "BENCH", os.devnull, **kwargs)
+            timings[mode] = (time.perf_counter() - t0) / repeat * 1000
+            ax = gen._new_figure((8, 4)).add_subplot()
+            gen._draw_candles(ax, df.tail(kwargs.get('view_days') or len(df)).reset_index(drop=True), 5)
+            timings[mode + "_artists"] = len(ax.collections)
+            gen.__dict__.pop('_draw_candles', None)
+        print(f"{label}: before {timings['before']:.1f} ms / {timings['before_artists']} collections, "
+              f"after {timings['after']:.1f} ms / {timings['after_artists']} collections")
 
+    # Raster vs vector: render time, chart size, PDF embed time and final PDF size (10 table charts + 1 index chart)
+    from fpdf import FPDF
+    print(f"\n{'format':8s} {'render(ms)':>11s} {'chart(KB)':>10s} {'embed(ms)':>10s} {'PDF(KB)':>9s}")
+    for fmt in CHART_FORMATS:
+        fmt_gen = ChartGenerator(Designer().get_config(), cache=False, chart_format=fmt)
+        jobs = [{'title': "KOSPI"}] + [{'view_days': 20}] * 10
+        t0 = time.perf_counter()
+        images = [fmt_gen.render_candle_chart(df, "BENCH", **kwargs) for kwargs in jobs]
+        t_render = (time.perf_counter() - t0) / len(jobs) * 1000
+        pdf = FPDF(orientation='L', unit='mm', format='A4')
+        pdf.add_page()
+        t0 = time.perf_counter()
+        pdf.image(io.BytesIO(images[0]), x=10, y=10, w=180, h=90)
+        for i, image in enumerate(images[1:]):
+            pdf.image(io.BytesIO(image), x=10 + (i % 5) * 55, y=110 + (i // 5) * 40, w=50, h=25)
+        pdf_bytes = bytes(pdf.output())
+        t_embed = (time.perf_counter() - t0) * 1000
+        print(f"{fmt:8s} {t_render:11.1f} {sum(map(len, images)) / len(images) / 1024:10.1f} {t_embed:10.1f} {len(pdf_bytes) / 1024:9.1f}")
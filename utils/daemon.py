@@ -0,0 +1,148 @@
+import copy
+import json
+import queue
+import signal
+import threading
+import time
+import traceback
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# 상주 실행 모드 (python main.py --daemon)
+# 한 프로세스에서 오전/오후 보고서를 schedule 로 반복 실행한다. 무거운 라이브러리 import, 폰트 등록,
+# HTTP 커넥션 풀, 일봉/차트 캐시, KRX 상장 목록은 실행 간 그대로 유지되고 시세 캐시만 실행마다 비운다.
+# 실행은 작업 큐 하나로 직렬화 (스케줄 실행과 수동 실행이 겹치면 차례로 처리).
+# 수동 실행: --trigger-port 지정 시 127.0.0.1 전용 HTTP
+#   POST /run?mode=morning  -> 큐에 추가 (202)
+#   GET  /status            -> 실행 중/대기/최근 실행 기록 (JSON)
+
+MODES = ('morning', 'afternoon')
+HISTORY_SIZE = 20
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+class ReportDaemon:
+    def __init__(self, args, run_fn, warm_up=None):
+        """run_fn(args, warm): 보고서 1회 생성 / warm_up(args, warm): 시작 시 상주 객체 미리 생성"""
+        self.args = args
+        self.run_fn = run_fn
+        self.warm_up = warm_up
+        self.warm = {}
+        self.jobs = queue.Queue()
+        self.history = []
+        self.running = None
+        self._lock = threading.Lock()
+        self._server = None
+
+    def submit(self, mode, source="manual"):
+        """보고서 실행 요청을 큐에 추가 -> 대기 순번"""
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 모드: {mode} (가능: {', '.join(MODES)})")
+        self.jobs.put((mode, source))
+        print(f"[daemon] {mode} 보고서 실행 예약 ({source}, 대기 {self.jobs.qsize()}건)")
+        return self.jobs.qsize()
+
+    def status(self):
+        import schedule
+        with self._lock:
+            return {
+                'running': self.running, 'queued': self.jobs.qsize(), 'history': list(self.history),
+                'next_runs': sorted(job.next_run.isoformat(timespec='minutes') for job in schedule.get_jobs() if job.next_run)
+            }
+
+    def _run(self, mode, source):
+        args = copy.copy(self.args)
+        args.mode = mode
+        started = datetime.now()
+        with self._lock:
+            self.running = {'mode': mode, 'source': source, 'started_at': started.isoformat(timespec='seconds')}
+        t0 = time.perf_counter()
+        error = None
+        try:
+            outputs = self.run_fn(args, self.warm)
+            ok = outputs is not None and all(r['ok'] for r in outputs.values())
+        except Exception as e:
+            traceback.print_exc()
+            ok, error = False, str(e)
+        entry = {'mode': mode, 'source': source, 'started_at': started.isoformat(timespec='seconds'),
+                 'seconds': round(time.perf_counter() - t0, 1), 'ok': ok, 'error': error}
+        with self._lock:
+            self.running = None
+            self.history = (self.history + [entry])[-HISTORY_SIZE:]
+        print(f"[daemon] {mode} 보고서 {'완료' if ok else '실패'} ({entry['seconds']} s)")
+
+    def _worker(self):
+        while True:
+            job = self.jobs.get()
+            if job is None: break
+            self._run(*job)
+
+    def _serve_triggers(self, port):
+        daemon = self
+
+        class TriggerHandler(BaseHTTPRequestHandler):
+            def _reply(self, code, body):
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if urlparse(self.path).path == "/status":
+                    self._reply(200, daemon.status())
+                else:
+                    self._reply(404, {'error': 'not found'})
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path != "/run":
+                    return self._reply(404, {'error': 'not found'})
+                mode = parse_qs(url.query).get('mode', [daemon.args.mode])[0]
+                try:
+                    position = daemon.submit(mode, source="http")
+                except ValueError as e:
+                    return self._reply(400, {'error': str(e)})
+                self._reply(202, {'queued': mode, 'position': position})
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), TriggerHandler)
+        threading.Thread(target=self._server.serve_forever, name="daemon-trigger", daemon=True).start()
+        print(f"[daemon] 수동 실행 대기: http://127.0.0.1:{port}/run?mode=morning (POST), /status (GET)")
+
+    def serve(self):
+        """스케줄 등록 후 종료(Ctrl+C / SIGTERM) 전까지 실행"""
+        import schedule
+        args = self.args
+        signal.signal(signal.SIGTERM, _raise_interrupt) # 서비스 관리자(systemd 등)의 종료 신호도 Ctrl+C 와 같게 처리
+        if self.warm_up:
+            t0 = time.perf_counter()
+            self.warm_up(args, self.warm)
+            print(f"[daemon] 상주 객체 준비 완료 ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
+        schedule.every().day.at(args.morning_at).do(self.submit, 'morning', source="schedule")
+        schedule.every().day.at(args.afternoon_at).do(self.submit, 'afternoon', source="schedule")
+        print(f"[daemon] 스케줄: 오전 {args.morning_at} / 오후 {args.afternoon_at}")
+
+        worker = threading.Thread(target=self._worker, name="daemon-worker")
+        worker.start()
+        if args.trigger_port:
+            self._serve_triggers(args.trigger_port)
+        try:
+            while True:
+                schedule.run_pending()
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("[daemon] 종료 요청 - 진행 중인 실행을 마친 뒤 종료합니다.")
+        finally:
+            schedule.clear()
+            if self._server: self._server.shutdown()
+            while not self.jobs.empty(): # 아직 시작하지 않은 요청은 버림
+                self.jobs.get_nowait()
+            self.jobs.put(None)
+            worker.join()
@@ -0,0 +1,65 @@
+import os
+import threading
+
+# 보고서/차트 공용 한글 폰트 (FONT_PATH 환경변수 > 작업 폴더 malgun.ttf > Windows 기본 폰트)
+FONT_CANDIDATES = [
+    os.path.join(os.getcwd(), "malgun.ttf"),
+    r"C:\Windows\Fonts\malgun.ttf"
+]
+
+def find_font_path():
+    for path in [os.getenv("FONT_PATH")] + FONT_CANDIDATES:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+class FontService:
+    """프로세스 당 한 번만 폰트 파일을 찾아 matplotlib 과 fpdf 에 함께 제공
+
+    - matplotlib: fontManager 에 한 번 등록 (FT2Font 파싱 1회) 후 rcParams 의 font.family 로 지정
+    - fpdf: 문서마다 기본 스타일을 add_font 로 한 번 파싱하고, 같은 파일을 쓰는 "B" 스타일은 그 폰트를 공유
+      (문서 안에서는 TTF 재파싱 없음, PDF 에는 사용한 글자만 담긴 서브셋 1개만 임베딩됨)
+      파싱된 폰트를 문서 사이에 공유하는 공개 API 가 없어 문서당 1회 파싱은 남는다 (공유하는 것은 경로 탐색뿐)
+    """
+    def __init__(self, path=None):
+        self.path = path or find_font_path()
+        self.family_name = None # matplotlib 에 등록된 폰트 이름
+        self._lock = threading.Lock()
+        self._mpl_ready = False
+
+    def setup_matplotlib(self):
+        """matplotlib 에 폰트 등록 (여러 번 호출해도 한 번만 수행)"""
+        import matplotlib
+        from matplotlib import font_manager as fm
+        with self._lock:
+            if not self._mpl_ready:
+                if self.path:
+                    fm.fontManager.addfont(self.path)
+                    self.family_name = fm.FontProperties(fname=self.path).get_name()
+                self._mpl_ready = True
+        if self.family_name:
+            matplotlib.rcParams['font.family'] = self.family_name
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        return self.family_name
+
+    def register_pdf(self, pdf, family, styles=("", "B")):
+        """fpdf 문서에 폰트 등록 - 기본 스타일 1회 파싱, 나머지 스타일은 같은 폰트로 연결"""
+        if not self.path:
+            raise FileNotFoundError("malgun.ttf 폰트를 찾을 수 없습니다 (FONT_PATH 환경변수로 지정 가능)")
+        pdf.add_font(family, fname=self.path)
+        if hasattr(pdf, "share_font_styles"):
+            pdf.share_font_styles(family, [s for s in styles if s])
+        else:
+            for style in styles:
+                if style: pdf.add_font(family, style=style, fname=self.path)
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_font_service():
+    """프로세스 공용 FontService"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = FontService()
+        return _service
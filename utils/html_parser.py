@@ -0,0 +1,100 @@
+import os
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+from utils.profiler import timed
+
+# 사용할 파서 백엔드: lxml 이 설치되어 있으면 lxml, 아니면 내장 html.parser (HTML_PARSER 환경변수로 강제 가능)
+def _detect_backend():
+    forced = os.getenv("HTML_PARSER")
+    if forced: return forced
+    try:
+        import lxml # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+BACKEND = _detect_backend()
+
+# finance.naver.com 페이지는 EUC-KR(cp949) 로 내려온다
+DEFAULT_ENCODING = "cp949"
+
+# 페이지 종류별로 실제 사용하는 영역만 파싱하기 위한 필터 (None 이면 전체 파싱)
+PAGE_SUBTREES = {
+    'sector_list': lambda: SoupStrainer('table', class_='type_5'),     # sise_group.naver (table.type_5 tr)
+    'sector_detail': lambda: SoupStrainer('table', class_='type_5'),   # sise_group_detail.naver (td.name a, div.name_area a)
+    'volume_rank': lambda: SoupStrainer('table', class_='type_2'),     # sise_quant.naver (a.tltle)
+    'main_news': lambda: SoupStrainer(class_='articleSubject'),        # news/mainnews.naver (.articleSubject a)
+    'item_news': lambda: SoupStrainer(class_=['title', 'info']),       # item/news_news.naver (.title a, .info)
+    'item_main': None,                                                 # 필요한 요소가 여러 영역에 흩어져 있어 전체 파싱
+    'market_index': None
+}
+
+def _normalize_encoding(encoding):
+    if not encoding: return DEFAULT_ENCODING
+    encoding = encoding.lower()
+    return "cp949" if encoding in ("euc-kr", "euckr", "ks_c_5601-1987") else encoding
+
+def response_encoding(res, default=DEFAULT_ENCODING):
+    """Content-Type 헤더의 charset (없으면 default) - res.text 의 인코딩 추측을 거치지 않는다"""
+    match = re.search(r'charset=([\w-]+)', res.headers.get('Content-Type', ''), re.I)
+    return _normalize_encoding(match.group(1) if match else default)
+
+def make_soup(markup, page=None, encoding=DEFAULT_ENCODING):
+    """bytes/str 로부터 BeautifulSoup 생성 (선택된 백엔드 + 페이지별 부분 파싱)"""
+    if isinstance(markup, bytes):
+        markup = markup.decode(_normalize_encoding(encoding), errors='replace')
+    strainer = PAGE_SUBTREES.get(page)
+    return BeautifulSoup(markup, BACKEND, parse_only=strainer() if strainer else None)
+
+def parse_response(res, page=None):
+    """requests 응답을 알려진 인코딩으로 직접 디코딩해 파싱"""
+    with timed(f"html.parse.{page or 'page'}"):
+        return make_soup(res.content, page=page, encoding=response_encoding(res))
+
+if __name__ == "__main__":
+    # 저장된 네이버 페이지로 파싱 벤치마크: python -m utils.html_parser [페이지 폴더]
+    # 파일명은 "<페이지종류>_*.html" (예: sector_list_0.html, item_main_005930.html)
+    # 폴더를 주지 않으면 utils.naver_samples 의 합성 페이지를 임시 폴더에 만들어 사용
+    import sys
+    import time
+    import glob
+    import shutil
+    import tempfile
+    from charset_normalizer import from_bytes
+    from utils.naver_samples import write_samples
+
+    if len(sys.argv) > 1:
+        fixture_dir = sys.argv[1]
+    else:
+        fixture_dir = tempfile.mkdtemp(prefix="naver_samples_")
+        write_samples(fixture_dir)
+        import atexit
+        atexit.register(shutil.rmtree, fixture_dir, ignore_errors=True)
+    paths = sorted(glob.glob(os.path.join(fixture_dir, "*.html")))
+    if not paths:
+        print(f"벤치마크용 페이지가 없습니다: {fixture_dir}/<페이지종류>_*.html")
+        sys.exit(1)
+
+    repeat = 5
+    print(f"백엔드: {BACKEND}, 반복 {repeat}회")
+    print(f"{'파일':40s} {'크기(KB)':>9s} {'기존(ms)':>9s} {'개선(ms)':>9s}")
+    total_old = total_new = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        page = next((k for k in PAGE_SUBTREES if os.path.basename(path).startswith(k)), None)
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            BeautifulSoup(str(from_bytes(raw).best()), 'html.parser') # res.text 방식: 인코딩 추측 + html.parser 전체 파싱
+        t_old = (time.perf_counter() - t0) / repeat * 1000
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            make_soup(raw, page=page)
+        t_new = (time.perf_counter() - t0) / repeat * 1000
+
+        total_old += t_old
+        total_new += t_new
+        print(f"{os.path.basename(path)[:40]:40s} {len(raw) / 1024:9.1f} {t_old:9.2f} {t_new:9.2f}")
+    print(f"{'합계':40s} {'':9s} {total_old:9.2f} {total_new:9.2f} (x{total_old / max(total_new, 1e-9):.1f})")
@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.profiler import get_profiler
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+class CappedRetry(Retry):
+    """Retry-After 대기 시간에 상한을 둔 재시도 정책 (서버가 긴 값을 보내도 보고서 실행 전체가 멈추지 않게)"""
+    def __init__(self, *args, max_retry_after=30, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def get_retry_after(self, response):
+        seconds = super().get_retry_after(response)
+        return None if seconds is None else min(seconds, self.max_retry_after)
+
+class HttpClient:
+    """에이전트 공용 HTTP 클라이언트
+
+    - 호스트별 keep-alive 커넥션 풀 재사용 (requests.Session + HTTPAdapter)
+    - 기본 연결/읽기 타임아웃 (무한 대기 방지)
+    - 5xx/429 응답 및 연결 오류 시 지수 백오프 재시도 (GET/HEAD 만, POST 는 중복 발송 방지를 위해 재시도 안 함)
+      Retry-After 헤더는 따르되 max_retry_after 초까지만 대기
+    - transport 로 requests 어댑터를 교체하면 로컬 스텁 서버 등으로 요청을 돌릴 수 있음
+    """
+    def __init__(self, timeout=(5, 15), retries=3, backoff=0.5, pool_size=16, transport=None, headers=None, max_retry_after=30):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        self.retry = CappedRetry(
+            total=retries, connect=retries, read=retries, status=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            max_retry_after=max_retry_after,
+            raise_on_status=False
+        )
+        self.mount(transport or HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=self.retry))
+
+    def mount(self, transport):
+        """http/https 요청을 처리할 어댑터(transport) 교체"""
+        self.session.mount("http://", transport)
+        self.session.mount("https://", transport)
+
+    @staticmethod
+    def wire_bytes(response):
+        """응답 본문의 전송 크기 (gzip 등 압축 해제 전): 실제 소켓에서 읽은 바이트 -> Content-Length -> 본문 길이 순"""
+        raw = getattr(response, 'raw', None)
+        if raw is not None and hasattr(raw, 'tell'):
+            try:
+                return raw.tell()
+            except (OSError, ValueError):
+                pass
+        length = response.headers.get('Content-Length')
+        return int(length) if length and length.isdigit() else len(response.content)
+
+    def request(self, method, url, **kwargs):
+        """요청 + 호스트별 요청 수/전송 바이트/소요 시간 기록 (실행 프로파일)"""
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except Exception:
+            get_profiler().record_request(urlsplit(url).netloc, 0, (time.perf_counter() - start) * 1000, ok=False)
+            raise
+        get_profiler().record_request(urlsplit(url).netloc, self.wire_bytes(response), (time.perf_counter() - start) * 1000, ok=response.ok)
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+class LocalStubTransport(HTTPAdapter):
+    """모든 요청을 base_url(예: http://127.0.0.1:8000) 로 돌리는 테스트용 transport
+
+    원래 호스트는 X-Original-Host 헤더로 전달되어 스텁 서버가 응답을 구분할 수 있다.
+    재시도 정책까지 검증하려면 max_retries=client.retry 를 함께 넘긴다.
+    """
+    def __init__(self, base_url, **kwargs):
+        super().__init__(**kwargs)
+        self.base = urlsplit(base_url)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.headers['X-Original-Host'] = parts.netloc
+        request.url = urlunsplit((self.base.scheme, self.base.netloc, parts.path, parts.query, parts.fragment))
+        return super().send(request, **kwargs)
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """프로세스 공용 HttpClient (HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT / HTTP_RETRIES / HTTP_MAX_RETRY_AFTER 환경변수로 조정)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(
+                timeout=(float(os.getenv("HTTP_CONNECT_TIMEOUT", 5)), float(os.getenv("HTTP_READ_TIMEOUT", 15))),
+                retries=int(os.getenv("HTTP_RETRIES", 3)),
+                max_retry_after=float(os.getenv("HTTP_MAX_RETRY_AFTER", 30))
+            )
+        return _client
+
+def set_client(client):
+    """공용 클라이언트 교체 (테스트/재생 모드 등)"""
+    global _client
+    with _client_lock:
+        _client = client
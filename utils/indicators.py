@@ -0,0 +1,89 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 기술적 지표 벡터 연산 모듈
+# 모든 함수는 1차원(단일 종목) 또는 2차원(종목 x 일자, 마지막 축이 시간) 배열을 받는다.
+# 결측(NaN) 처리와 초기 구간은 pandas rolling(window).mean() 과 동일하게 맞춘다.
+
+def sma(values, window):
+    """단순 이동평균 (window 안에 NaN 이 있거나 데이터가 부족하면 NaN)"""
+    values = np.asarray(values, dtype='float64')
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] >= window:
+        out[..., window - 1:] = sliding_window_view(values, window, axis=-1).mean(axis=-1)
+    return out
+
+def diff(values):
+    """1기간 차분 (첫 값 NaN)"""
+    values = np.asarray(values, dtype='float64')
+    out = np.full(values.shape, np.nan)
+    out[..., 1:] = values[..., 1:] - values[..., :-1]
+    return out
+
+def shift(values):
+    """1기간 지연 (첫 값 NaN)"""
+    values = np.asarray(values, dtype='float64')
+    out = np.full(values.shape, np.nan)
+    out[..., 1:] = values[..., :-1]
+    return out
+
+def rsi(close, period=14):
+    """RSI (단순 이동평균 방식)"""
+    close = np.asarray(close, dtype='float64')
+    delta = diff(close)
+    missing = np.isnan(close) # 패널 앞쪽 NaN 구간은 0 으로 채우지 않음 (이력이 짧은 종목도 종목별 계산과 같은 값)
+    gain = sma(np.where(missing, np.nan, np.where(delta > 0, delta, 0)), period)
+    loss = sma(np.where(missing, np.nan, np.where(delta < 0, -delta, 0)), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - (100 / (1 + (gain / loss)))
+
+def dmi(high, low, close, period=14):
+    """DMI/ADX -> (+DI, -DI, ADX)"""
+    high = np.asarray(high, dtype='float64')
+    low = np.asarray(low, dtype='float64')
+    prev_close = shift(close)
+    tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    atr = sma(tr, period)
+    up, down = diff(high), shift(low) - low
+    pdm = sma(np.where((up > down) & (up > 0), up, 0), period)
+    mdm = sma(np.where((down > up) & (down > 0), down, 0), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pdi, mdi = 100 * (pdm / atr), 100 * (mdm / atr)
+        dx = 100 * np.abs(pdi - mdi) / (pdi + mdi)
+    return pdi, mdi, sma(dx, period)
+
+def obv(close, volume):
+    """OBV(On-Balance Volume) - 첫 값은 0"""
+    direction = np.nan_to_num(np.sign(diff(close)))
+    volume = np.asarray(volume)
+    step = np.where(direction != 0, direction * volume, 0)
+    step[..., 0] = 0
+    return np.cumsum(step, axis=-1)
+
+def compute_indicators(high, low, close, volume):
+    """analyze_technical 에서 쓰는 지표 전체 계산 (종목 x 일자 패널도 가능)"""
+    close = np.asarray(close, dtype='float64')
+    _, _, adx = dmi(high, low, close)
+    return {
+        'MA5': sma(close, 5), 'MA20': sma(close, 20), 'MA60': sma(close, 60), 'MA120': sma(close, 120),
+        'V_MA20': sma(volume, 20), 'RSI': rsi(close), 'ADX': adx, 'OBV': obv(close, volume)
+    }
+
+def last_bar_signals(close, volume, ind):
+    """마지막 봉 기준 매매 시그널 (analyze_technical 결과와 동일한 키)"""
+    close = np.asarray(close, dtype='float64')
+    volume = np.asarray(volume, dtype='float64')
+    last, prev = close[..., -1], close[..., -2]
+    last_vol, v_ma20 = volume[..., -1], ind['V_MA20'][..., -1]
+    adx = ind['ADX'][..., -1]
+    recent_obv = ind['OBV'][..., -5:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_rate = ((last - prev) / prev) * 100
+    return {
+        'close': last, 'change_rate': change_rate, 'rsi': ind['RSI'][..., -1], 'adx': adx,
+        'is_perfect': (ind['MA5'][..., -1] > ind['MA20'][..., -1]) & (ind['MA20'][..., -1] > ind['MA60'][..., -1]) & (ind['MA60'][..., -1] > ind['MA120'][..., -1]),
+        'is_breakout': (last > prev) & (last_vol > v_ma20 * 2),
+        'is_pullback': (last <= prev) & (last_vol < v_ma20 * 0.5),
+        'strong_trend': adx > 25, 'volume': last_vol, 'v_ma20': v_ma20,
+        'is_obv_rising': np.all(recent_obv[..., 1:] > recent_obv[..., :-1], axis=-1) if recent_obv.shape[-1] >= 5 else np.zeros(last.shape, dtype=bool)
+    }
@@ -0,0 +1,112 @@
+import os
+import random
+
+# 네이버 금융 페이지 구조를 흉내 낸 합성 샘플 페이지 (실제 페이지는 저장소에 두지 않음)
+# 스크래퍼가 쓰는 선택자(table.type_5, td.name a, div.name_area a, a.tltle, .articleSubject a, #_pbr ...)는 실제와 같은 위치에 두고,
+# 상단 메뉴/스크립트/하단 영역은 실제 페이지 크기(수십~백여 KB)에 맞춰 채운다.
+# 파일명은 html_parser 벤치마크 규칙("<페이지종류>_*.html")을 따르고, 본문은 실제와 같이 EUC-KR(cp949) 로 저장한다.
+#   python -m utils.naver_samples [폴더]   (기본 fixtures/naver)
+
+SECTORS = ["반도체와반도체장비", "디스플레이장비및부품", "자동차", "조선", "은행", "증권", "제약", "생물공학", "화학", "철강",
+           "건설", "게임엔터테인먼트", "양방향미디어와서비스", "전기장비", "전자장비와기기", "항공사", "해운사", "식품", "화장품", "통신장비"]
+STOCKS = ["삼성전자", "SK하이닉스", "한미반도체", "리노공업", "이오테크닉스", "원익IPS", "HPSP", "솔브레인", "동진쎄미켐", "주성엔지니어링",
+          "현대차", "기아", "LG에너지솔루션", "NAVER", "카카오", "셀트리온", "POSCO홀딩스", "KB금융", "삼성바이오로직스", "LG화학"]
+
+def _code(rng):
+    return f"{rng.randint(0, 999999):06d}"
+
+def _chrome(rng, title, body):
+    """상단 메뉴 + 스크립트 + 본문 + 하단 영역"""
+    menu = "".join(f'<li class="menu_{i}"><a href="/sise/menu{i}.naver" onclick="clickcr(this, \'lnb.menu{i}\', \'\', \'\', event);">메뉴 {i}</a></li>' for i in range(120))
+    script = "".join(f'<script type="text/javascript">var _cfg{i} = {{"id": "{rng.getrandbits(64):x}", "area": "lnb", "index": {i}}};</script>' for i in range(40))
+    footer = "".join(f'<p class="notice">본 정보는 투자 참고용이며 {i}번 항목의 정확성을 보장하지 않습니다. 데이터 제공: 한국거래소, 코스콤</p>' for i in range(60))
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+            f'<title>{title} : 네이버 금융</title>{script}</head><body><div id="header"><ul class="lnb">{menu}</ul></div>'
+            f'<div id="content">{body}</div><div id="footer">{footer}</div></body></html>')
+
+def _signed(rng, scale=3.0):
+    value = rng.uniform(-scale, scale)
+    return f"{'+' if value >= 0 else '-'}{abs(value):.2f}%"
+
+def sector_list(rng):
+    rows = "".join(
+        f'<tr><td style="padding-left:10px;"><a href="/sise/sise_group_detail.naver?type=upjong&no={200 + i}">{name}</a></td>'
+        f'<td class="number"><span class="tah p11">{_signed(rng)}</span></td><td class="number">{rng.randint(5, 80)}</td>'
+        f'<td class="number">{rng.randint(0, 30)}</td><td class="number">{rng.randint(0, 50)}</td></tr>'
+        for i, name in enumerate(SECTORS * 4))
+    return _chrome(rng, "업종별 시세", f'<table class="type_5" summary="업종별 시세"><tr><th>업종명</th><th>전일대비</th></tr>{rows}</table>')
+
+def sector_detail(rng):
+    rows = "".join(
+        f'<tr><td class="name"><div class="name_area"><a href="/item/main.naver?code={_code(rng)}">{name}</a></div></td>'
+        + "".join(f'<td class="number">{rng.randint(100, 900000):,}</td>' for _ in range(9))
+        + f'<td class="number">{rng.randint(-500000, 500000)}</td><td class="number">{rng.randint(-500000, 500000)}</td></tr>'
+        for name in STOCKS * 3)
+    return _chrome(rng, "업종 상세", f'<table class="type_5" summary="업종별 종목 시세">{rows}</table>')
+
+def volume_rank(rng):
+    rows = "".join(
+        f'<tr><td class="no">{i + 1}</td><td><a href="/item/main.naver?code={_code(rng)}" class="tltle">{name}</a></td>'
+        + "".join(f'<td class="number">{rng.randint(100, 900000):,}</td>' for _ in range(10)) + '</tr>'
+        for i, name in enumerate(STOCKS * 5))
+    return _chrome(rng, "거래상위", f'<table class="type_2" summary="거래상위 종목">{rows}</table>')
+
+def main_news(rng):
+    items = "".join(
+        f'<li class="block1"><dl><dd class="articleSubject"><a href="/news/news_read.naver?article_id={rng.randint(10**9, 10**10)}">'
+        f'{rng.choice(STOCKS)}, {rng.choice(SECTORS)} 업황 개선 기대에 강세</a></dd>'
+        f'<dd class="articleSummary">외국인 순매수가 이어지며 관련 종목이 일제히 올랐다. <span class="press">경제신문</span></dd></dl></li>'
+        for _ in range(20))
+    return _chrome(rng, "주요뉴스", f'<div class="mainNewsList"><ul class="newsList">{items}</ul></div>')
+
+def item_news(rng):
+    rows = "".join(
+        f'<tr><td class="title"><a href="/item/news_read.naver?article_id={rng.randint(10**9, 10**10)}">{rng.choice(STOCKS)} 실적 발표 앞두고 목표주가 상향</a></td>'
+        f'<td class="info">경제신문</td><td class="date">2026.10.{rng.randint(1, 28):02d} 09:{rng.randint(0, 59):02d}</td></tr>'
+        for _ in range(20))
+    return _chrome(rng, "종목뉴스", f'<table class="type5"><tbody>{rows}</tbody></table>')
+
+def item_main(rng):
+    profits = sorted(rng.randint(1000, 90000) for _ in range(4))
+    analysis = (f'<div class="section cop_analysis"><table class="tb_type1">'
+                f'<tr><th>매출액</th>' + "".join(f'<td>{rng.randint(10**5, 10**6):,}</td>' for _ in range(10)) + '</tr>'
+                f'<tr><th>영업이익</th>' + "".join(f'<td>{p:,}</td>' for p in profits) + '<td>-</td></tr>'
+                f'<tr><th>영업이익률</th>' + "".join(f'<td>{rng.uniform(1, 30):.2f}</td>' for _ in range(10)) + '</tr>'
+                f'<tr><th>ROE(지배주주)</th>' + "".join(f'<td>{rng.uniform(1, 25):.2f}</td>' for _ in range(10)) + '</tr></table></div>')
+    summary = (f'<div class="wrap_company"><h2><a href="#">{rng.choice(STOCKS)}</a></h2></div>'
+               f'<div class="summary_info"><p>반도체 제조 장비와 소재를 공급하는 기업입니다.</p><p>주요 고객사 증설에 따라 수주가 늘고 있습니다.</p></div>'
+               f'<em id="_market_sum">\n\t\t{rng.randint(1, 400)}조 {rng.randint(0, 9999):,}</em>'
+               f'<em id="_per">{rng.uniform(5, 40):.2f}</em><em id="_pbr">{rng.uniform(0.3, 6):.2f}</em>'
+               f'<em id="_target_money">{rng.randint(10, 300) * 1000:,}</em>')
+    return _chrome(rng, "종목 메인", summary + analysis)
+
+def market_index(rng):
+    def index(name):
+        return (f'<span id="{name}_now">{rng.uniform(700, 3000):,.2f}</span>'
+                f'<span id="{name}_change">{rng.uniform(0, 30):.2f}<span class="blind">상승</span> {_signed(rng)}</span>')
+    pop = "".join(f'<li><span class="nm">{label}</span>{rng.randint(1, 20):,}조원</li>' for label in ("거래량", "거래대금", "개인", "외국인"))
+    return _chrome(rng, "국내증시", index("KOSPI") + f'<ul class="lst_pop">{pop}</ul>' + index("KOSDAQ"))
+
+PAGES = {
+    'sector_list': sector_list, 'sector_detail': sector_detail, 'volume_rank': volume_rank, 'main_news': main_news,
+    'item_news': item_news, 'item_main': item_main, 'market_index': market_index
+}
+
+def write_samples(out_dir, per_page=2, seed=0):
+    """페이지 종류별 per_page 개 샘플을 out_dir 에 저장 -> 파일 경로 목록"""
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for page, build in PAGES.items():
+        for i in range(per_page):
+            path = os.path.join(out_dir, f"{page}_{i}.html")
+            with open(path, "wb") as f:
+                f.write(build(rng).encode("cp949"))
+            paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    import sys
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join("fixtures", "naver")
+    paths = write_samples(out_dir)
+    print(f"샘플 페이지 {len(paths)}개 저장: {out_dir} ({sum(os.path.getsize(p) for p in paths) / 1024:.0f} KB)")
@@ -0,0 +1,131 @@
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from utils.cache import KeyedLocks, atomic_write, safe_filename
+
+class OHLCVStore:
+    """티커별 일봉(OHLCV) 로컬 저장소
+
+    컬럼별로 연속 배치한 float64 배열(.npy, memory-map 로드)과 메타데이터(.json)로 저장하고,
+    로컬에 없는 최근 구간(마지막 저장일 ~ 오늘)만 추가로 내려받아 이어 붙인다.
+    메타데이터에 배열 shape 와 마지막 날짜를 함께 기록해, 두 파일이 서로 맞지 않으면(저장 도중 중단 등) 로컬 데이터 없음으로 보고 다시 받는다.
+    메모리에는 최근 사용한 max_frames 개 티커만 유지 (상주 실행에서 무한히 늘지 않도록).
+    """
+    def __init__(self, cache_dir=None, fetcher=None, refresh_after=1800, max_frames=None):
+        self.cache_dir = cache_dir or os.getenv("OHLCV_CACHE_DIR", os.path.join(".cache", "ohlcv"))
+        self.fetcher = fetcher
+        self.refresh_after = refresh_after # 초 단위, 이 시간 안에 동기화된 티커는 재요청하지 않음
+        self.max_frames = max_frames or int(os.getenv("OHLCV_MEMORY_FRAMES", 512))
+        self._frames = OrderedDict() # 티커 -> (DataFrame, meta), LRU
+        self._symbol_lock = KeyedLocks()
+        self._lock = threading.Lock()
+        # 적중 = 다운로드 없이 로컬 데이터로 응답, 실패 = 일부/전체 구간 다운로드
+        self.hits = 0
+        self.misses = 0
+
+    def _fetch(self, symbol, start=None, end=None):
+        if self.fetcher:
+            return self.fetcher(symbol, start, end)
+        import FinanceDataReader as fdr
+        return fdr.DataReader(symbol, start, end)
+
+    def _paths(self, symbol):
+        base = os.path.join(self.cache_dir, safe_filename(symbol))
+        return base + ".npy", base + ".json"
+
+    def _load(self, symbol):
+        """디스크에서 (DataFrame, meta) 로드, 없거나 읽을 수 없거나 두 파일이 맞지 않으면 (None, {})"""
+        data_path, meta_path = self._paths(symbol)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            arr = np.load(data_path, mmap_mode='r')
+            last_day = int(arr[0, -1]) if arr.shape[1] else None
+            if arr.dtype != np.float64 or list(arr.shape) != meta['shape'] or arr.shape[0] != len(meta['columns']) + 1 or last_day != meta['last_day']:
+                raise ValueError(f"데이터/메타 불일치 {arr.shape}/{last_day} != {meta.get('shape')}/{meta.get('last_day')}")
+            index = pd.to_datetime(np.asarray(arr[0], dtype='int64'), unit='D')
+            index.name = meta.get('index_name', 'Date')
+            df = pd.DataFrame({col: np.array(arr[i + 1]) for i, col in enumerate(meta['columns'])}, index=index)
+            for col, dtype in meta.get('dtypes', {}).items():
+                if dtype.startswith('int'):
+                    df[col] = df[col].fillna(0).astype(dtype)
+        except FileNotFoundError:
+            return None, {}
+        except Exception as e:
+            print(f"OHLCV 로컬 데이터 손상, 다시 받습니다 ({symbol}): {e}")
+            return None, {}
+        return df, meta
+
+    def _save(self, symbol, df, meta):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data_path, meta_path = self._paths(symbol)
+        numeric = df.select_dtypes(include='number')
+        days = (df.index.values.astype('datetime64[D]').astype('int64')).astype('float64')
+        arr = np.vstack([days] + [numeric[col].to_numpy(dtype='float64') for col in numeric.columns]) if len(df) else np.empty((len(numeric.columns) + 1, 0))
+        meta = dict(meta, columns=list(numeric.columns), dtypes={c: str(numeric[c].dtype) for c in numeric.columns},
+                    index_name=df.index.name or 'Date', shape=list(arr.shape), last_day=int(days[-1]) if len(df) else None)
+        buf = io.BytesIO()
+        np.save(buf, arr)
+        # 데이터 -> 메타 순서로 각각 원자적 교체 (그 사이에 읽으면 shape 검사에서 걸러짐)
+        atomic_write(data_path, buf.getvalue())
+        atomic_write(meta_path, json.dumps(meta))
+        return meta
+
+    def _sync(self, symbol, start):
+        """로컬 데이터를 요청 시작일(start)부터 오늘까지 채운다"""
+        with self._lock:
+            cached = self._frames.get(symbol)
+        df, meta = cached if cached is not None else self._load(symbol)
+
+        covered = meta.get('start', '') if df is not None else None
+        need_head = df is None or (covered is not None and covered != "" and (start is None or start < covered))
+        fresh = time.time() - meta.get('synced_at', 0) < self.refresh_after
+
+        with self._lock:
+            if not need_head and fresh: self.hits += 1
+            else: self.misses += 1
+        if not need_head and fresh:
+            return df, meta
+        try:
+            if need_head or df.empty:
+                # 보유 구간보다 과거가 필요하면 전체 구간을 새로 받는다
+                new_df = self._fetch(symbol, start)
+                meta = {'start': start or ""}
+            else:
+                # 마지막 저장일(장중 값일 수 있으므로 포함)부터 오늘까지만 추가 수집
+                last_day = df.index[-1]
+                tail = self._fetch(symbol, last_day.strftime("%Y-%m-%d"))
+                new_df = pd.concat([df[df.index < last_day], tail]) if len(tail) else df
+                meta = {'start': meta.get('start', "")}
+        except Exception as e:
+            if df is None: raise
+            print(f"OHLCV 갱신 실패, 로컬 데이터 사용 ({symbol}): {e}")
+            return df, meta
+
+        new_df = new_df[~new_df.index.duplicated(keep='last')].sort_index()
+        meta['synced_at'] = time.time()
+        try:
+            meta = self._save(symbol, new_df, meta)
+            new_df = new_df[meta['columns']]
+        except OSError as e:
+            print(f"OHLCV 저장 실패 ({symbol}): {e}")
+        return new_df, meta
+
+    def history(self, symbol, start=None, end=None):
+        """start~end 구간의 일봉 반환 (fdr.DataReader 와 동일한 형태의 DataFrame)"""
+        if start is not None: start = pd.Timestamp(start).strftime("%Y-%m-%d")
+        with self._symbol_lock(symbol):
+            df, meta = self._sync(symbol, start)
+            with self._lock:
+                self._frames[symbol] = (df, meta)
+                self._frames.move_to_end(symbol)
+                while len(self._frames) > self.max_frames:
+                    self._frames.popitem(last=False)
+        if start is not None: df = df[df.index >= pd.Timestamp(start)]
+        if end is not None: df = df[df.index <= pd.Timestamp(end)]
+        return df.copy()
@@ -1,15 +1,32 @@
 from fpdf import FPDF
+import io
 import os
 from datetime import datetime
-import re
+from utils.fonts import get_font_service
+from utils.profiler import timed
+from utils.pdf_layout import ReportLayout, column
+from utils.report_render import stock_text
 
 class StockPDF(FPDF):
+    CONTENT_TOP = 20 # 2페이지부터 header() 다음 본문 시작 y (mm)
+
     def __init__(self, design):
+        self.shared_styles = {} # 패밀리별로 기본 스타일 폰트를 공유하는 스타일 (share_font_styles)
         super().__init__(orientation='L', unit='mm', format='A4') # 가로형 세팅
         self.design_config = design
         self.d_colors = design['colors']
         self.d_fonts = design['fonts']
 
+    def share_font_styles(self, family, styles):
+        """같은 TTF 파일인 스타일(예: "B")은 따로 add_font 하지 않고 기본 스타일 폰트를 사용 (재파싱/중복 임베딩 방지)"""
+        self.shared_styles[family.lower()] = set(styles)
+
+    def set_font(self, family=None, style="", size=0):
+        shared = self.shared_styles.get((family or self.font_family or "").lower())
+        if shared and style:
+            style = "".join(c for c in style.upper() if c not in shared)
+        super().set_font(family, style, size)
+
     def header(self):
         # 헤더는 2페이지부터 표시 (표지 제외)
         if self.page_no() > 1:
@@ -54,6 +71,16 @@ class StockPDF(FPDF):
         self.set_font(self.d_fonts['main'], "", 12)
         self.cell(0, 10, "AI Financial Intelligence Automation Unit")
 
+    def add_chart(self, chart, x, y, w, h):
+        """차트 삽입 - 메모리 이미지(PNG/SVG bytes, BytesIO)는 그대로, 경로는 파일이 있을 때만 (없거나 실패한 차트는 건너뜀)"""
+        if not chart: return False
+        if isinstance(chart, (bytes, bytearray)):
+            chart = io.BytesIO(chart)
+        elif isinstance(chart, str) and not os.path.exists(chart):
+            return False
+        self.image(chart, x=x, y=y, w=w, h=h)
+        return True
+
     def add_section_header(self, title, mode='afternoon'):
         self.ln(5)
         self.set_fill_color(*self.d_colors['bg_light'])
@@ -66,226 +93,201 @@ class StockPDF(FPDF):
         self.line(10, self.get_y(), 287, self.get_y())
         self.ln(5)
 
-def clean_text(text):
-    if not text: return ""
-    text = re.sub(r'#+\s?\[?\d?\]?\s?', '', text)
-    text = re.sub(r'\|.*\|', '', text)
-    text = re.sub(r'\*\*', '', text) # 볼드 마크다운 제거
-    text = re.sub(r'\n+', '\n', text).strip()
-    return text
+def _signed(key):
+    return lambda row: f"{int(row.get(key, 0)):+,}"
 
-def convert_to_pdf_fpdf(data, output_path):
-    print(f"최종 브로커리지 스타일 PDF 생성 시작: {output_path}")
-    
-    # Designer에서 디자인 설정 가져오기
+# 문서 모델 표(table['key']) 별 PDF 스타일 - 컬럼 폭 합계 277mm = A4 가로 본문 폭
+MODEL_TABLE_STYLES = {
+    'global_index': {'widths': [60, 100, 117], 'header_height': 10, 'row_height': 10, 'header_font_size': 11, 'font_size': 11},
+    'market_close': {'widths': [50, 75, 75, 77], 'header_height': 10, 'row_height': 10, 'header_font_size': 11, 'font_size': 11},
+    'picks': {'widths': [30, 20, 30, 22, 25, 25, 25], 'header_height': 12, 'row_height': 18, 'header_font_size': 10, 'font_size': 10, 'zebra': True}
+}
+
+def model_table_spec(table, chart_column=None):
+    """문서 모델 표 -> 표 정의 (chart_column=(헤더, 폭) 이면 행 끝의 차트를 그리는 컬럼 추가)"""
+    style = dict(MODEL_TABLE_STYLES[table['key']])
+    widths = style.pop('widths')
+    columns = [column(header, width, lambda row, i=i: row[i]) for i, (header, width) in enumerate(zip(table['headers'], widths))]
+    if chart_column:
+        columns.append(column(chart_column[0], chart_column[1], lambda row: row[-1], chart=True))
+    return dict(style, columns=columns)
+
+# 컬럼: 종목명, 금일등락, 5일등락, 20일등락, ETF주요구성종목(TOP5), 외인순매수, 기관순매수, 개인순매수
+ETF_TABLE = {
+    'columns': [
+        column("종목명", 45, lambda s: s['name'][:20]),
+        column("금일등락", 20, lambda s: s['rate']),
+        column("5일등락", 20, lambda s: s.get('ret_5d', 'N/A')),
+        column("20일등락", 20, lambda s: s.get('ret_20d', 'N/A')),
+        column("ETF주요구성종목(TOP5)", 82, lambda s: s.get('top_stocks', 'N/A')[:55], align="L"),
+        column("외인순매수", 30, _signed('f_net')),
+        column("기관순매수", 30, _signed('i_net')),
+        column("개인순매수", 30, _signed('p_net'))
+    ],
+    'x': 10, 'header_height': 12, 'row_height': 11, 'header_font_size': 9, 'font_size': 8, 'zebra': True
+}
+
+def appendix_table_spec(sparkline_source):
+    """부록 표 정의 - 스파크라인은 행을 그릴 때 sparkline_source(ticker) 로 종가 배열을 가져와 벡터로 그림"""
+    return {
+        'columns': [
+            column("순위", 12, lambda r: str(r['rank'])),
+            column("종목명", 45, lambda r: r['name'][:16]),
+            column("코드", 20, lambda r: r['ticker']),
+            column("현재가", 25, lambda r: f"{r['close']:,}"),
+            column("등락율", 20, lambda r: f"{r['change_rate']:+.1f}%"),
+            column("기술점수", 18, lambda r: str(r['tech_score'])),
+            column("RSI", 17, lambda r: f"{r['rsi']:.0f}" if r['rsi'] == r['rsi'] else "-"),
+            column("120일 종가 추이", 120, lambda r: sparkline_source(r['ticker']), sparkline=True)
+        ],
+        'header_height': 8, 'row_height': 7, 'header_font_size': 8, 'font_size': 7, 'zebra': True
+    }
+
+def report_sections(data):
+    """보고서 데이터(data['report'] = ResearchEditor.build 문서 모델) -> 섹션 정의 목록 (표지 다음 페이지부터)"""
+    report = data['report']
+    is_morning = (report['mode'] == 'morning')
+    model = {section['key']: section for section in report['sections']}
+    # [ks, kq, p0...p9] - 메모리 이미지(bytes/BytesIO) 또는 기존 방식의 파일 경로
+    charts = data.get("charts") or data.get("chart_paths", [])
+
+    # --- Section 1: 마켓 요약 (오전: 해외 / 오후: 국내 마감) ---
+    market_section = model['market']
+    market = []
+    if len(charts) >= 2:
+        # 지수 일봉 차트
+        market.append({'type': 'charts', 'items': [(charts[0], 15, 125), (charts[1], 152, 125)], 'height': 60, 'advance': 62})
+    market.append({'type': 'table', 'spec': model_table_spec(market_section['table']), 'rows': market_section['table']['rows']})
+    if market_section['paragraphs']:
+        market.append({'type': 'text', 'heading': "[ 시장 종합 분석 및 마감 코멘트 ]", 'body': "\n".join(market_section['paragraphs']), 'font_size': 10, 'line_height': 6})
+
+    # 종목 차트는 지수 차트 2개(0,1) 다음부터
+    picks_section = model['picks']
+    pick_rows = [row + [charts[2 + i] if len(charts) > 2 + i else None] for i, row in enumerate(picks_section['table']['rows'])]
+    articles = picks_section['paragraphs'] + [stock_text(stock) for stock in picks_section['stocks']]
+
+    sections = [
+        {'title': "글로벌 시장 요약 및 대응 전략" if is_morning else "데일리 마켓 마감 브리핑 & 주요 지수 추합", 'blocks': market},
+        {'title': "2. ETF 당일 등락율 상위 10종목 분석", 'blocks': [
+            {'type': 'space', 'height': 10},
+            {'type': 'table', 'spec': ETF_TABLE, 'rows': data.get("etf_trends", [])}
+        ]},
+        {'title': "3. AI-Model Picks 상세 분석 (20일 일봉 차트 및 수급 분석)", 'blocks': [
+            {'type': 'table', 'spec': model_table_spec(picks_section['table'], chart_column=("20일 일봉 차트 (MA5/20/60)", 100)), 'rows': pick_rows}
+        ]},
+        {'title': "4. 종목별 투자포인트 및 정성 분석", 'blocks': [
+            {'type': 'articles', 'items': articles + [f"Disclaimer: {report['disclaimer']}"], 'font_size': 11, 'line_height': 7}
+        ]}
+    ]
+
+    # --- 부록: 스크리닝 통과 종목 전체 (행 수가 많아도 이미지 없이 스파크라인을 그때그때 그림) ---
+    screened = data.get("screened") or []
+    if screened and data.get("sparkline_source"):
+        sections.append({'title': f"부록. 스크리닝 통과 종목 전체 ({len(screened)}종목)", 'blocks': [
+            {'type': 'table', 'spec': appendix_table_spec(data["sparkline_source"]), 'rows': screened}
+        ]})
+    return sections
+
+def build_report(data, dry_run=False):
+    """보고서 StockPDF 생성 (저장 전) - 폰트 등록 실패 시 None"""
     from agents.designer import Designer
     design = Designer().get_config()
-    colors = design['colors']
-    fonts = design['fonts']
-    
+
     pdf = StockPDF(design)
     pdf.set_auto_page_break(auto=True, margin=15)
-    
-    font_path = os.path.join(os.getcwd(), "malgun.ttf")
-    if not os.path.exists(font_path):
-        font_path = r"C:\Windows\Fonts\malgun.ttf"
-    
     try:
-        pdf.add_font(fonts['main'], fname=font_path)
-        pdf.add_font(fonts['main'], style="B", fname=font_path)
+        # 폰트는 1회만 파싱, B 스타일은 같은 폰트 공유 (출력 시 사용한 글자만 서브셋 임베딩)
+        get_font_service().register_pdf(pdf, design['fonts']['main'])
     except Exception as e:
         print(f"폰트 등록 에러: {e}")
-        return False
+        return None
 
-    # 1. 표지 (Cover Page)
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    pdf.add_cover_page(today_str)
-    
-    # 2. 본문 시작 (Page 2)
-    pdf.add_page()
-    page_width = pdf.w - 2 * pdf.l_margin
+    # 표지 (Cover Page) + 본문 (Page 2~)
+    pdf.add_cover_page(datetime.now().strftime("%Y-%m-%d"))
+    ReportLayout(pdf, dry_run=dry_run).render(report_sections(data), mode=data['report']['mode'])
+    return pdf
 
-    draft_md = data.get("draft_md", "")
-    sections = re.split(r'## \d\.\s', draft_md)
+def count_report_pages(data):
+    """차트 삽입/PDF 저장 없이 레이아웃만 계산한 총 페이지 수 (폰트 등록 실패 시 0)"""
+    pdf = build_report(data, dry_run=True)
+    return pdf.page_no() if pdf else 0
 
-    mode = data.get("mode", "afternoon")
-    is_morning = (mode == 'morning')
-    
-    # --- Section 1: 마켓 요약 (오전: 해외 / 오후: 국내 마감) ---
-    s1_title = "글로벌 시장 요약 및 대응 전략" if is_morning else "데일리 마켓 마감 브리핑 & 주요 지수 추합"
-    pdf.add_section_header(s1_title, mode=mode)
-    
-    chart_y_start = pdf.get_y()
-    chart_paths = data.get("chart_paths", []) # [ks, kq, s0...s9, p0...p9]
-    
-    # 지수 일봉 차트 (크기 축소: 130->125, 65->60)
-    if len(chart_paths) >= 2:
-        if os.path.exists(chart_paths[0]): pdf.image(chart_paths[0], x=15, y=chart_y_start, w=125, h=60)
-        if os.path.exists(chart_paths[1]): pdf.image(chart_paths[1], x=152, y=chart_y_start, w=125, h=60)
-        pdf.set_y(chart_y_start + 62)
-
-    # 글로벌/국내 지수 데이터 테이블
-    global_status = data.get("global_status", {})
-    briefing = data.get("market_briefing", {})
-    
-    pdf.set_font(fonts['main'], "B", 11)
-    pdf.set_fill_color(*colors['table_header'])
-    
-    if is_morning and global_status:
-        # 해외 지수 위주 테이블
-        pdf.cell(60, 10, "해외 지수", border=1, align="C", fill=True) 
-        pdf.cell(100, 10, "현재가 (지수)", border=1, align="C", fill=True)
-        pdf.cell(117, 10, "등락률 (밤사이)", border=1, align="C", fill=True)
-        pdf.ln()
-        pdf.set_font(fonts['main'], "", 11)
-        for name, d in global_status.items():
-            pdf.cell(60, 10, name, border=1, align="C")
-            pdf.cell(100, 10, f"{d.get('price', 0):,}", border=1, align="C")
-            pdf.cell(117, 10, f"{d.get('change_rate', 0):+.2f}%", border=1, align="C")
-            pdf.ln()
-    else:
-        # 기존 마감 시황 테이블
-        pdf.cell(50, 10, "시장구분", border=1, align="C", fill=True) 
-        pdf.cell(75, 10, "현재가", border=1, align="C", fill=True)
-        pdf.cell(75, 10, "등락(률)", border=1, align="C", fill=True)
-        pdf.cell(77, 10, "거래대금", border=1, align="C", fill=True)
-        pdf.ln()
-        pdf.set_font(fonts['main'], "", 11)
-        for name, d in [("KOSPI", briefing.get('kospi', {})), ("KOSDAQ", briefing.get('kosdaq', {}))]:
-            pdf.cell(50, 10, name, border=1, align="C")
-            pdf.cell(75, 10, f"{d.get('now', 'N/A')}", border=1, align="C")
-            pdf.cell(75, 10, f"{d.get('change', 'N/A')} ({d.get('rate', 'N/A')})", border=1, align="C")
-            pdf.cell(77, 10, f"{d.get('amount', 'N/A')}", border=1, align="C")
-            pdf.ln()
-    
-    # 자세한 마감 브리핑 텍스트 (줄간격 조절하여 1페이지 내 수용)
-    if len(sections) > 1:
-        pdf.ln(3)
-        pdf.set_font(fonts['main'], "B", 11)
-        pdf.set_text_color(*colors['primary'])
-        pdf.cell(0, 8, "[ 시장 종합 분석 및 마감 코멘트 ]", ln=True)
-        pdf.set_text_color(*colors['text_main'])
-        pdf.set_font(fonts['main'], "", 10)
-        pdf.multi_cell(page_width, 6, clean_text(sections[1])) # 8 -> 6 line spacing
-
-    # --- Section 2: ETF 시장 동향 & 주요 ETF 분석 (Page 3 전용) ---
-    pdf.add_page()
-    pdf.add_section_header("2. ETF 당일 등락율 상위 10종목 분석", mode=mode)
-    
-    etfs = data.get("etf_trends", [])
-    pdf.ln(10)
-    
-    # 섹터 데이터 테이블 (8열 확장)
-    pdf.set_font(fonts['main'], "B", 9)
-    pdf.set_fill_color(*colors['table_header'])
-    # 컬럼: 종목명, 금일등락, 5일등락, 20일등락, ETF주요구성종목(TOP5), 외인순매수, 기관순매수, 개인순매수
-    s_cols = [45, 20, 20, 20, 82, 30, 30, 30] 
-    s_headers = ["종목명", "금일등락", "5일등락", "20일등락", "ETF주요구성종목(TOP5)", "외인순매수", "기관순매수", "개인순매수"]
-    
-    pdf.set_x(10)
-    for i, h in enumerate(s_headers):
-        pdf.cell(s_cols[i], 12, h, border=1, align="C", fill=True)
-    pdf.ln()
-    
-    pdf.set_font(fonts['main'], "", 8)
-    for i, s in enumerate(etfs):
-        fill = (i % 2 == 1)
-        if fill: pdf.set_fill_color(*colors['table_alt'])
-        else: pdf.set_fill_color(255, 255, 255)
-        
-        pdf.set_x(10)
-        pdf.cell(s_cols[0], 11, s['name'][:20], border=1, align="C", fill=fill)
-        pdf.cell(s_cols[1], 11, s['rate'], border=1, align="C", fill=fill)
-        pdf.cell(s_cols[2], 11, s.get('ret_5d', 'N/A'), border=1, align="C", fill=fill)
-        pdf.cell(s_cols[3], 11, s.get('ret_20d', 'N/A'), border=1, align="C", fill=fill)
-        pdf.cell(s_cols[4], 11, s.get('top_stocks', 'N/A')[:55], border=1, align="L", fill=fill)
-        
-        # 수급 데이터 (정수형 콤마 표시)
-        pdf.cell(s_cols[5], 11, f"{int(s.get('f_net', 0)):+,}", border=1, align="C", fill=fill)
-        pdf.cell(s_cols[6], 11, f"{int(s.get('i_net', 0)):+,}", border=1, align="C", fill=fill)
-        pdf.cell(s_cols[7], 11, f"{int(s.get('p_net', 0)):+,}", border=1, align="C", fill=fill)
-        pdf.ln()
-
-    # --- Section 3: AI-Model Picks (Page 4) ---
-    pdf.add_page()
-    pdf.add_section_header("3. AI-Model Picks 상세 분석 (20일 일봉 차트 및 수급 분석)", mode=mode)
-    
-    row_height = 18
-    cols = [30, 20, 30, 22, 25, 25, 25, 100] # Total ~277mm
-    pdf.set_font(fonts['main'], "B", 10) 
-    pdf.set_fill_color(*colors['table_header'])
-    table_headers = ["종목명", "현재가", "시가총액", "등락율", "외인순매수", "기관순매수", "개인순매수", "20일 일봉 차트 (MA5/20/60)"]
-    for i, h in enumerate(table_headers):
-        pdf.cell(cols[i], 12, h, border=1, align="C", fill=True)
-    pdf.ln()
-    
-    pdf.set_font(fonts['main'], "", 10) 
-    for i, p in enumerate(data.get("picks", [])):
-        fill = (i % 2 == 1)
-        if fill: pdf.set_fill_color(*colors['table_alt'])
-        else: pdf.set_fill_color(255, 255, 255)
-        
-        # 페이지 넘김 체크
-        if pdf.get_y() + row_height > 195:
-            pdf.add_page()
-            pdf.set_font(fonts['main'], "B", 10)
-            pdf.set_fill_color(*colors['table_header'])
-            for j, h in enumerate(table_headers):
-                pdf.cell(cols[j], 12, h, border=1, align="C", fill=True)
-            pdf.ln()
-            pdf.set_font(fonts['main'], "", 10)
-            if fill: pdf.set_fill_color(*colors['table_alt'])
-            else: pdf.set_fill_color(255, 255, 255)
-
-        curr_y = pdf.get_y()
-        curr_x = pdf.get_x()
-        
-        pdf.cell(cols[0], row_height, p['name'], border=1, align="C", fill=fill)
-        pdf.cell(cols[1], row_height, f"{p['close']:,}", border=1, align="C", fill=fill)
-        pdf.cell(cols[2], row_height, p.get('market_cap', 'N/A')[:12], border=1, align="C", fill=fill)
-        pdf.cell(cols[3], row_height, f"{p['change_rate']:+.1f}%", border=1, align="C", fill=fill)
-        
-        # 주수 계산으로 출력 (콤마 포함)
-        pdf.cell(cols[4], row_height, f"{int(p['f_net']):+,}", border=1, align="C", fill=fill)
-        pdf.cell(cols[5], row_height, f"{int(p['i_net']):+,}", border=1, align="C", fill=fill)
-        pdf.cell(cols[6], row_height, f"{int(p['p_net']):+,}", border=1, align="C", fill=fill)
-        
-        # 차트 셀 (인덱스 2번부터 종목 차트)
-        pdf.cell(cols[7], row_height, "", border=1, fill=fill)
-        chart_idx = 2 + i  # 지수 차트 2개(0,1) 다음부터 종목 차트
-        if len(chart_paths) > chart_idx and os.path.exists(chart_paths[chart_idx]):
-            pdf.image(chart_paths[chart_idx], x=curr_x + sum(cols[:7]) + 1, y=curr_y + 1, w=98, h=row_height-2)
-        
-        pdf.ln()
-
-    # --- Section: 종목별 투자포인트 및 정성 분석 ---
-    pdf.add_page()
-    pdf.add_section_header("4. 종목별 투자포인트 및 정성 분석", mode=mode)
-    if len(sections) > 5:
-        pdf.set_font(fonts['main'], "", 11) # 10 -> 11
-        # 종목 간 구분을 위해 [DIVIDER] 태그로 분리하여 처리
-        raw_analysis = clean_text(sections[5])
-        stock_blocks = raw_analysis.split("[DIVIDER]")
-        
-        for i, block in enumerate(stock_blocks):
-            clean_block = block.strip()
-            if not clean_block: continue
-            
-            pdf.multi_cell(page_width, 7, clean_block)
-            
-            # 마지막 블록이 아니면 구분선 긋기
-            if i < len(stock_blocks) - 1:
-                pdf.ln(4)
-                pdf.set_draw_color(*colors['bg_light']) # 메인 테마 보조색으로 은은한 선
-                pdf.set_line_width(0.3)
-                pdf.line(pdf.get_x() + 5, pdf.get_y(), pdf.get_x() + page_width - 5, pdf.get_y())
-                pdf.set_draw_color(*colors['primary']) # 다시 기본색으로 복구
-                pdf.ln(6)
+def convert_to_pdf_fpdf(data, output_path):
+    print(f"최종 브로커리지 스타일 PDF 생성 시작: {output_path}")
+    with timed("pdf.build"):
+        pdf = build_report(data)
+    if pdf is None:
+        return False
 
     try:
-        pdf.output(output_path)
-        print(f"Landscape PDF 생성 완료: {output_path}")
+        with timed("pdf.output"):
+            pdf.output(output_path)
+        print(f"Landscape PDF 생성 완료: {output_path} ({os.path.getsize(output_path) / 1024:,.1f} KB)")
         return True
     except Exception as e:
         print(f"PDF 저장 실패: {e}")
         return False
+
+if __name__ == "__main__":
+    # 레이아웃 벤치마크: 한 프로세스에서 보고서 여러 개 생성 (전체 렌더링 vs 페이지 수만 계산하는 dry-run)
+    # 저장소 루트에서 실행: python -m utils.pdf_converter [보고서 수] [종목 수]
+    import sys
+    import time
+    import tempfile
+    import numpy as np
+    import pandas as pd
+    from agents.designer import Designer
+    from agents.editor import ResearchEditor
+    from utils.chart_generator import ChartGenerator
+
+    n_reports = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    n_picks = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    rng = np.random.default_rng(0)
+    close = 2500 + np.cumsum(rng.normal(0, 20, 150))
+    df = pd.DataFrame({'Open': close, 'High': close + 10, 'Low': close - 10, 'Close': close})
+    chart_gen = ChartGenerator(Designer().get_config(), cache=False)
+    index_chart = chart_gen.create_candle_chart(df, "KS11", title="KOSPI")
+    pick_chart = chart_gen.create_candle_chart(df, "BENCH", view_days=20)
+
+    picks = [{'name': f"종목{i}", 'ticker': f"{i:06d}", 'close': 10000 + i, 'market_cap': "1조 2,000억", 'change_rate': 1.2,
+              'f_net': 1000, 'i_net': -500, 'p_net': -500, 'reason': "외인/기관 동반 순매수", 'adx': 30} for i in range(n_picks)]
+    briefing = {'kospi': {'now': "2,500", 'change': "+10", 'rate': "+0.4%", 'amount': "10조"}, 'kosdaq': {}}
+    etfs = [{'name': f"ETF{i}", 'rate': "+1.0%", 'ret_5d': "+2.0%", 'ret_20d': "+3.0%", 'top_stocks': "A, B, C", 'f_net': 1, 'i_net': 2, 'p_net': 3} for i in range(10)]
+    data = {
+        'picks': picks, 'market_briefing': briefing, 'etf_trends': etfs,
+        'report': ResearchEditor().build('afternoon', picks, briefing, ["뉴스"]),
+        'charts': [index_chart, index_chart] + [pick_chart] * n_picks
+    }
+
+    out_dir = tempfile.mkdtemp()
+    for label, run in [("dry-run", lambda i: count_report_pages(data)),
+                       ("전체 렌더링", lambda i: convert_to_pdf_fpdf(data, os.path.join(out_dir, f"report_{i}.pdf")))]:
+        timings = []
+        for i in range(n_reports):
+            t0 = time.perf_counter()
+            run(i)
+            timings.append((time.perf_counter() - t0) * 1000)
+        print(f"{label}: 첫 보고서 {timings[0]:.1f} ms, 이후 평균 {np.mean(timings[1:] or timings):.1f} ms ({n_reports}개)")
+    print(f"페이지 수: {count_report_pages(data)}")
+
+    # 부록 벤치마크: 스크리닝 종목 10/100/1,000 행 (스파크라인은 행을 그릴 때 생성) - 시간, 페이지, 크기, 최대 메모리
+    import tracemalloc
+
+    def synthetic_closes(ticker, days=120):
+        walk = np.random.default_rng(int(ticker)).normal(0, 0.02, days)
+        return 10000 * np.exp(np.cumsum(walk))
+
+    print(f"\n{'행 수':>6s} {'시간(ms)':>9s} {'페이지':>6s} {'PDF(KB)':>9s} {'최대 메모리(MB)':>15s}")
+    for n_rows in (10, 100, 1000):
+        screened = [{'rank': i + 1, 'ticker': f"{i:06d}", 'name': f"종목{i}", 'close': 10000 + i, 'change_rate': 0.5,
+                     'rsi': 55.0, 'tech_score': 7} for i in range(n_rows)]
+        appendix_data = dict(data, screened=screened, sparkline_source=synthetic_closes)
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        pdf = build_report(appendix_data)
+        size = len(pdf.output())
+        elapsed = (time.perf_counter() - t0) * 1000
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{n_rows:6d} {elapsed:9.0f} {pdf.page_no():6d} {size / 1024:9.1f} {peak / 1024 / 1024:15.1f}")
@@ -0,0 +1,153 @@
+# 선언형 PDF 레이아웃 - 섹션/표/차트 셀 정의(dict)를 받아 페이지 배치를 계산하고 StockPDF 에 그린다
+#
+# 섹션: {'title': 제목, 'blocks': [블록, ...]}  (섹션마다 새 페이지 + 섹션 헤더)
+# 블록 종류 (type):
+#   - 'charts'  : 차트 가로 배치 {'items': [(차트, x, w), ...], 'height': 60, 'advance': 62}
+#   - 'table'   : 표 {'spec': 표 정의, 'rows': [행, ...]}  -> 페이지 넘김/헤더 반복은 plan_rows 로 미리 계산
+#   - 'text'    : 소제목 + 본문 {'heading': ..., 'body': ..., 'font_size': 10, 'line_height': 6}
+#   - 'articles': 본문 블록 목록 (블록 사이 구분선) {'items': [...], 'font_size': 11, 'line_height': 7}
+#   - 'space'   : 세로 여백 {'height': 10}
+# 컬럼 종류: 텍스트 / 차트 이미지(chart=True) / 스파크라인(sparkline=True, value(row) 가 숫자 배열 - 그리는 시점에 가져와 벡터 선으로 그림)
+# 표 정의: {'columns': [column(...), ...], 'x': 10, 'header_height': 12, 'row_height': 11,
+#           'header_font_size': 9, 'font_size': 8, 'zebra': True}
+
+def column(header, width, value, align="C", chart=False, sparkline=False):
+    """표 컬럼 정의 - value(row) 가 셀 문자열(chart=True 면 차트 이미지, sparkline=True 면 숫자 배열)을 반환"""
+    return {'header': header, 'width': width, 'value': value, 'align': align, 'chart': chart, 'sparkline': sparkline}
+
+def sparkline_points(values, x, y, w, h, max_points=None):
+    """숫자 배열 -> 셀 영역(x, y, w, h)에 맞춘 폴리라인 좌표 (NaN 제외, max_points 개로 간격 추출)"""
+    values = [float(v) for v in values if v == v]
+    if len(values) < 2: return []
+    if max_points and len(values) > max_points:
+        step = (len(values) - 1) / (max_points - 1)
+        values = [values[round(i * step)] for i in range(max_points)]
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    dx = w / (len(values) - 1)
+    return [(x + i * dx, y + h - (v - low) / span * h) for i, v in enumerate(values)]
+
+def plan_rows(n_rows, start_y, row_height, header_height, page_top, page_bottom):
+    """표 행의 페이지 배치를 미리 계산
+
+    반환: [(new_page, [행 인덱스, ...]), ...] - 묶음마다 헤더를 다시 그린다.
+    현재 페이지에 한 행도 들어가지 않으면 헤더만 남기지 않고 표 전체를 다음 페이지에서 시작한다.
+    """
+    chunks, rows = [], []
+    new_page, y = False, start_y + header_height
+    for i in range(n_rows):
+        if y + row_height > page_bottom:
+            if rows: chunks.append((new_page, rows))
+            new_page, y, rows = True, page_top + header_height, []
+        rows.append(i)
+        y += row_height
+    if rows or not chunks: chunks.append((new_page, rows))
+    return chunks
+
+class ReportLayout:
+    """섹션 정의 목록을 StockPDF 에 렌더링 (dry_run=True 면 차트 이미지를 넣지 않고 배치/페이지 수만 계산)"""
+    def __init__(self, pdf, dry_run=False):
+        self.pdf = pdf
+        self.dry_run = dry_run
+        self.font = pdf.d_fonts['main']
+        self.colors = pdf.d_colors
+        self.page_width = pdf.w - 2 * pdf.l_margin
+        self.page_top = getattr(pdf, 'CONTENT_TOP', pdf.t_margin)
+
+    def render(self, sections, mode='afternoon'):
+        """섹션들을 순서대로 그리고 총 페이지 수 반환"""
+        for section in sections:
+            self.pdf.add_page()
+            self.pdf.add_section_header(section['title'], mode=mode)
+            for block in section['blocks']:
+                getattr(self, f"_render_{block['type']}")(block)
+        return self.pdf.page_no()
+
+    def _render_space(self, block):
+        self.pdf.ln(block['height'])
+
+    def _render_charts(self, block):
+        y = self.pdf.get_y()
+        if not self.dry_run:
+            for chart, x, w in block['items']:
+                self.pdf.add_chart(chart, x=x, y=y, w=w, h=block['height'])
+        self.pdf.set_y(y + block.get('advance', block['height']))
+
+    def _render_text(self, block):
+        pdf = self.pdf
+        pdf.ln(block.get('space_before', 3))
+        pdf.set_font(self.font, "B", 11)
+        pdf.set_text_color(*self.colors['primary'])
+        pdf.cell(0, 8, block['heading'], ln=True)
+        pdf.set_text_color(*self.colors['text_main'])
+        pdf.set_font(self.font, "", block.get('font_size', 10))
+        pdf.multi_cell(self.page_width, block.get('line_height', 6), block['body'])
+
+    def _render_articles(self, block):
+        pdf = self.pdf
+        pdf.set_font(self.font, "", block.get('font_size', 11))
+        articles = block['items']
+        for i, article in enumerate(articles):
+            article = article.strip()
+            if not article: continue
+
+            pdf.multi_cell(self.page_width, block.get('line_height', 7), article)
+
+            # 마지막 블록이 아니면 구분선 긋기
+            if i < len(articles) - 1:
+                pdf.ln(4)
+                pdf.set_draw_color(*self.colors['bg_light'])
+                pdf.set_line_width(0.3)
+                pdf.line(pdf.get_x() + 5, pdf.get_y(), pdf.get_x() + self.page_width - 5, pdf.get_y())
+                pdf.set_draw_color(*self.colors['primary'])
+                pdf.ln(6)
+
+    def _render_table(self, block):
+        spec, rows = block['spec'], block['rows']
+        chunks = plan_rows(len(rows), self.pdf.get_y(), spec['row_height'], spec['header_height'],
+                           self.page_top, self.pdf.page_break_trigger)
+        for new_page, indices in chunks:
+            if new_page: self.pdf.add_page()
+            self._table_header(spec)
+            for i in indices:
+                self._table_row(spec, rows[i], i)
+
+    def _table_header(self, spec):
+        pdf = self.pdf
+        pdf.set_font(self.font, "B", spec['header_font_size'])
+        pdf.set_fill_color(*self.colors['table_header'])
+        pdf.set_x(spec.get('x', pdf.l_margin))
+        for col in spec['columns']:
+            pdf.cell(col['width'], spec['header_height'], col['header'], border=1, align="C", fill=True)
+        pdf.ln()
+        pdf.set_font(self.font, "", spec['font_size'])
+
+    def _table_row(self, spec, row, i):
+        pdf = self.pdf
+        fill = spec.get('zebra', False) and i % 2 == 1
+        if spec.get('zebra', False):
+            pdf.set_fill_color(*(self.colors['table_alt'] if fill else (255, 255, 255)))
+        pdf.set_x(spec.get('x', pdf.l_margin))
+        x, y, h = pdf.get_x(), pdf.get_y(), spec['row_height']
+        for col in spec['columns']:
+            if col['chart']:
+                # 차트 셀: 테두리만 그리고 이미지는 셀 안쪽 1mm 여백으로 배치
+                pdf.cell(col['width'], h, "", border=1, fill=fill)
+                if not self.dry_run:
+                    pdf.add_chart(col['value'](row), x=x + 1, y=y + 1, w=col['width'] - 2, h=h - 2)
+            elif col['sparkline']:
+                pdf.cell(col['width'], h, "", border=1, fill=fill)
+                if not self.dry_run:
+                    self._draw_sparkline(col['value'](row), x + 2, y + 1, col['width'] - 4, h - 2)
+            else:
+                pdf.cell(col['width'], h, col['value'](row), border=1, align=col['align'], fill=fill)
+            x += col['width']
+        pdf.ln()
+
+    def _draw_sparkline(self, values, x, y, w, h):
+        """종가 추이를 벡터 선으로 그림 (이미지 없이 페이지 콘텐츠에 바로 기록, 데이터는 그리고 나면 버림)"""
+        points = sparkline_points(values, x, y, w, h, max_points=int(w * 2))
+        if not points: return
+        color = self.colors['up'] if points[-1][1] <= points[0][1] else self.colors['down']
+        with self.pdf.local_context(draw_color=color, line_width=0.25):
+            self.pdf.polyline(points)
@@ -0,0 +1,123 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from utils.profiler import get_profiler
+
+# 의존성 그래프(DAG) 기반 단계 실행기
+# 노드마다 입력(선행 노드)을 선언하면, 입력이 모두 준비된 노드부터 스레드 풀에서 동시에 실행한다.
+# 노드 함수는 선행 노드 결과를 같은 이름의 키워드 인자로 받는다:
+#   pipe = Pipeline("main")
+#   pipe.add('analysis', lambda: analyst.run())
+#   pipe.add('picks', lambda analysis: strategist.run(analysis['picks']), deps=['analysis'])
+#   results = pipe.run()
+# 선행 노드는 먼저 add 되어 있어야 하므로 순환이 생기지 않는다. max_workers=1 이면 등록 순서대로 순차 실행.
+
+_REQUIRED = object()
+
+class Pipeline:
+    def __init__(self, name="pipeline", max_workers=8):
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self.nodes = {}
+        self.timings = {}
+        self.wall_ms = 0.0
+
+    def add(self, name, fn, deps=(), default=_REQUIRED):
+        """노드 등록 - default 를 주면 실패 시 오류를 출력하고 그 값으로 대체 (없으면 파이프라인 전체 실패)"""
+        if name in self.nodes:
+            raise ValueError(f"중복된 노드: {name}")
+        missing = [dep for dep in deps if dep not in self.nodes]
+        if missing:
+            raise ValueError(f"{name}: 등록되지 않은 선행 노드 {', '.join(missing)}")
+        self.nodes[name] = {'fn': fn, 'deps': list(deps), 'default': default}
+        return self
+
+    def _call(self, name, results):
+        node = self.nodes[name]
+        start = time.perf_counter()
+        try:
+            value, error = node['fn'](**{dep: results[dep] for dep in node['deps']}), None
+        except Exception as e:
+            value, error = None, e
+        return value, error, start, time.perf_counter()
+
+    def _finish(self, name, outcome, results):
+        value, error, start, end = outcome
+        node = self.nodes[name]
+        self.timings[name] = {
+            'deps': node['deps'], 'ok': error is None,
+            'start_ms': (start - self._t0) * 1000, 'end_ms': (end - self._t0) * 1000, 'ms': (end - start) * 1000
+        }
+        if error is not None:
+            if node['default'] is _REQUIRED:
+                raise error
+            print(f"[{self.name}] {name} 단계 실패 (기본값으로 계속): {error}")
+            value = node['default']
+        results[name] = value
+
+    def run(self):
+        """전체 그래프 실행 -> {노드 이름: 결과}. 필수 노드가 실패하면 새 노드 시작을 멈추고 실행 중인 노드를 기다린 뒤 예외 전달"""
+        results, self.timings = {}, {}
+        self._t0 = time.perf_counter()
+        get_profiler().add_pipeline(self)
+        try:
+            if self.max_workers == 1:
+                for name in self.nodes:
+                    self._finish(name, self._call(name, results), results)
+                return results
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                running, waiting = {}, list(self.nodes)
+                while waiting or running:
+                    for name in [n for n in waiting if all(dep in results for dep in self.nodes[n]['deps'])]:
+                        waiting.remove(name)
+                        running[pool.submit(self._call, name, results)] = name
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._finish(running.pop(future), future.result(), results)
+            return results
+        finally:
+            self.wall_ms = (time.perf_counter() - self._t0) * 1000
+
+    def critical_path(self):
+        """가장 늦게 끝난 노드에서 거꾸로, 가장 늦게 끝난 선행 노드를 따라간 경로 (전체 소요 시간을 결정하는 단계들)"""
+        if not self.timings: return []
+        name = max(self.timings, key=lambda n: self.timings[n]['end_ms'])
+        path = [name]
+        while True:
+            deps = [d for d in self.timings[name]['deps'] if d in self.timings]
+            if not deps: break
+            name = max(deps, key=lambda d: self.timings[d]['end_ms'])
+            path.append(name)
+        return path[::-1]
+
+    def summary(self):
+        """노드별 소요 시간 (JSON 내보내기용)"""
+        serial_ms = sum(t['ms'] for t in self.timings.values())
+        return {'name': self.name, 'wall_ms': round(self.wall_ms, 1), 'serial_ms': round(serial_ms, 1),
+                'critical_path': self.critical_path(),
+                'nodes': {name: {k: round(v, 1) if isinstance(v, float) else v for k, v in t.items()} for name, t in self.timings.items()}}
+
+    def print_summary(self):
+        summary = self.summary()
+        print(f"[{self.name}] 단계별 소요 시간 (전체 {summary['wall_ms']:.0f} ms / 순차 합계 {summary['serial_ms']:.0f} ms):")
+        for name, t in sorted(summary['nodes'].items(), key=lambda item: item[1]['start_ms']):
+            mark = '*' if name in summary['critical_path'] else ' '
+            print(f"  {mark} {name:16s} {t['start_ms']:8.0f} -> {t['end_ms']:8.0f} ms ({t['ms']:8.1f} ms){'' if t['ok'] else '  실패'}")
+        print(f"  * 임계 경로: {' -> '.join(summary['critical_path'])}")
+
+if __name__ == "__main__":
+    # 순차 실행 대비 동시 실행 벤치마크 (I/O 대기를 sleep 으로 흉내)
+    def stage(seconds, value=None):
+        def fn(**inputs):
+            time.sleep(seconds)
+            return value
+        return fn
+
+    for workers in (1, 8):
+        pipe = Pipeline(f"demo(workers={workers})", max_workers=workers)
+        pipe.add('news', stage(0.10)).add('briefing', stage(0.10)).add('sectors', stage(0.30)).add('etfs', stage(0.40))
+        pipe.add('semi', stage(0.10)).add('candidates', stage(0.10), deps=['semi'])
+        pipe.add('enriched', stage(0.50), deps=['candidates', 'semi'])
+        pipe.add('index_history', stage(0.20)).add('index_charts', stage(0.20), deps=['index_history'])
+        pipe.run()
+        pipe.print_summary()
@@ -0,0 +1,199 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 실행 프로파일 (프로세스 공용, 항상 켜져 있는 가벼운 계측)
+# - 호출 지점별 소요 시간: with timed("pdf.output"): ...  또는  @timed("chart.render") 데코레이터
+# - 호스트별 HTTP 요청 수/전송 바이트(압축 해제 전)/소요 시간 (HttpClient 가 기록)
+# - 캐시 적중률 (hits/misses 속성을 가진 캐시를 register_cache 로 등록)
+# - 단계(파이프라인) 소요 시간, 최대 RSS (Linux 는 reset() 때 커널의 최대 RSS 기록(VmHWM)을 초기화해 실행별 값,
+#   그 외 플랫폼은 프로세스 시작 이후 최대값 - peak_rss_scope 가 'run' / 'process')
+# 프로세스 풀(차트 워커) 안의 호출은 부모 프로세스의 render_batch 시간으로만 잡힌다.
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB) - 측정할 수 없는 플랫폼이면 None"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024 # macOS 는 bytes, Linux 는 KB
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+def reset_peak_rss():
+    """최대 RSS 기록 초기화 (Linux /proc/self/clear_refs) -> 성공 여부"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def run_peak_rss_mb():
+    """마지막 reset_peak_rss() 이후 최대 RSS (MB, /proc/self/status 의 VmHWM) - 읽을 수 없으면 None"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+class Profiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.caches = {}
+        self._cache_base = {}
+        self.reset()
+
+    def reset(self):
+        """새 실행 시작 - 누적 값 초기화 (등록된 캐시는 유지, 적중 수는 등록 시점 대비로 계산)"""
+        with self._lock:
+            self.started_at = datetime.now()
+            self._t0 = time.perf_counter()
+            self.calls = {}
+            self.http = {}
+            self.pipelines = {}
+            self._cache_base = {name: (cache.hits, cache.misses) for name, cache in self.caches.items()}
+            self._run_peak = reset_peak_rss() # 상주 모드에서도 실행마다 새로 측정
+
+    def record(self, name, ms):
+        with self._lock:
+            stat = self.calls.setdefault(name, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stat['calls'] += 1
+            stat['total_ms'] += ms
+            stat['max_ms'] = max(stat['max_ms'], ms)
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record_request(self, host, wire_bytes, ms, ok=True):
+        with self._lock:
+            stat = self.http.setdefault(host, {'requests': 0, 'errors': 0, 'wire_bytes': 0, 'total_ms': 0.0})
+            stat['requests'] += 1
+            stat['wire_bytes'] += wire_bytes
+            stat['total_ms'] += ms
+            if not ok: stat['errors'] += 1
+
+    def register_cache(self, name, cache):
+        """hits/misses 카운터를 가진 캐시 등록 (같은 이름은 마지막 등록이 대체)"""
+        with self._lock:
+            self.caches[name] = cache
+            self._cache_base[name] = (cache.hits, cache.misses)
+
+    def add_pipeline(self, pipeline):
+        """단계 그래프 등록 (같은 이름은 마지막 실행으로 대체)"""
+        with self._lock:
+            self.pipelines[pipeline.name] = pipeline
+
+    def snapshot(self):
+        """현재까지의 프로파일 (JSON 직렬화 가능한 dict)"""
+        with self._lock:
+            caches = {}
+            for name, cache in self.caches.items():
+                base_hits, base_misses = self._cache_base.get(name, (0, 0))
+                hits, misses = cache.hits - base_hits, cache.misses - base_misses
+                caches[name] = {'hits': hits, 'misses': misses, 'hit_rate': round(hits / (hits + misses), 3) if hits + misses else None}
+            rss = run_peak_rss_mb() if self._run_peak else None
+            scope = 'run' if rss is not None else 'process'
+            if rss is None: rss = peak_rss_mb()
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'wall_ms': round((time.perf_counter() - self._t0) * 1000, 1),
+                'peak_rss_mb': round(rss, 1) if rss is not None else None,
+                'peak_rss_scope': scope,
+                'stages': {name: p.summary() for name, p in self.pipelines.items()},
+                'calls': {name: {k: round(v, 1) if isinstance(v, float) else v for k, v in s.items()} for name, s in sorted(self.calls.items())},
+                'http': {host: {k: round(v, 1) if isinstance(v, float) else v for k, v in s.items()} for host, s in sorted(self.http.items())},
+                'caches': caches
+            }
+
+    def write(self, path):
+        """프로파일을 JSON 파일로 저장하고 요약 출력"""
+        profile = self.snapshot()
+        if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, ensure_ascii=False, indent=2)
+        rss = f"{profile['peak_rss_mb']:.0f} MB" if profile['peak_rss_mb'] is not None else "N/A"
+        label = "최대 RSS" if profile['peak_rss_scope'] == 'run' else "프로세스 최대 RSS"
+        print(f"실행 프로파일 저장: {path} (전체 {profile['wall_ms'] / 1000:.1f} s, {label} {rss})")
+        for host, s in profile['http'].items():
+            print(f"  HTTP {host:28s} {s['requests']:5d}회 {s['wire_bytes'] / 1024:10.1f} KB(전송) {s['total_ms']:10.0f} ms")
+        for name, s in profile['caches'].items():
+            rate = f"{s['hit_rate'] * 100:.0f}%" if s['hit_rate'] is not None else "-"
+            print(f"  캐시 {name:28s} 적중 {s['hits']:5d} / 실패 {s['misses']:5d} ({rate})")
+        return profile
+
+_profiler = Profiler()
+
+def get_profiler():
+    """프로세스 공용 Profiler"""
+    return _profiler
+
+def timed(name):
+    """공용 프로파일러에 호출 지점 소요 시간 기록 (with 문 / 데코레이터 겸용)"""
+    return _profiler.timed(name)
+
+@contextmanager
+def cprofile_to(path, top=25):
+    """블록 실행 동안 cProfile 수집 후 path 에 pstats 덤프 (snakeviz / python -m pstats 로 확인)
+
+    cProfile 은 켠 스레드만 기록하므로, 블록 안에서 새로 시작되는 스레드(파이프라인/스레드 풀 워커)마다
+    별도 Profile 을 켜 두었다가 덤프할 때 합친다. (Python 3.12+ 처럼 한 Profile 이 모든 스레드를 기록하는 경우는 건너뜀)
+    """
+    import cProfile
+    import pstats
+    profiles, lock = [], threading.Lock()
+
+    def start_thread_profile(frame, event, arg):
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return
+        with lock:
+            profiles.append(profile)
+
+    main_profile = cProfile.Profile()
+    main_profile.enable()
+    threading.setprofile(start_thread_profile)
+    try:
+        yield
+    finally:
+        threading.setprofile(None)
+        main_profile.disable()
+        stats = pstats.Stats(main_profile)
+        with lock:
+            for profile in profiles:
+                stats.add(profile)
+        if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok=True)
+        stats.dump_stats(path)
+        print(f"cProfile 저장: {path} (스레드 {len(profiles) + 1}개) - 누적 시간 상위 {top}개:")
+        stats.sort_stats('cumulative').print_stats(top)
+
+if __name__ == "__main__":
+    # 계측 오버헤드 측정: python -m utils.profiler
+    n = 200000
+    start = time.perf_counter()
+    for _ in range(n):
+        with timed("bench.noop"):
+            pass
+    per_call_us = (time.perf_counter() - start) / n * 1e6
+    print(f"timed() 오버헤드: {per_call_us:.2f} us/호출 ({n:,}회)")
+    print(json.dumps(_profiler.snapshot()['calls'], ensure_ascii=False))
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 기록/재생(record/replay) 픽스처 번들 - 실제 실행의 외부 응답을 저장해 두었다가 오프라인으로 그대로 재생
+#
+# 번들 폴더 구성:
+#   manifest.json : {'recorded_at', 'http': {요청 키: 응답 정보}, 'frames': {종류:키: 파일명}}
+#   http/<sha1>.bin : HTTP 응답 본문 (압축 해제된 상태)
+#   frames/<sha1>.pkl : FinanceDataReader DataFrame (DataReader 는 종목별로 받은 구간을 합쳐 저장)
+#
+# - HTTP: HttpClient 의 transport 교체 (RecordingTransport / ReplayTransport) - 네이버/텔레그램 요청 모두 대상
+# - DataReader/StockListing: DataAnalyst 의 가격/상장목록 소스를 번들 경유 함수로 교체
+# - 재생 시 datetime.now() 를 기록 시각으로 고정하여 조회 구간/보고서 날짜까지 기록 당시와 같게 만든다
+# 텔레그램 봇 토큰은 요청 키/URL 에서 지워서 저장한다.
+
+FROZEN_CLOCK_MODULES = ("agents.data_analyst", "agents.editor", "utils.pdf_converter")
+_SECRET_PATTERNS = [(re.compile(r'/bot[^/]+/'), '/bot<token>/')]
+_KEEP_HEADERS = ('Content-Type',)
+
+def _scrub(url):
+    for pattern, replacement in _SECRET_PATTERNS:
+        url = pattern.sub(replacement, url)
+    return url
+
+def _digest(key):
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def request_key(method, url):
+    return f"{method.upper()} {_scrub(url)}"
+
+class FixtureMissing(requests.ConnectionError):
+    """재생 번들에 없는 요청 (오프라인 실행에서는 연결 실패와 같게 취급)"""
+
+class FixtureBundle:
+    """mode='record': 실제 응답을 받아 저장 (save() 로 기록) / mode='replay': 저장된 응답만으로 응답"""
+    def __init__(self, path, mode='replay'):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"지원하지 않는 번들 모드: {mode}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._frames = {}
+        self._clock_patches = [] # freeze_clock 으로 바꾼 (모듈, 원래 datetime)
+        # 기록/재생 모두 로컬 OHLCV 캐시를 쓰지 않도록 임시 저장소 사용 (기록 시 전체 구간을 받아야 재생이 같아짐)
+        self.store_dir = tempfile.mkdtemp(prefix="ohlcv_fixture_")
+        if mode == 'replay':
+            with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {'recorded_at': datetime.now().isoformat(timespec='seconds'), 'http': {}, 'frames': {}}
+            for sub in ("http", "frames"):
+                os.makedirs(os.path.join(path, sub), exist_ok=True)
+
+    @property
+    def recorded_at(self):
+        return datetime.fromisoformat(self.manifest['recorded_at'])
+
+    # --- HTTP ---
+    def transport(self, max_retries=0):
+        return RecordingTransport(self, max_retries=max_retries) if self.mode == 'record' else ReplayTransport(self)
+
+    def http_client(self, **kwargs):
+        """번들 transport 를 쓰는 HttpClient (utils.http_client.set_client 로 공용 클라이언트 교체)"""
+        from utils.http_client import HttpClient
+        client = HttpClient(**kwargs)
+        client.mount(self.transport(max_retries=client.retry if self.mode == 'record' else 0))
+        return client
+
+    def record_response(self, request, response):
+        key = request_key(request.method, request.url)
+        name = _digest(key) + ".bin"
+        with open(os.path.join(self.path, "http", name), "wb") as f:
+            f.write(response.content)
+        with self._lock:
+            self.manifest['http'][key] = {
+                'file': name, 'status': response.status_code, 'reason': response.reason,
+                'headers': {h: response.headers[h] for h in _KEEP_HEADERS if h in response.headers}
+            }
+
+    def replay_response(self, request):
+        key = request_key(request.method, request.url)
+        entry = self.manifest['http'].get(key)
+        if entry is None:
+            raise FixtureMissing(f"재생 번들에 없는 요청: {key}", request=request)
+        with open(os.path.join(self.path, "http", entry['file']), "rb") as f:
+            body = f.read()
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    # --- DataFrame (FinanceDataReader) ---
+    def data_reader(self, fetch):
+        """fetch(symbol, start, end) 를 감싼 가격 이력 소스 - 기록: 받은 구간을 종목별로 합쳐 저장 / 재생: 저장본에서 구간 슬라이스"""
+        def read(symbol, start=None, end=None):
+            key = f"DataReader:{symbol}"
+            if self.mode == 'record':
+                df = fetch(symbol, start, end)
+                with self._lock:
+                    prev = self._frames.get(key)
+                    self._frames[key] = df if prev is None else df.combine_first(prev)
+                return df
+            df = self._load_frame(key)
+            if start is not None: df = df[df.index >= pd.Timestamp(start)]
+            if end is not None: df = df[df.index <= pd.Timestamp(end)]
+            return df.copy()
+        return read
+
+    def stock_listing(self, fetch):
+        """fetch(market) 를 감싼 상장 목록 소스"""
+        def listing(market):
+            key = f"StockListing:{market}"
+            if self.mode == 'record':
+                df = fetch(market)
+                with self._lock:
+                    self._frames[key] = df
+                return df
+            return self._load_frame(key).copy()
+        return listing
+
+    def _load_frame(self, key):
+        with self._lock:
+            if key not in self._frames:
+                name = self.manifest['frames'].get(key)
+                if name is None:
+                    raise FixtureMissing(f"재생 번들에 없는 데이터: {key}")
+                self._frames[key] = pd.read_pickle(os.path.join(self.path, "frames", name))
+            return self._frames[key]
+
+    # --- 기록 저장 / 시계 고정 ---
+    def save(self):
+        """기록한 DataFrame 과 manifest 저장 (record 모드)"""
+        if self.mode != 'record': return
+        with self._lock:
+            for key, df in self._frames.items():
+                name = _digest(key) + ".pkl"
+                df.to_pickle(os.path.join(self.path, "frames", name))
+                self.manifest['frames'][key] = name
+            with open(os.path.join(self.path, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, ensure_ascii=False, indent=1)
+        print(f"픽스처 번들 저장: {self.path} (HTTP {len(self.manifest['http'])}건, 데이터 {len(self.manifest['frames'])}건)")
+
+    def freeze_clock(self, modules=FROZEN_CLOCK_MODULES):
+        """재생 시 지정 모듈의 datetime.now() 를 기록 시각으로 고정 (restore_clock / close 에서 원래대로)"""
+        import importlib
+        frozen = frozen_datetime(self.recorded_at)
+        for name in modules:
+            module = importlib.import_module(name)
+            if getattr(module, 'datetime', None) is datetime:
+                self._clock_patches.append((module, module.datetime))
+                module.datetime = frozen
+
+    def restore_clock(self):
+        while self._clock_patches:
+            module, original = self._clock_patches.pop()
+            module.datetime = original
+
+    def close(self):
+        self.restore_clock()
+        shutil.rmtree(self.store_dir, ignore_errors=True)
+
+def frozen_datetime(moment):
+    """now() 가 항상 moment 를 반환하는 datetime 하위 클래스"""
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment if tz is None else moment.astimezone(tz)
+    return FrozenDatetime
+
+class RecordingTransport(HTTPAdapter):
+    """실제로 요청을 보내고 응답을 번들에 기록하는 transport"""
+    def __init__(self, bundle, **kwargs):
+        super().__init__(**kwargs)
+        self.bundle = bundle
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        self.bundle.record_response(request, response)
+        return response
+
+class ReplayTransport(HTTPAdapter):
+    """네트워크 없이 번들에 기록된 응답만 반환하는 transport (없는 요청은 FixtureMissing)"""
+    def __init__(self, bundle, **kwargs):
+        super().__init__(**kwargs)
+        self.bundle = bundle
+
+    def send(self, request, **kwargs):
+        return self.bundle.replay_response(request)
@@ -0,0 +1,90 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.report_render import to_markdown, to_telegram
+from utils.profiler import get_profiler
+
+# 한 번의 분석 결과(data)로 여러 형식의 보고서를 병렬 생성
+# data: convert_to_pdf_fpdf 와 동일 (report 문서 모델 + picks / market_briefing / etf_trends / charts ...)
+OUTPUT_FORMATS = ('pdf', 'md', 'html', 'telegram', 'json')
+OUTPUT_EXTENSIONS = {'pdf': '.pdf', 'md': '.md', 'html': '.html', 'telegram': '.telegram.txt', 'json': '.json'}
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>body{{font-family:sans-serif;max-width:960px;margin:auto;padding:0 12px;line-height:1.5}}table{{border-collapse:collapse}}td,th{{border:1px solid #ccc;padding:2px 6px}}</style>
+</head><body>
+{body}
+</body></html>
+"""
+
+def _write_text(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+def _write_pdf(data, path):
+    from utils.pdf_converter import convert_to_pdf_fpdf
+    return convert_to_pdf_fpdf(data, path)
+
+def _write_md(data, path):
+    return _write_text(path, to_markdown(data['report']))
+
+def _write_html(data, path):
+    import markdown
+    report = data['report']
+    body = markdown.markdown(to_markdown(report), extensions=['tables'])
+    return _write_text(path, HTML_TEMPLATE.format(title=f"Daily Stock Research Report {report['date']}", body=body))
+
+def _write_telegram(data, path):
+    return _write_text(path, to_telegram(data['report']))
+
+def _json_default(value):
+    # numpy 스칼라 등은 파이썬 값으로, 나머지는 문자열로
+    if hasattr(value, 'item'): return value.item()
+    return str(value)
+
+def _write_json(data, path):
+    # 차트 이미지(bytes)와 데이터 소스 함수는 제외한 분석 데이터 + 문서 모델
+    dump = {k: v for k, v in data.items() if k not in ('charts', 'chart_paths') and not callable(v)}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dump, f, ensure_ascii=False, default=_json_default)
+    return True
+
+WRITERS = {'pdf': _write_pdf, 'md': _write_md, 'html': _write_html, 'telegram': _write_telegram, 'json': _write_json}
+
+def _run_writer(fmt, data, path):
+    t0 = time.perf_counter()
+    try:
+        ok = bool(WRITERS[fmt](data, path))
+    except Exception as e:
+        print(f"{fmt} 출력 실패: {e}")
+        ok = False
+    ms = (time.perf_counter() - t0) * 1000
+    get_profiler().record(f"output.{fmt}", ms)
+    return {'path': path, 'ok': ok, 'ms': ms,
+            'bytes': os.path.getsize(path) if ok and os.path.exists(path) else 0}
+
+def write_outputs(data, base_path, formats=('pdf', 'md'), paths=None, max_workers=None):
+    """활성화된 형식을 병렬로 생성 -> {형식: {'path', 'ok', 'ms', 'bytes'}}
+
+    base_path 에 형식별 확장자를 붙여 저장 (paths={'md': 'sample_report.md'} 처럼 개별 경로 지정 가능)
+    """
+    unknown = [fmt for fmt in formats if fmt not in WRITERS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 출력 형식: {', '.join(unknown)} (가능: {', '.join(OUTPUT_FORMATS)})")
+    paths = {fmt: (paths or {}).get(fmt) or base_path + OUTPUT_EXTENSIONS[fmt] for fmt in formats}
+    for path in paths.values():
+        if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers or len(formats) or 1) as pool:
+        futures = {fmt: pool.submit(_run_writer, fmt, data, paths[fmt]) for fmt in formats}
+        results = {fmt: future.result() for fmt, future in futures.items()}
+    total_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"보고서 출력 완료 ({total_ms:.0f} ms):")
+    for fmt, r in results.items():
+        print(f"  {fmt:9s} {'OK ' if r['ok'] else '실패'} {r['ms']:8.1f} ms {r['bytes'] / 1024:9.1f} KB  {r['path']}")
+    return results
@@ -0,0 +1,64 @@
+import re
+
+# 보고서 문서 모델(ResearchEditor.build) 렌더러 - 마크다운 / 텔레그램 텍스트
+# PDF 렌더러는 utils.pdf_converter (같은 모델을 직접 사용)
+
+def _md_cell(value):
+    return str(value).replace("|", "\\|")
+
+def _md_table(table):
+    lines = [
+        "| " + " | ".join(_md_cell(h) for h in table['headers']) + " |",
+        "|" + "|".join(" --- " for _ in table['headers']) + "|"
+    ]
+    lines += ["| " + " | ".join(_md_cell(c) for c in row) + " |" for row in table['rows']]
+    return lines
+
+def stock_text(stock):
+    """종목 블록 본문 (마크다운/PDF 공용)"""
+    return f"{stock['rank']}) {stock['name']} ({stock['ticker']})\n  - 기업분석 : {stock['company']}\n  - 핵심사유: {stock['rationale']}"
+
+def to_markdown(report):
+    """문서 모델 -> 마크다운 (sample_report.md)"""
+    lines = []
+    for section in report['sections']:
+        lines.append(f"## {section['number']}. {section['title']}")
+        for paragraph in section['paragraphs']:
+            lines.append(paragraph + "\n")
+        if section['table'] and section['table']['rows']:
+            lines += _md_table(section['table']) + [""]
+        if section['bullets']:
+            lines += [f"- {item}" for item in section['bullets']] + [""]
+        for stock in section['stocks']:
+            lines += [" " + stock_text(stock), ""]
+    lines.append(f"---\n**Disclaimer**: {report['disclaimer']}")
+    return "\n".join(lines)
+
+def _tg_escape(text):
+    """텔레그램 Markdown(legacy) 특수문자 이스케이프"""
+    return re.sub(r'([_*`\[])', r'\\\1', str(text))
+
+def to_telegram(report, narrative=True):
+    """문서 모델 -> 텔레그램 메시지 (parse_mode='Markdown', Dispatcher.send_telegram_message 로 발송)
+
+    narrative=False 면 서술형 문단 없이 지수/뉴스/추천 종목만 담은 요약본
+    """
+    prefix = "오전" if report['mode'] == 'morning' else "오후"
+    lines = [f"*📑 [{prefix}] {report['date']} 데일리 리포트*", ""]
+    for section in report['sections']:
+        body = []
+        if narrative or section['key'] == 'market':
+            body += [_tg_escape(p) for p in section['paragraphs']]
+        table = section['table']
+        if table and table['rows'] and not section['stocks']:
+            body += [f"• {_tg_escape(row[0])}: {_tg_escape(' / '.join(map(str, row[1:])))}" for row in table['rows']]
+        body += [f"• {_tg_escape(item)}" for item in section['bullets']]
+        for stock in section['stocks']:
+            quote = f" {stock['close']:,}원 ({stock['change_rate']:+.1f}%)" if stock.get('close') is not None and stock.get('change_rate') is not None else ""
+            body.append(f"{stock['rank']}) *{_tg_escape(stock['name'])}* ({stock['ticker']}){quote}")
+            if narrative:
+                body.append(f"   {_tg_escape(stock['rationale'])}")
+        if body:
+            lines += [f"*{section['number']}. {_tg_escape(section['title'])}*"] + body + [""]
+    lines.append(f"_{_tg_escape(report['disclaimer'])}_")
+    return "\n".join(lines)
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import random
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from utils import naver_samples
+
+# 합성 픽스처 번들 (실제 응답/토큰 없이 main.py --replay 로 전체 보고서 흐름을 재생하기 위한 번들, CI 벤치마크용)
+# 실제 기록(--record)과 같은 FixtureBundle 기록 경로를 쓰되, 응답은 네트워크 대신 합성 소스에서 만든다.
+#   - 네이버 금융 페이지: utils.naver_samples (URL 별 고정 시드)
+#   - 네이버 모바일 통합 API: 수급(dealTrendInfos)/ETF 구성(etfCuInfos) JSON
+#   - 텔레그램: {"ok": true}
+#   - FinanceDataReader: 종목 코드별 시드의 합성 일봉 / KRX·ETF 상장 목록
+# 오전/오후 보고서를 한 번씩 실행해 두 모드 모두 재생할 수 있게 기록한다.
+#   python -m utils.synthetic_bundle <번들 폴더>
+#   python benchmark.py <번들 폴더> ...   (재생 시 TELEGRAM_BOT_TOKEN/TELEGRAM_CHAT_ID 가 있으면 발송 단계도 재생)
+
+HISTORY_DAYS = 800 # 종목별 합성 일봉 길이 (거래일, 가장 긴 조회 구간 1년보다 길게)
+
+def _seed(key):
+    return int(hashlib.sha1(key.encode("utf-8")).hexdigest()[:8], 16)
+
+class SyntheticSource:
+    """URL/종목 코드마다 항상 같은 내용을 돌려주는 합성 응답 소스"""
+    def __init__(self, today=None):
+        self.today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+
+    # --- HTTP ---
+    def respond(self, request):
+        url = request.url
+        if "api.telegram.org" in url:
+            return self._response(request, 200, json.dumps({'ok': True, 'result': {}}).encode(), "application/json")
+        if "m.stock.naver.com/api/stock/" in url:
+            return self._response(request, 200, json.dumps(self.integration(url), ensure_ascii=False).encode("utf-8"), "application/json;charset=UTF-8")
+        page = self._naver_page(url)
+        if page is None:
+            return self._response(request, 404, b"not found", "text/plain")
+        html = naver_samples.PAGES[page](random.Random(_seed(url)))
+        return self._response(request, 200, html.encode("cp949"), "text/html;charset=EUC-KR")
+
+    @staticmethod
+    def _naver_page(url):
+        if "finance.naver.com" not in url: return None
+        for fragment, page in (("/sise/sise_group_detail.naver", 'sector_detail'), ("/sise/sise_group.naver", 'sector_list'),
+                               ("/sise/sise_quant.naver", 'volume_rank'), ("/news/mainnews.naver", 'main_news'),
+                               ("/item/news_news.naver", 'item_news'), ("/item/main.naver", 'item_main')):
+            if fragment in url: return page
+        return 'market_index' if url.rstrip("/").endswith("/sise") else None
+
+    @staticmethod
+    def integration(url):
+        rng = random.Random(_seed(url))
+        return {
+            'dealTrendInfos': [{'foreignerPureBuyQuant': f"{rng.randint(-20000, 90000):,}", 'organPureBuyQuant': f"{rng.randint(-20000, 90000):,}",
+                                'individualPureBuyQuant': f"{rng.randint(-90000, 20000):,}"} for _ in range(10)],
+            'etfCuInfos': [{'stockName': name} for name in rng.sample(naver_samples.STOCKS, 8)]
+        }
+
+    @staticmethod
+    def _response(request, status, body, content_type):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status == 200 else "Not Found"
+        response.headers = CaseInsensitiveDict({'Content-Type': content_type})
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+    # --- FinanceDataReader ---
+    def data_reader(self, symbol, start=None, end=None):
+        """fdr.DataReader 와 같은 형태의 합성 일봉 (Open/High/Low/Close/Volume/Change)"""
+        rng = np.random.default_rng(_seed(symbol))
+        index = pd.bdate_range(end=self.today, periods=HISTORY_DAYS, name='Date')
+        close = np.round(10000 * np.exp(np.cumsum(rng.normal(0.0008, 0.018, HISTORY_DAYS))), -1)
+        close[-1] = close[-2] * 1.03 # 마지막 봉은 상승 마감 (후보 필터의 등락률 조건 통과)
+        open_ = close * (1 + rng.normal(0, 0.006, HISTORY_DAYS))
+        volume = rng.integers(50_000, 3_000_000, HISTORY_DAYS)
+        volume[-1] *= 3
+        df = pd.DataFrame({
+            'Open': np.round(open_, -1), 'High': np.round(np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, HISTORY_DAYS)), -1),
+            'Low': np.round(np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, HISTORY_DAYS)), -1), 'Close': close, 'Volume': volume
+        }, index=index)
+        df['Change'] = df['Close'].pct_change()
+        if start is not None: df = df[df.index >= pd.Timestamp(start)]
+        if end is not None: df = df[df.index <= pd.Timestamp(end)]
+        return df
+
+    def stock_listing(self, market):
+        """fdr.StockListing 과 같은 열 이름의 합성 상장 목록 (KRX: Code/Name/Market, ETF/KR: Symbol/Name/ChgRate)"""
+        rng = random.Random(_seed(market))
+        if market.startswith("ETF"):
+            return pd.DataFrame([{'Symbol': f"{rng.randint(100000, 499999):06d}", 'Name': f"합성 {sector} ETF", 'ChgRate': round(rng.uniform(-3, 3), 2)}
+                                 for sector in naver_samples.SECTORS])
+        markets = ['KOSPI', 'KOSDAQ', 'KOSDAQ GLOBAL', 'KONEX']
+        return pd.DataFrame([{'Code': f"{rng.randint(0, 999999):06d}", 'Name': f"{rng.choice(naver_samples.STOCKS)}{i}", 'Market': rng.choice(markets)}
+                             for i in range(300)])
+
+class SyntheticTransport(HTTPAdapter):
+    """합성 소스의 응답을 번들에 기록하며 반환하는 transport (RecordingTransport 의 네트워크 대신)"""
+    def __init__(self, bundle, source, **kwargs):
+        super().__init__(**kwargs)
+        self.bundle = bundle
+        self.source = source
+
+    def send(self, request, **kwargs):
+        response = self.source.respond(request)
+        self.bundle.record_response(request, response)
+        return response
+
+def generate(path, modes=('morning', 'afternoon')):
+    """path 에 합성 번들 기록 (기존 내용은 덮어씀) -> FixtureBundle manifest"""
+    import main
+    from agents import data_analyst
+    from utils.http_client import HttpClient, get_client, set_client
+    from utils.replay import FixtureBundle
+
+    shutil.rmtree(path, ignore_errors=True)
+    bundle = FixtureBundle(path, mode='record')
+    source = SyntheticSource(today=bundle.recorded_at)
+    client = HttpClient(retries=0)
+    client.mount(SyntheticTransport(bundle, source))
+    out_dir = tempfile.mkdtemp(prefix="synthetic_run_")
+    # 차트/일봉 캐시도 실행 전용 임시 폴더로 (작업 폴더의 .cache 를 읽거나 남기지 않음)
+    env = {'TELEGRAM_BOT_TOKEN': "synthetic", 'TELEGRAM_CHAT_ID': "0",
+           'CHART_CACHE_DIR': os.path.join(out_dir, "charts"), 'OHLCV_CACHE_DIR': os.path.join(out_dir, "ohlcv")}
+    saved = (get_client(), data_analyst._fdr_data_reader, data_analyst._fdr_stock_listing, {k: os.environ.get(k) for k in env})
+    set_client(client)
+    data_analyst._fdr_data_reader, data_analyst._fdr_stock_listing = source.data_reader, source.stock_listing
+    os.environ.update(env)
+    try:
+        for mode in modes:
+            args = main.build_parser().parse_args(['--mode', mode, '--formats', 'md,telegram', '--output-dir', out_dir])
+            main.run_report(args, os.path.join(out_dir, f"Stock_Report_{mode}"), fixtures=bundle)
+        # PDF 발송은 재생 환경의 폰트 유무에 따라 달라지므로 응답을 미리 넣어 둔다
+        for method in ("sendDocument", "sendMessage"):
+            request = requests.Request("POST", f"https://api.telegram.org/botsynthetic/{method}").prepare()
+            bundle.record_response(request, source.respond(request))
+        bundle.save()
+    finally:
+        set_client(saved[0])
+        data_analyst._fdr_data_reader, data_analyst._fdr_stock_listing = saved[1], saved[2]
+        for key, value in saved[3].items():
+            if value is None: os.environ.pop(key, None)
+            else: os.environ[key] = value
+        bundle.close()
+        shutil.rmtree(out_dir, ignore_errors=True)
+    return bundle.manifest
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) < 2:
+        print("사용법: python -m utils.synthetic_bundle <번들 폴더>")
+        sys.exit(2)
+    generate(sys.argv[1])